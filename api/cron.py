@@ -0,0 +1,71 @@
+"""Scheduled pipeline run (see ``crons`` in vercel.json).
+
+Runs the pipeline through the jobs endpoint's result cache, which writes
+the versioned, pre-serialized snapshot that ``/api/jobs`` serves as a static
+read (backend/snapshot_store.py). Users then never wait on the job boards,
+as long as the API runs where the snapshot was written (it is on local
+disk; see the README).
+
+When ``CRON_SECRET`` is set, requests must send it as a bearer token (Vercel
+cron does this automatically).
+"""
+import hmac
+import sys
+import os
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from api.jobs import result_cache
+from backend.api_response import encode_body, send_encoded
+from backend.runtime import run_sync
+from backend.snapshot_store import SnapshotStore
+
+
+def authorized(authorization: str) -> bool:
+    secret = os.environ.get("CRON_SECRET")
+    return not secret or hmac.compare_digest(authorization, f"Bearer {secret}")
+
+
+class handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        """Handle GET request - refresh the snapshot and report what was written.
+
+        ?full=1 reprocesses every posting, not just changes.
+        """
+        if not authorized(self.headers.get("Authorization", "")):
+            send_encoded(self, encode_body({"success": False, "error": "Unauthorized"}), 401)
+            return
+
+        try:
+            query = parse_qs(urlparse(self.path).query)
+            full = query.get("full", ["0"])[0] == "1"
+
+            started = time.perf_counter()
+            snapshot = run_sync(result_cache.refresh(incremental=not full))
+            value = snapshot["value"]
+            report = {
+                "success": True,
+                "created_at": snapshot["created_at"],
+                "duration_ms": round((time.perf_counter() - started) * 1000),
+                "total_filtered": value.get("total_filtered", 0),
+                "errors": len(value.get("errors", [])),
+                "partial_sources": value.get("partial_sources", []),
+            }
+
+            store = result_cache.backend
+            if isinstance(store, SnapshotStore):
+                manifest = store.manifest()
+                if manifest is not None and manifest["created_at"] == snapshot["created_at"]:
+                    report["version"] = manifest["version"]
+                    report["sizes"] = manifest["sizes"]
+                else:
+                    report["snapshot_error"] = result_cache.last_error or "Snapshot not stored"
+            send_encoded(self, encode_body(report))
+
+        except Exception as e:
+            send_encoded(self, encode_body({"success": False, "error": str(e)}), 500)
@@ -1,59 +1,190 @@
-"""API endpoint to fetch jobs - runs LangGraph pipeline."""
-import json
+"""API endpoint to fetch jobs - runs LangGraph pipeline.
+
+Query parameters (all optional):
+    fields        comma-separated job fields to return (default: all but description)
+    limit, cursor page size (max 500) and the ``next_cursor`` of the previous page
+    refresh, full see ``handler.do_GET``
+
+Responses are gzip/brotli-compressed when accepted and carry a strong ETag;
+revalidating an unchanged snapshot with ``If-None-Match`` returns 304.
+
+Without parameters the response is a static read: the pre-serialized,
+pre-compressed snapshot written by the last pipeline run (api/cron.py or a
+refresh) is sent as-is, so latency doesn't depend on the job boards.
+"""
 import sys
 import os
+import time
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from http.server import BaseHTTPRequestHandler
-import asyncio
+from urllib.parse import urlparse, parse_qs
+
+from backend.api_response import (
+    EncodedBody,
+    decode_cursor,
+    encode_body,
+    encode_cursor,
+    negotiate_encoding,
+    parse_fields,
+    parse_limit,
+    project,
+    send_encoded,
+)
+from backend.nodes.calculate_distance import listing_order
+from backend.pipeline_log import messages, timings_summary
+from backend.records import job_payload
+from backend.result_cache import ResultCache
+from backend.runtime import run_sync
+from backend.snapshot_store import SnapshotStore
+
+
+async def compute_response(incremental: bool = True) -> dict:
+    """Run the pipeline and build the JSON response body."""
+    from backend.graph import run_job_search
+
+    result = await run_job_search(incremental=incremental)
+
+    return {
+        "success": True,
+        "jobs": [job_payload(job) for job in result.get("filtered_jobs", [])],
+        "total_found": result.get("total_jobs_found", 0),
+        "total_filtered": result.get("total_jobs_filtered", 0),
+        "progress": messages(result.get("logs", []), include_boards=False),
+        "errors": messages(result.get("errors", [])),
+        "partial_sources": result.get("partial_sources", []),
+        "timings": timings_summary(result.get("timings", [])),
+        "diff": result.get("job_diff") or None,
+        "fetch_started_at": result.get("fetch_started_at"),
+        "fetch_completed_at": result.get("fetch_completed_at"),
+        "next_cursor": None,
+    }
+
+
+# Serves the last snapshot immediately and refreshes it in the background
+# once stale; concurrent requests share a single pipeline run.
+result_cache = ResultCache(compute_response)
+
+MAX_PAGE_SIZE = 500
+MAX_ENCODED_BODIES = 32
+PAGE_PARAMETERS = ("fields", "limit", "cursor")
+
+# Encoded bodies of recent (snapshot, query, coding) combinations, so polling
+# clients and 304 checks don't re-serialize and re-compress the snapshot
+_encoded_bodies: Dict[tuple, EncodedBody] = {}
+
+
+def page_jobs(jobs: List[dict], cursor: Optional[str], limit: Optional[int]) -> Tuple[List[dict], Optional[str]]:
+    """One page of the (listing-ordered) jobs and the cursor of the next page.
+
+    The cursor is the listing position of the page's last job rather than an
+    offset, so it stays valid when a refreshed snapshot adds or drops jobs.
+    """
+    start = 0
+    if cursor:
+        position = decode_cursor(cursor)
+        if len(position) != 3 or not isinstance(position[0], int) or \
+                not isinstance(position[1], (int, float)) or not isinstance(position[2], str):
+            raise ValueError("malformed cursor")
+        start = bisect_right(jobs, tuple(position), key=listing_order)
+    if limit is None:
+        return jobs[start:], None
+    page = jobs[start:start + limit]
+    more = start + limit < len(jobs)
+    return page, encode_cursor(listing_order(page[-1])) if more and page else None
+
+
+def encoded_response(cached: dict, query: dict, accept_encoding: Optional[str]) -> EncodedBody:
+    """Encoded body for a snapshot and the query's fields/limit/cursor."""
+    fields = parse_fields(query.get("fields", []))
+    limit = parse_limit(query.get("limit", [None])[0], MAX_PAGE_SIZE)
+    cursor = query.get("cursor", [None])[0]
+
+    key = (cached.get("fetch_completed_at"), tuple(fields or ()), limit, cursor, negotiate_encoding(accept_encoding))
+    encoded = _encoded_bodies.get(key)
+    if encoded is None:
+        jobs, next_cursor = page_jobs(cached["jobs"], cursor, limit)
+        response = {**cached, "jobs": project(jobs, fields), "next_cursor": next_cursor}
+        encoded = encode_body(response, accept_encoding)
+        if len(_encoded_bodies) >= MAX_ENCODED_BODIES:
+            _encoded_bodies.clear()
+        _encoded_bodies[key] = encoded
+    return encoded
+
+
+def static_response(accept_encoding: Optional[str]) -> Optional[Tuple[EncodedBody, list]]:
+    """The stored snapshot's pre-encoded body and cache headers, if it is current.
+
+    A stale snapshot is still served, with a background refresh started.
+    Returns None when there is no stored snapshot (or this process holds a
+    newer one that couldn't be stored), for the caller to use ``result_cache``.
+    """
+    store = result_cache.backend
+    if not isinstance(store, SnapshotStore):
+        return None
+    stored = store.encoded(accept_encoding)
+    if stored is None:
+        return None
+    manifest, encoded = stored
+    if result_cache.created_at is not None and result_cache.created_at > manifest["created_at"]:
+        return None
+
+    age = max(0.0, time.time() - manifest["created_at"])
+    headers = [("X-Cache", "HIT"), ("Age", str(int(age))), ("X-Snapshot-Version", manifest["version"])]
+    if age > result_cache.ttl:
+        run_sync(result_cache.revalidate(incremental=True))
+        headers[0] = ("X-Cache", "STALE")
+        headers.append(("X-Cache-Refreshing", "1"))
+    return encoded, headers
 
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
-        """Handle GET request - fetch all jobs."""
+        """Handle GET request - the jobs of the latest snapshot.
+
+        Cache state goes in headers (X-Cache, Age, ...), not the body, so a
+        snapshot's body and ETag stay the same until the next pipeline run.
+        """
         try:
-            from backend.graph import run_job_search
-
-            # Run the async job search
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(run_job_search())
-            loop.close()
-
-            # Prepare response
-            response = {
-                "success": True,
-                "jobs": result.get("filtered_jobs", []),
-                "total_found": result.get("total_jobs_found", 0),
-                "total_filtered": result.get("total_jobs_filtered", 0),
-                "progress": result.get("progress_messages", []),
-                "errors": result.get("errors", []),
-                "fetch_started_at": result.get("fetch_started_at"),
-                "fetch_completed_at": result.get("fetch_completed_at"),
-            }
-
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.end_headers()
-            self.wfile.write(json.dumps(response, default=str).encode())
+            # ?refresh=1 waits for a fresh run instead of serving the snapshot.
+            # ?full=1 additionally reprocesses every posting, not just changes.
+            query = parse_qs(urlparse(self.path).query)
+            full = query.get("full", ["0"])[0] == "1"
+            refresh = full or query.get("refresh", ["0"])[0] == "1"
+
+            if not refresh and not any(name in query for name in PAGE_PARAMETERS):
+                static = static_response(self.headers.get("Accept-Encoding"))
+                if static is not None:
+                    encoded, headers = static
+                    send_encoded(self, encoded, headers=headers)
+                    return
+
+            cached, cache_info = run_sync(result_cache.get(force_refresh=refresh, incremental=not full))
+            encoded = encoded_response(cached, query, self.headers.get("Accept-Encoding"))
+
+            headers = [
+                ("X-Cache", cache_info["status"].upper()),
+                ("Age", str(int(cache_info["age_seconds"]))),
+            ]
+            if cache_info["refreshing"]:
+                headers.append(("X-Cache-Refreshing", "1"))
+            if cache_info["last_error"]:
+                headers.append(("X-Cache-Error", cache_info["last_error"][:200]))
+            send_encoded(self, encoded, headers=headers)
 
+        except ValueError as e:
+            send_encoded(self, encode_body({"success": False, "error": f"Invalid parameter: {e}", "jobs": []}), 400)
         except Exception as e:
-            self.send_response(500)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps({
-                "success": False,
-                "error": str(e),
-                "jobs": [],
-            }).encode())
+            send_encoded(self, encode_body({"success": False, "error": str(e), "jobs": []}), 500)
 
     def do_OPTIONS(self):
         """Handle CORS preflight."""
         self.send_response(200)
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, If-None-Match")
         self.end_headers()
@@ -0,0 +1,103 @@
+"""API endpoint to search, filter and page through jobs in the job database.
+
+Query parameters (all optional):
+    q             full-text search over title and description
+    work_type     remote / hybrid / onsite (comma-separated for several)
+    company, source, level
+                  exact matches, comma-separated
+    max_distance  miles from home
+    commutable    1 or 0
+    posted_after  ISO date
+    sort          posted (default), distance, company, match, relevance (with q)
+    limit, offset page size (max 200) and start
+    include       "description" to add the full text (default: snippet only)
+    fields        comma-separated job fields to return
+
+Responses are compressed and carry ETags like /api/jobs (backend/api_response.py).
+
+The database is filled by the pipeline (backend/job_db.py). Serverless
+functions don't share /tmp, so an instance that has no jobs yet runs the
+pipeline once before answering.
+"""
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from backend.api_response import encode_body, parse_fields, parse_limit, project, send_encoded
+from backend.job_db import MAX_PAGE_SIZE, get_job_db
+from backend.records import job_payload
+from backend.runtime import run_sync
+
+
+def parse_list(query: dict, name: str) -> list:
+    return [value for param in query.get(name, []) for value in param.split(",") if value]
+
+
+def search(query: dict) -> dict:
+    """Run a search from parsed query parameters; raises ValueError on bad input."""
+    db = get_job_db()
+    if db.count() == 0:
+        from backend.graph import run_job_search
+        run_sync(run_job_search(incremental=True))
+
+    def first(name: str):
+        return query.get(name, [None])[0]
+
+    # Bounded as JobDatabase.query bounds them, so next_offset follows the page served
+    limit = parse_limit(first("limit"), MAX_PAGE_SIZE, default=50)
+    offset = max(0, int(first("offset") or 0))
+    max_distance = first("max_distance")
+    commutable = first("commutable")
+
+    jobs, total = db.query(
+        text=first("q"),
+        work_types=parse_list(query, "work_type"),
+        companies=parse_list(query, "company"),
+        sources=parse_list(query, "source"),
+        levels=parse_list(query, "level"),
+        max_distance=float(max_distance) if max_distance else None,
+        commutable=commutable == "1" if commutable in ("0", "1") else None,
+        posted_after=first("posted_after"),
+        sort=first("sort"),
+        limit=limit,
+        offset=offset,
+    )
+    next_offset = offset + len(jobs)
+    include_description = "description" in parse_list(query, "include")
+    fields = parse_fields(query.get("fields", []))
+    if fields and include_description:
+        fields.append("description")
+    return {
+        "success": True,
+        "jobs": project((job_payload(job, include_description) for job in jobs), fields),
+        "total": total,
+        "offset": offset,
+        "next_offset": next_offset if next_offset < total else None,
+    }
+
+
+class handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        """Handle GET request - one page of matching jobs."""
+        try:
+            response = search(parse_qs(urlparse(self.path).query))
+            status = 200
+        except ValueError as e:
+            response, status = {"success": False, "error": f"Invalid parameter: {e}", "jobs": []}, 400
+        except Exception as e:
+            response, status = {"success": False, "error": str(e), "jobs": []}, 500
+
+        send_encoded(self, encode_body(response, self.headers.get("Accept-Encoding")), status)
+
+    def do_OPTIONS(self):
+        """Handle CORS preflight."""
+        self.send_response(200)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, If-None-Match")
+        self.end_headers()
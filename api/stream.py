@@ -0,0 +1,53 @@
+"""API endpoint to stream pipeline progress and jobs as they arrive.
+
+Serves Server-Sent Events by default; pass ``?format=ndjson`` (or send
+``Accept: application/x-ndjson``) for newline-delimited JSON.
+"""
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from backend.runtime import iterate_sync
+from backend.streaming import stream_pipeline_events, format_sse, format_ndjson
+
+
+class handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        """Handle GET request - stream events for one pipeline run."""
+        query = parse_qs(urlparse(self.path).query)
+        ndjson = query.get("format", [""])[0] == "ndjson" or \
+            "application/x-ndjson" in self.headers.get("Accept", "")
+        incremental = query.get("full", ["0"])[0] != "1"
+        encode = format_ndjson if ndjson else format_sse
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson" if ndjson else "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-Accel-Buffering", "no")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        events = iterate_sync(stream_pipeline_events(incremental=incremental))
+        try:
+            for event in events:
+                self.wfile.write(encode(event))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client went away; closing the iterator cancels the run
+        except Exception as e:
+            self.wfile.write(encode({"event": "error", "message": str(e)}))
+        finally:
+            events.close()
+
+    def do_OPTIONS(self):
+        """Handle CORS preflight."""
+        self.send_response(200)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, Accept")
+        self.end_headers()
@@ -0,0 +1,191 @@
+"""Encoding of JSON API responses: projection, compression and ETags.
+
+- ``dumps`` uses orjson when installed (several times faster on job lists),
+  else compact ``json.dumps``;
+- bodies are compressed with brotli (if installed) or gzip, as negotiated
+  from ``Accept-Encoding``;
+- each encoded body carries a strong ETag (hash of its bytes plus the
+  coding), so a client revalidating an unchanged snapshot gets a 304.
+"""
+import base64
+import gzip
+import hashlib
+import json
+from typing import Any, Iterable, List, NamedTuple, Optional, Sequence
+
+from backend.records import JOB_KEYS, PAYLOAD_OMITTED_FIELDS, to_jsonable
+
+try:
+    import orjson
+except ImportError:  # Optional: faster serialization
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only
+    brotli = None
+
+
+MIN_COMPRESS_BYTES = 1024    # Smaller bodies aren't worth the CPU or the header
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5           # Dynamic responses: most of the ratio at a fraction of q11's cost
+
+# Fields a client can ask for with ``fields=``
+PROJECTABLE_FIELDS = frozenset(JOB_KEYS) - PAYLOAD_OMITTED_FIELDS
+
+
+class EncodedBody(NamedTuple):
+    body: bytes
+    encoding: Optional[str]      # Content-Encoding, None for identity
+    etag: str
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize to compact JSON bytes (records via ``to_jsonable``)."""
+    if orjson is not None:
+        return orjson.dumps(value, default=to_jsonable)
+    return json.dumps(value, default=to_jsonable, separators=(",", ":")).encode()
+
+
+def available_encodings() -> List[str]:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Optional[Sequence[str]] = None) -> Optional[str]:
+    """Best content coding the client accepts (brotli preferred), or None.
+
+    ``available`` limits the choice (default: every coding this process can produce).
+    """
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+
+    best = None
+    for coding in available if available is not None else available_encodings():
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > 0 and (best is None or quality > best[1]):
+            best = (coding, quality)
+    return best[0] if best else None
+
+
+def compress(body: bytes, encoding: Optional[str]) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)  # mtime=0: same bytes every time
+    return body
+
+
+def body_digest(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def make_etag(digest: str, encoding: Optional[str]) -> str:
+    """Strong ETag of a body (by its uncompressed digest) in one content coding."""
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+def encode_body(value: Any, accept_encoding: Optional[str] = None) -> EncodedBody:
+    """Serialize and compress ``value`` for a client's ``Accept-Encoding``."""
+    body = dumps(value)
+    encoding = negotiate_encoding(accept_encoding) if len(body) >= MIN_COMPRESS_BYTES else None
+    return EncodedBody(compress(body, encoding), encoding, make_etag(body_digest(body), encoding))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag`` (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith("W/") else tag) == etag:
+            return True
+    return False
+
+
+def parse_fields(values: Sequence[str]) -> Optional[List[str]]:
+    """Field names from ``fields=`` parameters; raises ValueError on unknown names."""
+    names = [name.strip() for value in values for name in value.split(",") if name.strip()]
+    if not names:
+        return None
+    unknown = [name for name in names if name not in PROJECTABLE_FIELDS]
+    if unknown:
+        raise ValueError(f"unknown field(s) {', '.join(unknown)}")
+    return list(dict.fromkeys(names))
+
+
+def parse_limit(value: Optional[str], maximum: int, default: Optional[int] = None) -> Optional[int]:
+    """Page size from a ``limit=`` parameter, capped at ``maximum``.
+
+    Raises ValueError unless it is a whole number of at least 1; ``default``
+    when the parameter is absent or empty.
+    """
+    if value is None or value == "":
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError(f"limit must be a whole number, got {value!r}") from None
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    return min(limit, maximum)
+
+
+def project(jobs: Iterable[dict], fields: Optional[List[str]]) -> List[dict]:
+    """Only ``fields`` of each job (all of them when ``fields`` is None)."""
+    if fields is None:
+        return list(jobs)
+    return [{name: job.get(name) for name in fields} for job in jobs]
+
+
+def encode_cursor(position: Sequence[Any]) -> str:
+    """Opaque pagination cursor for a position in a sorted list."""
+    return base64.urlsafe_b64encode(json.dumps(list(position)).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """Position from ``encode_cursor``; raises ValueError if malformed."""
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError("malformed cursor") from e
+    if not isinstance(position, list):
+        raise ValueError("malformed cursor")
+    return position
+
+
+def send_encoded(handler, encoded: EncodedBody, status: int = 200, headers: Iterable = ()) -> None:
+    """Write an encoded JSON response on a ``BaseHTTPRequestHandler``.
+
+    Answers 304 Not Modified (no body) when the request's ``If-None-Match``
+    already names this body's ETag.
+    """
+    not_modified = status == 200 and etag_matches(handler.headers.get("If-None-Match"), encoded.etag)
+    handler.send_response(304 if not_modified else status)
+    handler.send_header("ETag", encoded.etag)
+    handler.send_header("Vary", "Accept-Encoding")
+    handler.send_header("Cache-Control", "no-cache")  # Store, but revalidate with the ETag
+    handler.send_header("Access-Control-Allow-Origin", "*")
+    handler.send_header("Access-Control-Expose-Headers", "ETag, Age, X-Cache")
+    for name, value in headers:
+        handler.send_header(name, value)
+    if not_modified:
+        handler.end_headers()
+        return
+
+    handler.send_header("Content-Type", "application/json")
+    if encoded.encoding:
+        handler.send_header("Content-Encoding", encoded.encoding)
+    handler.send_header("Content-Length", str(len(encoded.body)))
+    handler.end_headers()
+    handler.wfile.write(encoded.body)
@@ -0,0 +1,92 @@
+"""Atomic writes of the files kept under CACHE_DIR, and a persistent JSON cache.
+
+Every file is written to a temporary sibling and renamed over the target,
+so a concurrent reader (another warm invocation, or the cron) sees either
+the old contents or the new ones, never a partial file.
+"""
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Set
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Replace ``path`` with ``data``, creating its directory if needed."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Unique per process and thread, so concurrent writers never share a temp file
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(path: str, value: Any, default: Optional[Callable[[Any], Any]] = None) -> None:
+    """Replace ``path`` with ``value`` as JSON."""
+    write_atomic(path, json.dumps(value, default=default).encode())
+
+
+class JsonCache:
+    """Persistent JSON map of key -> value, loaded on first use.
+
+    The file stores a ``fingerprint()`` of whatever produced the values (a
+    dictionary, data files); entries written under another fingerprint are
+    ignored, so changing the producer invalidates them. With
+    ``max_entries``, a flush over the limit keeps only the entries this
+    process read or wrote.
+    """
+
+    def __init__(self, path: str, fingerprint: Callable[[], str], max_entries: Optional[int] = None):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.version: Optional[str] = None
+        self.entries: Optional[Dict[str, Any]] = None
+        self.used: Set[str] = set()
+        self.dirty = False
+
+    def decode(self, value: Any) -> Any:
+        """Value as used in memory, from its JSON form."""
+        return value
+
+    def _load(self) -> Dict[str, Any]:
+        if self.entries is None:
+            self.entries = {}
+            self.version = self.fingerprint()
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if data.get("version") == self.version:
+                    self.entries = {key: self.decode(value) for key, value in data.get("entries", {}).items()}
+            except (OSError, ValueError):
+                pass
+        return self.entries
+
+    def get(self, key: str) -> Any:
+        value = self._load().get(key)
+        if value is not None:
+            self.used.add(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self._load()[key] = value
+        self.used.add(key)
+        self.dirty = True
+
+    def flush(self) -> None:
+        """Write new entries to disk (no-op if nothing changed)."""
+        if not self.dirty:
+            return
+        if self.max_entries is not None and len(self.entries) > self.max_entries:
+            self.entries = {key: self.entries[key] for key in self.used}
+        try:
+            write_json_atomic(self.path, {"version": self.version, "entries": self.entries})
+            self.dirty = False
+        except OSError:
+            pass  # Cache is an optimization only
@@ -0,0 +1,108 @@
+"""Bounded-concurrency executor for fetching many job boards at once."""
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypedDict
+
+import httpx
+
+
+# Defaults tuned for ~30 boards inside a 60s serverless budget
+MAX_CONCURRENCY = 16         # Total in-flight board requests
+PER_HOST_CONCURRENCY = 8     # In-flight requests against any single API host
+BOARD_TIMEOUT_SECONDS = 10.0  # Deadline for one board once it has a slot, including retries
+
+# Whole-pipeline budget, under the 60s function limit in vercel.json. Fetches
+# still running FETCH_RESERVE_SECONDS before it are cancelled so merge and
+# distance always run on whatever arrived.
+PIPELINE_TIME_BUDGET_SECONDS = float(os.environ.get("BAY_AREA_RADAR_TIME_BUDGET", 50))
+FETCH_RESERVE_SECONDS = 3.0
+DEADLINE_ERROR = "cancelled at the pipeline deadline"
+
+
+class FetchResult(TypedDict):
+    """Outcome of a single board fetch."""
+    key: str                 # Board identifier (e.g. company slug)
+    host: str
+    value: Any               # Whatever the fetch coroutine returned, None on failure
+    error: Optional[str]
+    elapsed: float           # Seconds from start (after acquiring a slot) to finish
+
+
+class FetchExecutor:
+    """Run board fetches concurrently behind a global and per-host semaphore.
+
+    Semaphores are created per executor so an instance must only be used
+    inside a single event loop (one graph run).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        per_host_concurrency: int = PER_HOST_CONCURRENCY,
+        board_timeout: Optional[float] = BOARD_TIMEOUT_SECONDS,
+    ):
+        self.board_timeout = board_timeout
+        self.per_host_concurrency = per_host_concurrency
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return self._hosts[host]
+
+    async def _limited(self, host: str, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, float]:
+        # Take the host slot first so a busy host doesn't pin global slots.
+        # The board timeout starts once both are held: time spent queued
+        # behind other boards is bounded by the pipeline deadline, not this.
+        async with self._host_semaphore(host), self._global:
+            start = time.perf_counter()
+            value = await asyncio.wait_for(factory(), self.board_timeout)
+            return value, time.perf_counter() - start
+
+    async def run(self, key: str, host: str, factory: Callable[[], Awaitable[Any]]) -> FetchResult:
+        """Run one fetch, converting timeouts and exceptions into an error result."""
+        start = time.perf_counter()
+        try:
+            value, elapsed = await self._limited(host, factory)
+            return {"key": key, "host": host, "value": value, "error": None, "elapsed": elapsed}
+        except asyncio.TimeoutError as e:
+            error = str(e) or f"timed out after {self.board_timeout:g}s"
+        except httpx.HTTPStatusError as e:
+            error = f"HTTP {e.response.status_code}"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        return {"key": key, "host": host, "value": None, "error": error,
+                "elapsed": time.perf_counter() - start}
+
+    async def map(
+        self,
+        calls: Iterable[Tuple[str, str, Callable[[], Awaitable[Any]]]],
+        deadline: Optional[float] = None,
+    ) -> List[FetchResult]:
+        """Run (key, host, factory) calls concurrently; results keep input order.
+
+        A slow or failing board only affects its own result, so callers always
+        get the boards that did finish. Calls start in the given order as
+        slots free up. With ``deadline`` (event-loop time) calls still queued
+        or running then are cancelled and get ``DEADLINE_ERROR``.
+        """
+        calls = list(calls)
+        tasks = [asyncio.ensure_future(self.run(key, host, factory)) for key, host, factory in calls]
+        if not tasks:
+            return []
+        if deadline is None:
+            return list(await asyncio.gather(*tasks))
+
+        start = time.perf_counter()
+        _, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - asyncio.get_running_loop().time()))
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        return [
+            {"key": key, "host": host, "value": None, "error": DEADLINE_ERROR,
+             "elapsed": time.perf_counter() - start}
+            if task.cancelled() else task.result()
+            for (key, host, _), task in zip(calls, tasks)
+        ]
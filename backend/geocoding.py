@@ -0,0 +1,316 @@
+"""Offline geocoding of job location strings.
+
+Resolution runs entirely on bundled data so it is fast and deterministic in
+serverless cold starts:
+
+1. ``gazetteer.json`` - curated cities, neighborhoods, ZIPs and aliases,
+   compiled once at import time into a single alternation regex ordered
+   longest-first ("south san francisco" wins over "san francisco").
+2. ``zipcodes_ca.csv`` - every California ZIP centroid, loaded lazily into a
+   compact array-backed table; also gives city centroids ("Fresno, CA").
+3. ``us_states.csv`` - state centroids, so "Austin, TX" resolves to
+   somewhere far away instead of an unknown location.
+4. ``countries.txt`` - non-U.S. qualifiers, so "San Jose, Costa Rica" is
+   not mistaken for San Jose, CA.
+
+Trailing ", ST" / ", Country" qualifiers are read first: a Bay Area name
+only counts when it is qualified by CA/California/USA or not at all, so
+"Fremont, OH" resolves to Ohio and "Dublin, Ireland" to nothing.
+
+Multi-office strings ("SF / NYC / Remote") resolve to every office found.
+Results are memoized per normalized string in memory and in a persistent
+cache file under CACHE_DIR.
+"""
+import csv
+import hashlib
+import json
+import os
+import re
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from backend.cache_files import JsonCache
+from backend.state import CACHE_DIR
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+GAZETTEER_PATH = os.path.join(DATA_DIR, "gazetteer.json")
+ZIPCODES_PATH = os.path.join(DATA_DIR, "zipcodes_ca.csv")
+STATES_PATH = os.path.join(DATA_DIR, "us_states.csv")
+COUNTRIES_PATH = os.path.join(DATA_DIR, "countries.txt")
+GEOCODE_CACHE_PATH = os.path.join(CACHE_DIR, "geocode_cache.json")
+
+Coords = Tuple[float, float]
+
+
+class Gazetteer:
+    """Place names mapped to coordinates, with a compiled longest-match regex."""
+
+    def __init__(self, places: Dict[str, Coords], aliases: Optional[Dict[str, str]] = None):
+        self.places: Dict[str, Coords] = {name: tuple(coords) for name, coords in places.items()}
+        self.names: Dict[str, Coords] = dict(self.places)
+        for alias, target in (aliases or {}).items():
+            self.names[alias] = self.places[target]
+
+        # Longest names first so the alternation prefers the longest match
+        alternation = "|".join(re.escape(name) for name in sorted(self.names, key=len, reverse=True))
+        self.pattern = re.compile(rf"(?<![\w-])(?:{alternation})(?![\w-])")
+
+    def match_all(self, text: str) -> List[Tuple[str, Coords]]:
+        """All places in ``text`` (already normalized), left to right."""
+        return [(m.group(0), self.names[m.group(0)]) for m in self.pattern.finditer(text)]
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_PATH) -> "Gazetteer":
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data.get("places", {}), data.get("aliases", {}))
+
+
+class ZipTable:
+    """California ZIP centroids in parallel arrays, sorted by ZIP.
+
+    ~2.6k rows take a few tens of KB as arrays instead of thousands of
+    tuples; lookups are a binary search.
+    """
+
+    def __init__(self, path: str = ZIPCODES_PATH):
+        rows = []
+        with open(path) as f:
+            for row in csv.DictReader(line for line in f if not line.startswith("#")):
+                lat, lng = float(row["lat"]), float(row["lng"])
+                if lat == 0 and lng == 0:
+                    continue  # Placeholder for a ZIP without a centroid; would skew its city
+                rows.append((int(row["zip"]), lat, lng, row["city"]))
+        rows.sort()
+
+        self.zips = array("I", (r[0] for r in rows))
+        self.lats = array("f", (r[1] for r in rows))
+        self.lngs = array("f", (r[2] for r in rows))
+
+        # City centroid = mean of its ZIP centroids
+        sums: Dict[str, List[float]] = {}
+        for _, lat, lng, city in rows:
+            acc = sums.setdefault(city, [0.0, 0.0, 0])
+            acc[0] += lat
+            acc[1] += lng
+            acc[2] += 1
+        self.cities: Dict[str, Coords] = {
+            city: (round(lat / n, 4), round(lng / n, 4)) for city, (lat, lng, n) in sums.items()
+        }
+
+    def zip_coords(self, zip_code: str) -> Optional[Coords]:
+        key = int(zip_code)
+        i = bisect_left(self.zips, key)
+        if i < len(self.zips) and self.zips[i] == key:
+            return (round(self.lats[i], 4), round(self.lngs[i], 4))
+        return None
+
+    def city_coords(self, city: str) -> Optional[Coords]:
+        return self.cities.get(city)
+
+
+def load_states(path: str = STATES_PATH) -> Dict[str, Coords]:
+    """State centroids keyed by both abbreviation and full name."""
+    states: Dict[str, Coords] = {}
+    with open(path) as f:
+        for row in csv.DictReader(line for line in f if not line.startswith("#")):
+            coords = (float(row["lat"]), float(row["lng"]))
+            states[row["abbr"].lower()] = coords
+            states[row["name"]] = coords
+    return states
+
+
+def load_countries(path: str = COUNTRIES_PATH) -> frozenset:
+    """Lowercase names of non-U.S. countries and regions."""
+    with open(path) as f:
+        return frozenset(line.strip() for line in f if line.strip() and not line.startswith("#"))
+
+
+GAZETTEER = Gazetteer.load()
+
+_zip_table: Optional[ZipTable] = None
+_states: Optional[Dict[str, Coords]] = None
+_countries: Optional[frozenset] = None
+
+
+def get_zip_table() -> ZipTable:
+    """Load the ZIP table on first use."""
+    global _zip_table
+    if _zip_table is None:
+        _zip_table = ZipTable()
+    return _zip_table
+
+
+def get_states() -> Dict[str, Coords]:
+    """Load state centroids on first use."""
+    global _states
+    if _states is None:
+        _states = load_states()
+    return _states
+
+
+def get_countries() -> frozenset:
+    """Load non-U.S. qualifiers on first use."""
+    global _countries
+    if _countries is None:
+        _countries = load_countries()
+    return _countries
+
+
+class GeocodeCache(JsonCache):
+    """Persistent map of normalized location string -> resolved offices.
+
+    Keyed by a fingerprint of the bundled data, so editing the gazetteer or
+    tables invalidates old entries.
+    """
+
+    def __init__(self, path: str = GEOCODE_CACHE_PATH):
+        super().__init__(path, data_fingerprint)
+
+    def decode(self, value: List[List[float]]) -> List[Coords]:
+        return [tuple(coords) for coords in value]
+
+
+def data_fingerprint() -> str:
+    """Hash of the bundled geocoding data files and resolution rules."""
+    digest = hashlib.sha1(RESOLVER_VERSION.encode())
+    for path in (GAZETTEER_PATH, ZIPCODES_PATH, STATES_PATH, COUNTRIES_PATH):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+RESOLVER_VERSION = "2"  # Bump when resolution rules change, to drop cached results
+
+geocode_cache = GeocodeCache()
+
+_WHITESPACE = re.compile(r"\s+")
+# Separators between offices in multi-location strings
+_SEGMENT_SPLIT = re.compile(r"\s*(?:/|;|\||•|\n|&)\s*")
+_ZIP = re.compile(r"(?<!\d)(\d{5})(?:-\d{4})?(?!\d)")
+# Parenthesized notes and ZIPs around a qualifier: "CA 94301", "OH (Hybrid)"
+_QUALIFIER_NOISE = re.compile(r"\(.*|\d{5}(?:-\d{4})?")
+CA_QUALIFIERS = frozenset({"ca", "california"})
+US_QUALIFIERS = frozenset({"us", "usa", "u.s", "u.s.a", "united states", "united states of america"})
+
+
+def normalize_location(location: str) -> str:
+    """Lowercase and collapse whitespace so equivalent strings share a cache entry."""
+    return _WHITESPACE.sub(" ", location.lower()).strip()
+
+
+def _qualifier(part: str) -> Optional[str]:
+    """``part`` as a qualifier: "ca", "us", another state's key, "foreign", or None."""
+    key = _QUALIFIER_NOISE.sub("", part).strip(" .()-")
+    if key in CA_QUALIFIERS:
+        return "ca"
+    if key in US_QUALIFIERS:
+        return "us"
+    if key in get_states():
+        return key
+    if key in get_countries():
+        return "foreign"
+    return None
+
+
+def _qualified_runs(segment: str) -> List[Tuple[List[str], Optional[str], str]]:
+    """Split "City, ST, City2, Country" into ``(place parts, qualifier, qualifier text)`` runs.
+
+    A qualifier must follow a place, so a lone "Indiana", or "New York" in
+    "New York, NY", stays a place.
+    """
+    runs = []
+    places: List[str] = []
+    for part in (part.strip(" .()-") for part in segment.split(",")):
+        if not part:
+            continue
+        qualifier = _qualifier(part) if places else None
+        if qualifier is None:
+            places.append(part)
+        else:
+            runs.append((places, qualifier, part))
+            places = []
+    if places:
+        runs.append((places, None, ""))
+    return runs
+
+
+def _resolve_places(places: List[str], qualifier: Optional[str], qualifier_text: str) -> List[Coords]:
+    """Offices named by place parts qualified by CA, the U.S. or nothing."""
+    text = ", ".join(places)
+    # The gazetteer spells some ambiguous names with their state ("dublin, ca")
+    found = [coords for _, coords in GAZETTEER.match_all(f"{text}, ca" if qualifier == "ca" else text)]
+    if found:
+        return found
+
+    table = get_zip_table()
+    found = [
+        coords for zip_code in _ZIP.findall(f"{text} {qualifier_text}")
+        if (coords := table.zip_coords(zip_code))
+    ]
+    if found:
+        return found
+
+    for part in places:
+        if coords := table.city_coords(part):
+            return [coords]
+    states = get_states()
+    for part in places:
+        if len(part) > 2 and part in states:  # Full names only; "in"/"or" are too ambiguous
+            return [states[part]]
+    return []
+
+
+def _resolve_segment(segment: str) -> List[Coords]:
+    """Offices in one segment.
+
+    Bay Area names count only when qualified by CA/USA or not at all; another
+    state's qualifier gives that state's centroid, a foreign one nothing.
+    """
+    found: List[Coords] = []
+    for places, qualifier, qualifier_text in _qualified_runs(segment):
+        if qualifier in (None, "ca", "us"):
+            found.extend(_resolve_places(places, qualifier, qualifier_text))
+        elif qualifier != "foreign" and places:
+            found.append(get_states()[qualifier])
+    return found
+
+
+@lru_cache(maxsize=8192)
+def _resolve_normalized(location: str) -> Tuple[Coords, ...]:
+    cached = geocode_cache.get(location)
+    if cached is not None:
+        return tuple(cached)
+
+    offices: List[Coords] = []
+    for segment in _SEGMENT_SPLIT.split(location):
+        for coords in _resolve_segment(segment):
+            if coords not in offices:
+                offices.append(coords)
+
+    geocode_cache.put(location, offices)
+    return tuple(offices)
+
+
+def match_locations(location: str) -> List[Coords]:
+    """Coordinates of every distinct office in a location string.
+
+    Handles multi-location strings such as "SF / NYC / Remote".
+    """
+    if not location:
+        return []
+    return list(_resolve_normalized(normalize_location(location)))
+
+
+def geocode_location(location: str) -> Optional[Coords]:
+    """Coordinates of the first office in a location string."""
+    offices = match_locations(location)
+    return offices[0] if offices else None
+
+
+def flush_geocode_cache() -> None:
+    """Persist newly resolved locations (call once per pipeline run)."""
+    geocode_cache.flush()
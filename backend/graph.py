@@ -1,56 +1,104 @@
 """Main LangGraph workflow for job search pipeline."""
+import time
 from datetime import datetime
-from langgraph.graph import StateGraph, END
+from typing import List, Optional, Tuple
+import httpx
+from langgraph.graph import StateGraph, START, END
 from backend.state import JobSearchState
+from backend.concurrency import PIPELINE_TIME_BUDGET_SECONDS
 from backend.nodes import (
-    fetch_remotive_node,
-    fetch_greenhouse_node,
-    fetch_lever_node,
+    create_fetch_node,
     merge_jobs_node,
+    score_jobs_node,
     calculate_distance_node,
 )
+from backend.instrumentation import flush_spans, span
+from backend.pipeline_log import timed_node
+from backend.sources import SOURCE_ADAPTERS, load_boards
 
 
-def create_job_search_graph():
-    """Create the job search LangGraph workflow."""
+def enabled_sources() -> List[str]:
+    """Registered sources that have at least one configured board."""
+    boards = load_boards()
+    return [source for source in SOURCE_ADAPTERS if boards.get(source)]
+
+
+# (jobs_in, jobs_out) of each node for its timing record
+def _fetch_counts(source: str):
+    def counts(state: JobSearchState, update: dict) -> Tuple[int, int]:
+        board_timings = [t for t in update.get("timings", []) if t.get("board") is not None]
+        return sum(t.get("jobs_in") or 0 for t in board_timings), len(update["source_jobs"][source])
+    return counts
+
+
+def _merge_counts(state: JobSearchState, update: dict) -> Tuple[int, int]:
+    return sum(len(jobs) for jobs in state.get("source_jobs", {}).values()), len(update["all_jobs"])
+
+
+def _score_counts(state: JobSearchState, update: dict) -> Tuple[int, int]:
+    scored = update["logs"][0]["count"]
+    return scored, scored
+
+
+def _distance_counts(state: JobSearchState, update: dict) -> Tuple[int, int]:
+    jobs_in = state.get("delta_jobs", []) if state.get("incremental") else state.get("all_jobs", [])
+    return len(jobs_in), update["total_jobs_filtered"]
+
+
+def create_job_search_graph(sources: Optional[List[str]] = None):
+    """Create the job search LangGraph workflow.
+
+    One fetch node is generated per source type, so adding boards or a new
+    adapter never changes this function.
+    """
     # Initialize the graph with our state type
     graph = StateGraph(JobSearchState)
 
-    # Add nodes
-    graph.add_node("fetch_remotive", fetch_remotive_node)
-    graph.add_node("fetch_greenhouse", fetch_greenhouse_node)
-    graph.add_node("fetch_lever", fetch_lever_node)
-    graph.add_node("merge_jobs", merge_jobs_node)
-    graph.add_node("calculate_distance", calculate_distance_node)
-
-    # Set entry point - start with remotive (we'll run fetchers sequentially for simplicity)
-    graph.set_entry_point("fetch_remotive")
-
-    # Define edges (sequential flow for now)
-    graph.add_edge("fetch_remotive", "fetch_greenhouse")
-    graph.add_edge("fetch_greenhouse", "fetch_lever")
-    graph.add_edge("fetch_lever", "merge_jobs")
-    graph.add_edge("merge_jobs", "calculate_distance")
+    # Fan out: all fetchers start together as parallel branches
+    fetch_nodes = []
+    for source in sources or enabled_sources():
+        node = f"fetch_{source}"
+        graph.add_node(node, timed_node(node, create_fetch_node(source), _fetch_counts(source)))
+        graph.add_edge(START, node)
+        fetch_nodes.append(node)
+
+    graph.add_node("merge_jobs", timed_node("merge_jobs", merge_jobs_node, _merge_counts))
+    graph.add_node("score_jobs", timed_node("score_jobs", score_jobs_node, _score_counts))
+    graph.add_node("calculate_distance", timed_node("calculate_distance", calculate_distance_node, _distance_counts))
+
+    # Join: merge_jobs waits for every fetcher, so wall time is the slowest source
+    graph.add_edge(fetch_nodes, "merge_jobs")
+    graph.add_edge("merge_jobs", "score_jobs")
+    graph.add_edge("score_jobs", "calculate_distance")
     graph.add_edge("calculate_distance", END)
 
     return graph.compile()
 
 
-async def run_job_search():
-    """Run the job search pipeline and return results."""
-    graph = create_job_search_graph()
+def create_initial_state(incremental: bool = False, time_budget: Optional[float] = None) -> JobSearchState:
+    """Build a fresh input state for one pipeline run.
 
-    initial_state: JobSearchState = {
-        "sources": ["remotive", "greenhouse", "lever"],
+    With ``time_budget`` (seconds) the run gets a deadline: fetches still
+    outstanding shortly before it are cancelled and the rest of the pipeline
+    runs on what arrived.
+    """
+    return {
+        "sources": enabled_sources(),
         "keywords": ["senior", "staff", "software", "engineer", "frontend", "backend"],
+        "incremental": incremental,
+        "deadline": time.time() + time_budget if time_budget else None,
         "current_step": "",
         "steps_completed": [],
-        "progress_messages": [],
-        "remotive_jobs": [],
-        "greenhouse_jobs": [],
-        "lever_jobs": [],
+        "logs": [],
+        "timings": [],
+        "source_jobs": {},
+        "partial_sources": [],
+        "failed_boards": [],
         "all_jobs": [],
         "processed_jobs": [],
+        "delta_jobs": [],
+        "unchanged_jobs": [],
+        "job_diff": {},
         "filtered_jobs": [],
         "top_jobs": [],
         "errors": [],
@@ -60,8 +108,36 @@ async def run_job_search():
         "total_jobs_filtered": 0,
     }
 
-    # Run the graph
-    result = await graph.ainvoke(initial_state)
+
+async def run_job_search(
+    http_client: Optional[httpx.AsyncClient] = None,
+    incremental: bool = False,
+    time_budget: Optional[float] = PIPELINE_TIME_BUDGET_SECONDS,
+):
+    """Run the job search pipeline and return results.
+
+    Pass ``http_client`` to override the shared pooled client (e.g. with a
+    mock transport); by default connections are reused across runs. With
+    ``incremental`` only jobs that changed since the last run are processed
+    and ``job_diff`` lists what changed. Sources cut off by the
+    ``time_budget`` deadline are listed in ``partial_sources``.
+    """
+    graph = create_job_search_graph()
+
+    initial_state = create_initial_state(incremental, time_budget)
+    config = {"configurable": {"http_client": http_client}} if http_client else None
+
+    # Run the graph (traced as the root span when BAY_AREA_RADAR_TRACE_FILE is set)
+    with span("run_job_search", incremental=incremental) as current:
+        result = await graph.ainvoke(initial_state, config=config)
+        if current is not None:
+            current["attributes"].update(
+                total_jobs_found=result.get("total_jobs_found"),
+                total_jobs_filtered=result.get("total_jobs_filtered"),
+                errors=len(result.get("errors", [])),
+                partial_sources=",".join(result.get("partial_sources", [])) or None,
+            )
+    flush_spans()
 
     # Set completion time
     result["fetch_completed_at"] = datetime.now().isoformat()
@@ -69,30 +145,17 @@ async def run_job_search():
     return result
 
 
-async def stream_job_search():
+async def stream_job_search(
+    http_client: Optional[httpx.AsyncClient] = None,
+    incremental: bool = False,
+    time_budget: Optional[float] = PIPELINE_TIME_BUDGET_SECONDS,
+):
     """Stream job search progress for UI updates."""
     graph = create_job_search_graph()
 
-    initial_state: JobSearchState = {
-        "sources": ["remotive", "greenhouse", "lever"],
-        "keywords": ["senior", "staff", "software", "engineer", "frontend", "backend"],
-        "current_step": "",
-        "steps_completed": [],
-        "progress_messages": [],
-        "remotive_jobs": [],
-        "greenhouse_jobs": [],
-        "lever_jobs": [],
-        "all_jobs": [],
-        "processed_jobs": [],
-        "filtered_jobs": [],
-        "top_jobs": [],
-        "errors": [],
-        "fetch_started_at": datetime.now().isoformat(),
-        "fetch_completed_at": "",
-        "total_jobs_found": 0,
-        "total_jobs_filtered": 0,
-    }
+    initial_state = create_initial_state(incremental, time_budget)
+    config = {"configurable": {"http_client": http_client}} if http_client else None
 
     # Stream events from the graph
-    async for event in graph.astream_events(initial_state, version="v2"):
+    async for event in graph.astream_events(initial_state, config=config, version="v2"):
         yield event
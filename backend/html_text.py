@@ -0,0 +1,70 @@
+"""HTML-to-text conversion for job descriptions.
+
+Boards return descriptions as markup: Greenhouse ``content`` is HTML that
+is itself entity-escaped, Remotive and some Lever postings are plain HTML.
+Every adapter converts them to plain text once, when the posting is parsed,
+so merge, skill extraction, storage and the API all work on compact text.
+
+The converter is a handful of compiled-regex passes (no DOM is built) over
+a bounded prefix of the markup, so a huge posting costs no more than a
+long one: block elements become line breaks, list items bullets, scripts
+and styles are dropped, and entities are decoded.
+"""
+import html
+import re
+
+
+MAX_DESCRIPTION_CHARS = 10000       # Longer descriptions are truncated
+MAX_MARKUP_CHARS = 4 * MAX_DESCRIPTION_CHARS  # Markup read to produce them
+SNIPPET_CHARS = 240                 # List-view preview
+
+# Entities of the escaped layer, decoded with str.replace (html.unescape
+# runs a Python callback per entity, ~15x slower here); "&amp;" goes last
+_ESCAPES = (("&lt;", "<"), ("&gt;", ">"), ("&quot;", '"'), ("&#39;", "'"), ("&#x27;", "'"), ("&amp;", "&"))
+
+_HIDDEN = re.compile(r"<(script|style|head)\b.*?</\1\s*>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
+_LIST_ITEM = re.compile(r"<li\b[^>]*>", re.IGNORECASE)
+_BLOCK = re.compile(
+    r"<(?:br|hr|/?(?:p|div|h[1-6]|ul|ol|li|tr|table|section|article|header|footer|blockquote|pre))\b[^>]*>",
+    re.IGNORECASE,
+)
+# A "<" only starts markup when a tag name, "/" or "!" follows, so "< 5 years"
+# or "salary <$200k" in plain text survives
+_MARKUP = re.compile(r"<[A-Za-z/!]")
+_TAG = re.compile(r"<[A-Za-z/!][^>]*>")
+_SPACES = re.compile(r"[^\S\n]+")
+_LINE_BREAKS = re.compile(r" ?\n[\s]*")
+
+
+def truncate(text: str, limit: int) -> str:
+    """Cut ``text`` to at most ``limit`` characters, at a word boundary."""
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit)
+    if cut < limit * 0.8:
+        cut = limit - 1
+    return text[:cut].rstrip() + "…"
+
+
+def html_to_text(markup: str, limit: int = MAX_DESCRIPTION_CHARS) -> str:
+    """Readable plain text of an HTML (or entity-escaped HTML) fragment."""
+    if not markup:
+        return ""
+    text = markup[:MAX_MARKUP_CHARS]
+    if "&lt;" in text and not _MARKUP.search(text):
+        for entity, char in _ESCAPES:  # Escaped markup (Greenhouse ``content``)
+            text = text.replace(entity, char)
+    if "<" in text and _MARKUP.search(text):
+        text = _HIDDEN.sub("", text)
+        text = _LIST_ITEM.sub("\n• ", text)
+        text = _BLOCK.sub("\n", text)
+        text = _TAG.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    text = _LINE_BREAKS.sub("\n", _SPACES.sub(" ", text)).strip()
+    return truncate(text, limit)
+
+
+def snippet(text: str, limit: int = SNIPPET_CHARS) -> str:
+    """First words of a (plain-text) description, on one line."""
+    return truncate(" ".join(text[:limit * 2].split()), limit)
@@ -0,0 +1,297 @@
+"""On-disk conditional-request (ETag / Last-Modified) cache for board APIs.
+
+Most boards don't change between polls, so each response is stored with its
+validators and the parsed result. The next fetch sends ``If-None-Match`` /
+``If-Modified-Since``; on ``304 Not Modified`` the parsed jobs are reused
+without downloading or parsing the payload again.
+
+Parsed values are stamped with the caller's parser ``version``. A value
+parsed by another version is never reused: the stored body is re-parsed on
+a 304, or the payload fetched unconditionally when there is no body.
+
+Responses without validators are stored too: they are never revalidated,
+but their parsed value is the board's last known good result, served while
+the board is failing (see backend/resilience.py).
+
+Entries older than the TTL are dropped, and the least recently used entries
+are evicted once the cache grows past its size budget.
+"""
+import hashlib
+import json
+import os
+import time
+import zlib
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple, TypedDict
+
+import httpx
+
+from backend.cache_files import write_atomic
+from backend.instrumentation import record_metric
+from backend.records import to_jsonable
+from backend.state import CACHE_DIR
+
+
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+HTTP_CACHE_TTL_SECONDS = 24 * 60 * 60        # Revalidate for up to a day
+HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024      # Total on-disk budget
+HTTP_CACHE_ENABLED = os.environ.get("BAY_AREA_RADAR_HTTP_CACHE", "1") == "1"
+
+
+class CacheEntry(TypedDict, total=False):
+    """Metadata and parsed payload stored for one URL."""
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    version: str             # Parser version that produced ``value``
+    value: Any               # Parsed result of the last 200 response
+
+
+class HttpCache:
+    """File-per-URL response cache with TTL and size-based LRU eviction."""
+
+    def __init__(
+        self,
+        directory: str = HTTP_CACHE_DIR,
+        ttl: float = HTTP_CACHE_TTL_SECONDS,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+    ):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        key = hashlib.sha1(url.encode()).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def get(self, url: str, version: Optional[str] = None) -> Optional[CacheEntry]:
+        """Return the entry for ``url`` if present and within the TTL.
+
+        With ``version``, a value parsed by another version is left out of
+        the entry; its validators (and stored body) stay usable.
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                entry: CacheEntry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.ttl:
+            self._remove(meta_path, body_path)
+            return None
+
+        # Touch so eviction is least-recently-used rather than oldest-written
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+        if version is not None and entry.get("version") != version:
+            entry.pop("value", None)
+        return entry
+
+    def get_body(self, url: str) -> Optional[bytes]:
+        """Return the raw response body stored alongside an entry."""
+        try:
+            with open(self._paths(url)[1], "rb") as f:
+                return zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            return None
+
+    def put(self, url: str, response: httpx.Response, value: Any, store_body: bool = True, version: str = "") -> None:
+        """Store validators, compressed body and parsed value for ``url``.
+
+        Pass ``store_body=False`` for streamed responses whose body was
+        never held in memory; only the parsed value is kept then.
+        """
+        entry: CacheEntry = {
+            "url": url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "stored_at": time.time(),
+            "version": version,
+            "value": value,
+        }
+        meta_path, body_path = self._paths(url)
+        total = self.total_bytes()  # Before writing, so a first scan doesn't count this entry
+        before = self._file_size(meta_path) + self._file_size(body_path)
+        if store_body:
+            write_atomic(body_path, zlib.compress(response.content))
+        else:
+            self._remove(body_path)
+        write_atomic(meta_path, json.dumps(entry, default=to_jsonable).encode())
+        after = self._file_size(meta_path) + self._file_size(body_path)
+
+        self._total_bytes = total + after - before
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def refresh(self, url: str, entry: CacheEntry) -> None:
+        """Restart an entry's TTL after a successful revalidation."""
+        entry["stored_at"] = time.time()
+        write_atomic(self._paths(url)[0], json.dumps(entry, default=to_jsonable).encode())
+
+    def total_bytes(self) -> int:
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, _, size in self._scan())
+        return self._total_bytes
+
+    def evict(self) -> None:
+        """Drop expired entries, then least recently used until under budget."""
+        now = time.time()
+        entries = []
+        for path, mtime, size in self._scan():
+            if path.endswith(".json"):
+                body_path = path[:-len(".json")] + ".body"
+                entries.append((mtime, path, body_path, size + self._file_size(body_path)))
+
+        entries.sort()  # Least recently used first
+        total = sum(size for _, _, _, size in entries)
+        for mtime, meta_path, body_path, size in entries:
+            if total <= self.max_bytes and now - mtime <= self.ttl:
+                continue
+            self._remove(meta_path, body_path)
+            total -= size
+        self._total_bytes = total
+
+    def _scan(self):
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            yield path, stat.st_mtime, stat.st_size
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(*paths: str) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_cache: Optional[HttpCache] = None
+
+
+def get_cache() -> Optional[HttpCache]:
+    """Return the shared cache, or None when disabled or not writable."""
+    global _cache
+
+    if not HTTP_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        try:
+            _cache = HttpCache()
+        except OSError:
+            return None
+    return _cache
+
+
+def _conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+async def fetch_cached(
+    client: httpx.AsyncClient,
+    url: str,
+    parse: Callable[[httpx.Response], Any],
+    params: Optional[Dict[str, str]] = None,
+    cache: Optional[HttpCache] = None,
+    version: str = "",
+) -> Tuple[Any, int]:
+    """GET ``url`` with conditional headers and return ``(parsed, status)``.
+
+    ``parse`` runs only on a fresh 200 body, or on the stored body when the
+    stored value came from another parser ``version``; otherwise a 304
+    returns the stored parsed value. A 404 returns ``(None, 404)`` and other
+    errors raise ``httpx.HTTPStatusError``.
+    """
+    cache = cache if cache is not None else get_cache()
+    cache_key = str(httpx.URL(url, params=params))
+    entry = cache.get(cache_key, version) if cache else None
+
+    response = await client.get(url, params=params, headers=_conditional_headers(entry))
+    record_metric("status", response.status_code)
+    record_metric("bytes", response.num_bytes_downloaded, add=True)
+
+    if response.status_code == 304 and entry:
+        if "value" not in entry:
+            # No value for this parser version: re-parse the stored body
+            body = cache.get_body(cache_key)
+            if body is not None:
+                entry["value"] = parse(httpx.Response(200, content=body, request=response.request))
+                entry["version"] = version
+        if "value" in entry:
+            cache.refresh(cache_key, entry)
+            return entry["value"], 304
+        # Lost the body too: fall back to an unconditional fetch
+        response = await client.get(url, params=params)
+        record_metric("status", response.status_code)
+        record_metric("bytes", response.num_bytes_downloaded, add=True)
+
+    if response.status_code == 404:
+        return None, 404
+
+    response.raise_for_status()
+    start = time.perf_counter()
+    value = parse(response)
+    record_metric("parse_ms", (time.perf_counter() - start) * 1000, add=True)
+    if cache:
+        cache.put(cache_key, response, value, version=version)
+    return value, response.status_code
+
+
+async def fetch_cached_stream(
+    client: httpx.AsyncClient,
+    url: str,
+    parse_stream: Callable[[AsyncIterator[bytes]], Awaitable[Any]],
+    params: Optional[Dict[str, str]] = None,
+    cache: Optional[HttpCache] = None,
+    version: str = "",
+) -> Tuple[Any, int]:
+    """Like ``fetch_cached`` but parses the body as it streams in.
+
+    ``parse_stream`` consumes the body chunks, so large payloads are never
+    held in memory whole. Only the parsed value is cached, so without one
+    for this parser ``version`` the request is unconditional.
+    """
+    cache = cache if cache is not None else get_cache()
+    cache_key = str(httpx.URL(url, params=params))
+    entry = cache.get(cache_key, version) if cache else None
+    if entry is not None and "value" not in entry:
+        entry = None  # Nothing to reuse on a 304
+
+    async with client.stream("GET", url, params=params, headers=_conditional_headers(entry)) as response:
+        record_metric("status", response.status_code)
+        if response.status_code == 304 and entry:
+            cache.refresh(cache_key, entry)
+            return entry["value"], 304
+
+        if response.status_code == 404:
+            return None, 404
+
+        response.raise_for_status()
+        value = await parse_stream(response.aiter_bytes())
+        record_metric("bytes", response.num_bytes_downloaded, add=True)
+
+    if cache:
+        cache.put(cache_key, response, value, store_body=False, version=version)
+    return value, response.status_code
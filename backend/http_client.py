@@ -0,0 +1,100 @@
+"""Shared pooled HTTP client for all fetch nodes.
+
+One ``httpx.AsyncClient`` is created lazily and reused across graph runs, so
+a warm serverless container keeps its TCP/TLS connections to the job board
+APIs instead of re-handshaking on every request.
+
+Nodes get the client through LangGraph's run config (dependency injection):
+pass ``{"configurable": {"http_client": client}}`` to swap in a client with a
+mock transport; otherwise the shared client is used.
+"""
+import asyncio
+import importlib.util
+import os
+from typing import Optional
+
+import httpx
+
+
+# Connection pool tuning - enough for every board in flight at once
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# HTTP/2 needs the optional `h2` package (pip install "httpx[http2]")
+HTTP2_ENABLED = os.environ.get("BAY_AREA_RADAR_HTTP2", "1") == "1" and \
+    importlib.util.find_spec("h2") is not None
+
+USER_AGENT = "bay-area-radar/1.0 (+https://github.com/Jabawack/bay-area-radar)"
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_closing: set = set()  # Close calls of replaced clients still in flight
+
+
+def create_client(transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+    """Create an AsyncClient with the shared pool settings."""
+    return httpx.AsyncClient(
+        http2=HTTP2_ENABLED and transport is None,
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+        transport=transport,
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use.
+
+    Pooled connections belong to the event loop that opened them, so a new
+    client is created if the running loop changed since the last call; the
+    old one is closed rather than left holding its sockets.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and not _client.is_closed:
+            _discard(_client, _client_loop)
+        _client = create_client()
+        _client_loop = loop
+    return _client
+
+
+async def _close_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception:
+        pass  # Its loop is gone; the connections are unusable either way
+
+
+def _discard(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a replaced client on its own loop if that still runs, else on this one."""
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        future = asyncio.run_coroutine_threadsafe(_close_quietly(client), loop)
+    else:
+        future = asyncio.ensure_future(_close_quietly(client))
+    _closing.add(future)
+    future.add_done_callback(_closing.discard)
+
+
+def get_http_client(config: Optional[dict] = None) -> httpx.AsyncClient:
+    """Resolve the client for a node: injected via config, else the shared one."""
+    client = ((config or {}).get("configurable") or {}).get("http_client")
+    return client if client is not None else get_client()
+
+
+async def close_client() -> None:
+    """Close the shared client (e.g. on shutdown or in benchmarks)."""
+    global _client, _client_loop
+
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -0,0 +1,128 @@
+"""Per-board fetch metrics and optional OpenTelemetry-style trace spans.
+
+Metrics: each board fetch runs inside ``board_metrics(metrics)``; the HTTP
+cache and the adapters record status, bytes, parse time and job counts into
+the current board's ``FetchMetrics`` via ``record_metric`` without any of
+them being passed around explicitly (a context variable carries them).
+
+Spans: when ``BAY_AREA_RADAR_TRACE_FILE`` is set, ``span()`` blocks (the
+pipeline run, every node and every board fetch) are written to that file as
+JSON lines shaped like OTLP spans, so a slow run can be inspected afterwards
+or imported into any trace viewer. Without the env var spans cost nothing.
+"""
+import json
+import os
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, TypedDict
+
+
+TRACE_FILE = os.environ.get("BAY_AREA_RADAR_TRACE_FILE")
+
+
+class FetchMetrics(TypedDict, total=False):
+    """What happened while fetching one board."""
+    status: Optional[int]    # Final HTTP status (304 = served from the HTTP cache)
+    bytes: int               # Response body bytes on the wire (before decompression)
+    retries: int             # Attempts beyond the first
+    jobs_in: int             # Items in the payload
+    jobs_out: int            # Jobs kept after the title filter
+    parse_ms: float          # Time spent parsing/filtering the body
+
+
+_metrics: ContextVar[Optional[FetchMetrics]] = ContextVar("fetch_metrics", default=None)
+
+
+def new_metrics() -> FetchMetrics:
+    return {"status": None, "bytes": 0, "retries": 0, "jobs_in": 0, "jobs_out": 0, "parse_ms": 0.0}
+
+
+@contextmanager
+def board_metrics(metrics: FetchMetrics) -> Iterator[FetchMetrics]:
+    """Make ``metrics`` the target of ``record_metric`` inside this block."""
+    token = _metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _metrics.reset(token)
+
+
+def record_metric(name: str, value: Any, add: bool = False) -> None:
+    """Set (or with ``add``, increment) a metric of the board being fetched."""
+    metrics = _metrics.get()
+    if metrics is None:
+        return
+    metrics[name] = metrics.get(name, 0) + value if add else value
+
+
+# --- Spans -------------------------------------------------------------------
+
+class Span(TypedDict):
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str]
+    name: str
+    start_time_unix_nano: int
+    end_time_unix_nano: int
+    attributes: Dict[str, Any]
+    status: Dict[str, str]   # {"code": "OK" | "ERROR", "message": ...}
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_finished: List[Span] = []
+
+
+def tracing_enabled() -> bool:
+    return TRACE_FILE is not None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Trace a block as a child of the enclosing span (no-op unless enabled).
+
+    Yields the span so callers can add attributes before it ends.
+    """
+    if not tracing_enabled():
+        yield None
+        return
+
+    parent = _current_span.get()
+    current: Span = {
+        "trace_id": parent["trace_id"] if parent else secrets.token_hex(16),
+        "span_id": secrets.token_hex(8),
+        "parent_span_id": parent["span_id"] if parent else None,
+        "name": name,
+        "start_time_unix_nano": time.time_ns(),
+        "end_time_unix_nano": 0,
+        "attributes": {key: value for key, value in attributes.items() if value is not None},
+        "status": {"code": "OK"},
+    }
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current["status"] = {"code": "ERROR", "message": f"{type(e).__name__}: {e}"}
+        raise
+    finally:
+        _current_span.reset(token)
+        current["end_time_unix_nano"] = time.time_ns()
+        _finished.append(current)
+
+
+def flush_spans(path: Optional[str] = None) -> int:
+    """Append finished spans to the trace file as JSON lines; returns the count."""
+    path = path or TRACE_FILE
+    if not path or not _finished:
+        return 0
+    spans = _finished[:]
+    del _finished[:len(spans)]
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "a") as f:
+            for finished in spans:
+                f.write(json.dumps(finished, default=str) + "\n")
+    except OSError:
+        return 0  # Tracing is diagnostics only
+    return len(spans)
@@ -0,0 +1,276 @@
+"""SQLite job database behind the dashboard's search and filter queries.
+
+``calculate_distance_node`` writes every processed job (not only the
+commutable ones) after each run; ``api/search.py`` reads paginated, filtered
+slices instead of the UI pulling and filtering the whole list.
+
+- WAL mode, so readers never block on the pipeline's write transaction;
+- B-tree indexes on ``work_type``, ``company``, ``distance_miles`` and
+  ``posted_at`` for the dashboard's filters and sorts;
+- an external-content FTS5 index over ``title`` and ``description``, kept in
+  sync by triggers (plain ``LIKE`` matching if SQLite lacks FTS5).
+
+Jobs no longer returned by a board that fetched this run are deleted, so
+the table mirrors the latest results. Connections are per thread.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from backend.job_store import job_key
+from backend.state import CACHE_DIR, Job
+
+
+JOB_DB_PATH = os.path.join(CACHE_DIR, "jobs.db")
+
+# Stored columns, in Job order (lists as JSON arrays)
+COLUMNS = (
+    "source", "source_id", "board", "company", "title", "description", "location", "work_type",
+    "salary_min", "salary_max", "url", "posted_at", "skills", "summary", "level",
+    "discipline", "distance_miles", "is_commutable", "latitude", "longitude", "urls", "locations",
+    "match_score",
+)
+JSON_COLUMNS = frozenset({"skills", "urls", "locations"})
+SCHEMA_VERSION = 4  # Bump when columns change; the mirror is rebuilt on the next run
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    board TEXT,
+    company TEXT,
+    title TEXT,
+    description TEXT,
+    location TEXT,
+    work_type TEXT,
+    salary_min INTEGER,
+    salary_max INTEGER,
+    url TEXT,
+    posted_at TEXT,
+    skills TEXT,
+    summary TEXT,
+    level TEXT,
+    discipline TEXT,
+    distance_miles REAL,
+    is_commutable INTEGER,
+    latitude REAL,
+    longitude REAL,
+    urls TEXT,
+    locations TEXT,
+    match_score REAL,
+    seen_at TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_work_type ON jobs (work_type);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS jobs_distance ON jobs (distance_miles);
+CREATE INDEX IF NOT EXISTS jobs_posted_at ON jobs (posted_at);
+CREATE INDEX IF NOT EXISTS jobs_source_seen ON jobs (source, seen_at);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, description, content='jobs', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, description ON jobs
+WHEN old.title IS NOT new.title OR old.description IS NOT new.description BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO jobs_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+"""
+
+UPSERT = f"""
+INSERT INTO jobs (key, {", ".join(COLUMNS)}, seen_at)
+VALUES ({", ".join("?" * (len(COLUMNS) + 2))})
+ON CONFLICT (key) DO UPDATE SET
+    {", ".join(f"{column} = excluded.{column}" for column in COLUMNS)},
+    seen_at = excluded.seen_at
+"""
+
+SORTS = {
+    "posted": "jobs.posted_at DESC NULLS LAST, jobs.id",
+    "distance": "jobs.distance_miles ASC NULLS LAST, jobs.id",
+    "company": "jobs.company, jobs.id",
+    "match": "jobs.match_score DESC NULLS LAST, jobs.id",
+    "relevance": "jobs_fts.rank, jobs.id",  # Only with a text query
+}
+MAX_PAGE_SIZE = 200
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word, as a prefix, must match."""
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def _row_values(job: Job, seen_at: str) -> Tuple[Any, ...]:
+    values = [job_key(job)]
+    for column in COLUMNS:
+        value = job.get(column)
+        if column in JSON_COLUMNS:
+            value = json.dumps(value) if value is not None else None
+        elif column == "is_commutable":
+            value = int(bool(value))
+        values.append(value)
+    values.append(seen_at)
+    return tuple(values)
+
+
+def _row_to_job(row: sqlite3.Row) -> Job:
+    job = {column: row[column] for column in COLUMNS}
+    for column in JSON_COLUMNS:
+        job[column] = json.loads(job[column]) if job[column] is not None else None
+    job["skills"] = job["skills"] or []
+    job["is_commutable"] = bool(job["is_commutable"])
+    return job
+
+
+class JobDatabase:
+    """SQLite mirror of the latest processed jobs; see the module docstring."""
+
+    def __init__(self, path: str = JOB_DB_PATH):
+        self.path = path
+        self.fts = True
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def connect(self) -> sqlite3.Connection:
+        """This thread's connection, creating the schema on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")  # Durable enough for a rebuildable mirror
+            with self._schema_lock:
+                if not self._schema_ready:
+                    self._create_schema(conn)
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        with conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS jobs_fts; DROP TABLE IF EXISTS jobs;")
+            conn.executescript(SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            try:
+                conn.executescript(FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                self.fts = False  # SQLite built without FTS5
+
+    def save(
+        self,
+        changed: Iterable[Job],
+        unchanged: Iterable[Job] = (),
+        sources: Optional[Iterable[str]] = None,
+        seen_at: str = "",
+        failed_boards: Iterable[str] = (),
+    ) -> None:
+        """Upsert ``changed`` jobs, mark ``unchanged`` ones as still listed,
+        and delete jobs of ``sources`` that weren't seen in this run.
+
+        Jobs of ``failed_boards`` (``source:slug`` keys of boards that failed
+        or were cut off) are kept as still listed rather than deleted.
+        """
+        unchanged = list(unchanged)
+        conn = self.connect()
+        with conn:
+            conn.executemany(UPSERT, (_row_values(job, seen_at) for job in changed))
+            touched = conn.executemany(
+                "UPDATE jobs SET seen_at = ? WHERE key = ?",
+                ((seen_at, job_key(job)) for job in unchanged),
+            ).rowcount
+            if touched != len(unchanged):
+                # Database is behind the job store (e.g. new file): write them all
+                conn.executemany(UPSERT, (_row_values(job, seen_at) for job in unchanged))
+            conn.executemany(
+                "UPDATE jobs SET seen_at = ? WHERE source = ? AND board = ?",
+                ((seen_at, *key.split(":", 1)) for key in failed_boards),
+            )
+            for source in sources or ():
+                conn.execute("DELETE FROM jobs WHERE source = ? AND seen_at IS NOT ?", (source, seen_at))
+
+    def count(self) -> int:
+        return self.connect().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def query(
+        self,
+        text: Optional[str] = None,
+        work_types: Sequence[str] = (),
+        companies: Sequence[str] = (),
+        sources: Sequence[str] = (),
+        levels: Sequence[str] = (),
+        max_distance: Optional[float] = None,
+        commutable: Optional[bool] = None,
+        posted_after: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Job], int]:
+        """One page of matching jobs and the total number of matches."""
+        joins, where, params = "", [], []
+        match = fts_query(text) if text else ""
+        if match and self.fts:
+            joins = "JOIN jobs_fts ON jobs_fts.rowid = jobs.id"
+            where.append("jobs_fts MATCH ?")
+            params.append(match)
+        elif match:
+            for word in re.findall(r"\w+", text):
+                where.append("(jobs.title LIKE ? OR jobs.description LIKE ?)")
+                params += [f"%{word}%", f"%{word}%"]
+
+        for column, values in (("work_type", work_types), ("company", companies),
+                               ("source", sources), ("level", levels)):
+            if values:
+                where.append(f"jobs.{column} IN ({', '.join('?' * len(values))})")
+                params += list(values)
+        if max_distance is not None:
+            where.append("jobs.distance_miles <= ?")
+            params.append(max_distance)
+        if commutable is not None:
+            where.append("jobs.is_commutable = ?")
+            params.append(int(commutable))
+        if posted_after:
+            where.append("jobs.posted_at >= ?")
+            params.append(posted_after)
+
+        if sort not in SORTS or (sort == "relevance" and not joins):
+            sort = "relevance" if joins else "posted"
+        clause = f"FROM jobs {joins} {'WHERE ' + ' AND '.join(where) if where else ''}"
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        conn = self.connect()
+        total = conn.execute(f"SELECT COUNT(*) {clause}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT jobs.* {clause} ORDER BY {SORTS[sort]} LIMIT ? OFFSET ?",
+            params + [limit, max(0, offset)],
+        ).fetchall()
+        return [_row_to_job(row) for row in rows], total
+
+
+_db: Optional[JobDatabase] = None
+
+
+def get_job_db() -> JobDatabase:
+    """Return the process-wide job database."""
+    global _db
+
+    if _db is None:
+        _db = JobDatabase()
+    return _db
@@ -0,0 +1,163 @@
+"""Persistent job store for incremental pipeline runs.
+
+Jobs are keyed by ``(source, source_id)`` and stored with a hash of their
+fetched content plus the enriched (processed) version. On the next run only
+new or changed postings need to be enriched; unchanged ones are reused from
+the store and missing ones are reported as removed.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple, TypedDict
+
+from backend.cache_files import write_json_atomic
+from backend.records import JobRecord, to_jsonable
+from backend.resilience import board_key
+from backend.state import CACHE_DIR, Job
+
+
+JOB_STORE_PATH = os.path.join(CACHE_DIR, "jobs.json")
+
+# Fields that come from the source; computed fields are excluded from the hash
+CONTENT_FIELDS = (
+    "company", "title", "description", "location", "work_type",
+    "salary_min", "salary_max", "url", "posted_at", "summary", "urls", "locations",
+)
+
+
+class StoredJob(TypedDict):
+    hash: str
+    job: Job                 # Processed job (with distance fields)
+
+
+class JobDiff(TypedDict):
+    """Keys (``source:source_id``) of jobs that changed since the last run."""
+    new: List[str]
+    changed: List[str]
+    removed: List[str]
+
+
+def job_key(job: Job) -> str:
+    """Stable identifier for a job across runs."""
+    return f"{job.get('source', '')}:{job.get('source_id', '')}"
+
+
+def job_board(job: Job) -> str:
+    """Key (``source:slug``) of the board a job was fetched from."""
+    return board_key(job.get("source", ""), job.get("board", ""))
+
+
+def _kept(entry: StoredJob, sources: set, failed_boards: set) -> bool:
+    """Whether a stored job missing from this run was not fetched, rather than removed."""
+    job = entry["job"]
+    return job.get("source") not in sources or job_board(job) in failed_boards
+
+
+def content_hash(job: Job) -> str:
+    """Hash of the source-provided fields of a job."""
+    content = [job.get(field) for field in CONTENT_FIELDS]
+    content.append(job.get("skills", []))
+    return hashlib.sha1(json.dumps(content, default=str).encode()).hexdigest()
+
+
+class JobStore:
+    """JSON-file store of processed jobs from the previous run."""
+
+    def __init__(self, path: str = JOB_STORE_PATH):
+        self.path = path
+        self._jobs: Optional[Dict[str, StoredJob]] = None
+        self._mtime: Optional[float] = None
+        self._hashes: Dict[str, str] = {}  # Content hashes from the last diff, before enrichment
+
+    def load(self) -> Dict[str, StoredJob]:
+        """Return stored jobs, re-reading the file only if it changed."""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            self._jobs, self._mtime = {}, None
+            return self._jobs
+
+        if self._jobs is None or mtime != self._mtime:
+            try:
+                with open(self.path) as f:
+                    self._jobs = json.load(f)
+            except (OSError, ValueError):
+                self._jobs = {}
+            self._mtime = mtime
+        return self._jobs
+
+    def diff(
+        self, jobs: Iterable[Job], sources: Iterable[str], failed_boards: Iterable[str] = (),
+    ) -> Tuple[List[Job], List[Job], JobDiff]:
+        """Split fetched jobs into ``(delta, unchanged, diff)``.
+
+        ``delta`` holds new and changed jobs that still need processing;
+        ``unchanged`` holds the stored, already-processed versions of the
+        rest. Removals are only reported for ``sources`` that returned jobs
+        this run and never for ``failed_boards`` (``source:slug`` keys of
+        boards that failed or were cut off), so a failing board or source
+        doesn't wipe its jobs.
+        """
+        stored = self.load()
+        delta: List[Job] = []
+        unchanged: List[Job] = []
+        diff: JobDiff = {"new": [], "changed": [], "removed": []}
+        self._hashes = hashes = {}
+
+        for job in jobs:
+            key = job_key(job)
+            hashes[key] = content_hash(job)
+            previous = stored.get(key)
+            if previous is None:
+                diff["new"].append(key)
+                delta.append(job)
+            elif previous["hash"] != hashes[key]:
+                diff["changed"].append(key)
+                delta.append(job)
+            else:
+                record = JobRecord.from_job(previous["job"])
+                record["board"] = job.get("board", "")  # Entries stored before boards were tracked lack it
+                unchanged.append(record)
+
+        sources, failed_boards = set(sources), set(failed_boards)
+        diff["removed"] = [
+            key for key, entry in stored.items()
+            if key not in hashes and not _kept(entry, sources, failed_boards)
+        ]
+        return delta, unchanged, diff
+
+    def save(
+        self, jobs: Iterable[Job], sources: Optional[Iterable[str]] = None, failed_boards: Iterable[str] = (),
+    ) -> None:
+        """Replace the store with this run's processed jobs.
+
+        When ``sources`` is given, stored jobs from other sources and from
+        ``failed_boards`` (e.g. ones that failed this run) are carried over
+        instead of dropped. Jobs keep the hash ``diff`` computed from their
+        fetched content, so fields filled in by later nodes (extracted
+        skills) don't count as changes.
+        """
+        stored: Dict[str, StoredJob] = {}
+        if sources is not None:
+            sources, failed_boards = set(sources), set(failed_boards)
+            stored.update(
+                (key, entry) for key, entry in self.load().items()
+                if _kept(entry, sources, failed_boards)
+            )
+        for job in jobs:
+            key = job_key(job)
+            stored[key] = {"hash": self._hashes.get(key) or content_hash(job), "job": job}
+        write_json_atomic(self.path, stored, default=to_jsonable)
+        self._jobs, self._mtime = stored, os.path.getmtime(self.path)
+
+
+_store: Optional[JobStore] = None
+
+
+def get_job_store() -> JobStore:
+    """Return the process-wide job store (kept in memory between warm runs)."""
+    global _store
+
+    if _store is None:
+        _store = JobStore()
+    return _store
@@ -0,0 +1,124 @@
+"""Incremental parser for large JSON arrays of job items.
+
+Board payloads are a list of objects, often with megabytes of HTML in the
+descriptions. ``ItemStream`` takes the response body chunk by chunk and
+returns each array item, decoded, once it has arrived, so the buffer only
+ever holds the items being received rather than the whole document.
+
+Items are decoded by the C JSON scanner (``JSONDecoder.raw_decode``), so
+the CPU cost stays that of ``json.loads``; Python only steps between items.
+An item split across chunks is retried once the buffer has grown past
+twice its received part (and at least MIN_RETRY_CHARS more), which keeps
+very large items linear overall.
+"""
+import codecs
+import json
+import re
+from typing import Any, Iterable, List, Optional
+
+_decode = json.JSONDecoder().raw_decode
+# Between values: whitespace and separators
+_SEPARATORS = re.compile(r"[\s,:]*")
+
+MIN_RETRY_CHARS = 256 * 1024  # More text to wait for before re-decoding an incomplete value
+
+
+class ItemStream:
+    """Yield the items of the array at ``key`` (or of the top-level array when None).
+
+    Feed chunks with ``feed``; each call returns the items completed so far.
+    ``close`` returns the rest after the last chunk and checks the array was
+    complete.
+    Keys other than ``key`` at the root of the object are skipped.
+    """
+
+    def __init__(self, key: Optional[str] = None):
+        self.key = key
+        self.text = ""
+        self.pos = 0
+        self.retry_at = 0            # Buffer length at which to retry an incomplete value
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        # "start" -> ("key" -> "value")* -> "items" -> "done"
+        self.state = "start"
+        self.pending_key: Optional[str] = None
+
+    def _value(self) -> Any:
+        """Decode the value at ``pos``; raises ValueError if it is incomplete (or malformed)."""
+        value, end = _decode(self.text, self.pos)
+        if end >= len(self.text) and not isinstance(value, (str, list, dict)):
+            raise ValueError("number or literal may continue in the next chunk")
+        self.pos = end
+        return value
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume a chunk and return the items it completed."""
+        if self.state == "done":
+            return []
+        self.text += self.decoder.decode(chunk)
+        if len(self.text) < self.retry_at:
+            return []
+
+        items: List[Any] = []
+        text = self.text
+        end = len(text)
+        while self.state != "done":
+            self.pos = _SEPARATORS.match(text, self.pos).end()
+            if self.pos >= end:
+                break
+            char = text[self.pos]
+
+            if self.state == "start":
+                expected = "[" if self.key is None else "{"
+                if char != expected:
+                    raise ValueError(f"expected '{expected}' at the start of the JSON payload")
+                self.pos += 1
+                self.state = "items" if self.key is None else "key"
+                continue
+            if char == ("]" if self.state == "items" else "}") and self.state != "value":
+                self.state = "done"  # End of the array (or of a root object without ``key``)
+                continue
+            if self.state == "value" and char == "[" and self.pending_key == self.key:
+                self.pos += 1
+                self.state = "items"
+                continue
+
+            start = self.pos
+            try:
+                value = self._value()
+            except ValueError:
+                # Most likely cut off by the chunk boundary: retry once more has arrived
+                self.pos = start
+                self.retry_at = end + max(end - start, MIN_RETRY_CHARS)
+                break
+            if self.state == "items":
+                items.append(value)
+            elif self.state == "key":
+                self.pending_key = value
+                self.state = "value"
+            else:
+                self.state = "key"  # Skipped some other root value
+
+        # Drop consumed text; only a partial value is kept
+        self.text = text[self.pos:]
+        self.retry_at -= self.pos
+        self.pos = 0
+        return items
+
+    def close(self) -> List[Any]:
+        """Items still buffered after the last chunk.
+
+        Raises ValueError if the body ended before the array did (or is malformed).
+        """
+        self.retry_at = 0
+        items = self.feed(self.decoder.decode(b"", final=True).encode())
+        if self.state != "done":
+            raise ValueError("JSON payload ended inside the item array or is malformed")
+        return items
+
+
+def iter_items(chunks: Iterable[bytes], key: Optional[str] = None):
+    """Yield every item of a chunked JSON body."""
+    stream = ItemStream(key)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    yield from stream.close()
@@ -1,14 +1,20 @@
 """LangGraph nodes for job search pipeline."""
-from .fetch_remotive import fetch_remotive_node
-from .fetch_greenhouse import fetch_greenhouse_node
-from .fetch_lever import fetch_lever_node
+from .fetch_source import create_fetch_node
 from .merge_jobs import merge_jobs_node
+from .score_jobs import score_jobs_node
 from .calculate_distance import calculate_distance_node
 
+# Fetch nodes for the built-in sources (the graph builds these dynamically)
+fetch_remotive_node = create_fetch_node("remotive")
+fetch_greenhouse_node = create_fetch_node("greenhouse")
+fetch_lever_node = create_fetch_node("lever")
+
 __all__ = [
+    'create_fetch_node',
     'fetch_remotive_node',
     'fetch_greenhouse_node',
     'fetch_lever_node',
     'merge_jobs_node',
+    'score_jobs_node',
     'calculate_distance_node',
 ]
@@ -1,47 +1,30 @@
 """Calculate distance from home location and filter commutable jobs."""
 import math
-from typing import List, Optional, Tuple
-from backend.state import JobSearchState, Job, HOME_LAT, HOME_LNG, MAX_COMMUTE_MILES
-
-
-# Known Bay Area city coordinates
-BAY_AREA_CITIES = {
-    "san francisco": (37.7749, -122.4194),
-    "sf": (37.7749, -122.4194),
-    "san jose": (37.3382, -121.8863),
-    "palo alto": (37.4419, -122.1430),
-    "mountain view": (37.3861, -122.0839),
-    "sunnyvale": (37.3688, -122.0363),
-    "santa clara": (37.3541, -121.9552),
-    "cupertino": (37.3230, -122.0322),
-    "menlo park": (37.4530, -122.1817),
-    "redwood city": (37.4852, -122.2364),
-    "fremont": (37.5485, -121.9886),
-    "oakland": (37.8044, -122.2712),
-    "berkeley": (37.8716, -122.2727),
-    "alameda": (37.7652, -122.2416),
-    "milpitas": (37.4323, -121.8996),
-    "san mateo": (37.5630, -122.3255),
-    "south san francisco": (37.6547, -122.4077),
-    "daly city": (37.6879, -122.4702),
-    "burlingame": (37.5841, -122.3660),
-    "foster city": (37.5585, -122.2711),
-    "hayward": (37.6688, -122.0808),
-    "pleasanton": (37.6624, -121.8747),
-    "livermore": (37.6819, -121.7680),
-    "walnut creek": (37.9101, -122.0652),
-    "concord": (37.9780, -122.0311),
-    "campbell": (37.2872, -121.9500),
-    "los gatos": (37.2358, -121.9624),
-    "saratoga": (37.2638, -122.0230),
-    "los altos": (37.3852, -122.1141),
-    "almaden": (37.2358, -121.8606),  # Home area
-}
+import sqlite3
+from typing import Dict, List, Sequence, Tuple
+from backend.state import JobSearchState, Job, HOME_LOCATIONS, MAX_COMMUTE_MILES
+from backend.job_db import get_job_db
+from backend.job_store import get_job_store, job_key
+from backend.pipeline_log import log_record
+from backend.nodes.score_jobs import top_jobs
+from backend.geocoding import GAZETTEER, flush_geocode_cache, match_locations
+
+try:
+    import numpy as np
+except ImportError:  # Optional: batched distances fall back to the scalar haversine
+    np = None
+
+
+EARTH_RADIUS_MILES = 3959
+
+
+# Known Bay Area places (see backend/data/gazetteer.json)
+BAY_AREA_CITIES = GAZETTEER.places
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate distance between two points in miles using Haversine formula."""
-    R = 3959  # Earth's radius in miles
+    R = EARTH_RADIUS_MILES
 
     lat1_rad = math.radians(lat1)
     lat2_rad = math.radians(lat2)
@@ -55,26 +38,13 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
-def geocode_location(location: str) -> Optional[Tuple[float, float]]:
-    """Simple geocoding using known Bay Area cities."""
-    if not location:
-        return None
+def office_locations(job: Job) -> str:
+    """The job's location string, covering every office of merged duplicates."""
+    locations = job.get("locations")
+    return " / ".join(locations) if locations else job.get("location", "")
 
-    location_lower = location.lower()
 
-    # Check for known cities
-    for city, coords in BAY_AREA_CITIES.items():
-        if city in location_lower:
-            return coords
-
-    # Check for California/CA mentions (assume Bay Area center)
-    if "california" in location_lower or ", ca" in location_lower:
-        return (37.5, -122.0)  # Rough Bay Area center
-
-    return None
-
-
-def calculate_job_distance(job: Job) -> Job:
+def calculate_job_distance(job: Job, homes: Sequence[Tuple[float, float]] = HOME_LOCATIONS) -> Job:
     """Calculate distance and commutability for a single job."""
     # Remote jobs are always commutable
     if job.get("work_type") == "remote":
@@ -82,48 +52,157 @@ def calculate_job_distance(job: Job) -> Job:
         job["distance_miles"] = 0
         return job
 
-    # Try to geocode the location
-    location = job.get("location", "")
-    coords = geocode_location(location)
+    # Geocode every listed office and keep the one nearest to home
+    offices = match_locations(office_locations(job))
 
-    if coords:
-        lat, lng = coords
+    if offices:
+        distance, (lat, lng) = min(
+            (min(haversine_distance(home_lat, home_lng, lat, lng) for home_lat, home_lng in homes), (lat, lng))
+            for lat, lng in offices
+        )
         job["latitude"] = lat
         job["longitude"] = lng
-        job["distance_miles"] = round(haversine_distance(HOME_LAT, HOME_LNG, lat, lng), 1)
+        job["distance_miles"] = round(distance, 1)
         job["is_commutable"] = job["distance_miles"] <= MAX_COMMUTE_MILES
     else:
-        # Unknown location - mark as not commutable unless remote/hybrid
+        # Unknown location - can't verify the commute, so don't assume it
         job["distance_miles"] = None
-        job["is_commutable"] = job.get("work_type") == "hybrid"
+        job["is_commutable"] = False
 
     return job
 
 
+def nearest_home_distances(
+    coords: Sequence[Tuple[float, float]],
+    homes: Sequence[Tuple[float, float]] = HOME_LOCATIONS,
+) -> List[float]:
+    """Distance in miles from each point to its nearest home, in one pass.
+
+    Uses a NumPy (points x homes) haversine when available, otherwise the
+    scalar formula.
+    """
+    if not coords:
+        return []
+    if np is None:
+        return [
+            min(haversine_distance(home_lat, home_lng, lat, lng) for home_lat, home_lng in homes)
+            for lat, lng in coords
+        ]
+
+    points = np.radians(np.asarray(coords, dtype=float))
+    centers = np.radians(np.asarray(homes, dtype=float))
+    lat1, lon1 = centers[None, :, 0], centers[None, :, 1]
+    lat2, lon2 = points[:, 0, None], points[:, 1, None]
+
+    a = np.sin((lat2 - lat1) / 2) ** 2 + \
+        np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return (EARTH_RADIUS_MILES * c).min(axis=1).tolist()
+
+
+def calculate_distances_batch(jobs: List[Job], homes: Sequence[Tuple[float, float]] = HOME_LOCATIONS) -> List[Job]:
+    """Batched equivalent of calculate_job_distance, updating jobs in place.
+
+    Each distinct location string is geocoded once and each distinct
+    office coordinate gets its distance in a single vectorized pass, so the
+    per-job work (nearest office plus the commute-radius check) is a few
+    dict lookups.
+    """
+    offices_by_location: Dict[str, List[Tuple[float, float]]] = {}
+    for job in jobs:
+        if job.get("work_type") != "remote":
+            location = office_locations(job)
+            if location not in offices_by_location:
+                offices_by_location[location] = match_locations(location)
+    flush_geocode_cache()
+
+    unique_coords = list({coords for offices in offices_by_location.values() for coords in offices})
+    distances = nearest_home_distances(unique_coords, homes)
+    distance_by_coords = dict(zip(unique_coords, distances))
+
+    # Nearest office per distinct location string
+    nearest_by_location = {
+        location: min((distance_by_coords[coords], coords) for coords in offices)
+        for location, offices in offices_by_location.items() if offices
+    }
+
+    for job in jobs:
+        if job.get("work_type") == "remote":
+            job["is_commutable"] = True
+            job["distance_miles"] = 0
+            continue
+
+        nearest = nearest_by_location.get(office_locations(job))
+        if nearest:
+            distance, (job["latitude"], job["longitude"]) = nearest
+            job["distance_miles"] = round(distance, 1)
+            job["is_commutable"] = job["distance_miles"] <= MAX_COMMUTE_MILES
+        else:
+            job["distance_miles"] = None
+            job["is_commutable"] = False
+
+    return jobs
+
+
+def listing_order(job: Job) -> tuple:
+    """Sort key of the job list: nearest first (remote counts as 0), unknown
+    distances last, ties by job key so the order is total (API cursors rely on it).
+    """
+    distance = job.get("distance_miles")
+    if distance is None:
+        return (1, 0.0, job_key(job))  # Unknown distance last
+    return (0, float(distance), job_key(job))
+
+
 async def calculate_distance_node(state: JobSearchState) -> dict:
     """Calculate distances and filter commutable jobs."""
-    all_jobs = state.get("all_jobs", [])
-
-    # Calculate distance for each job
-    processed_jobs = [calculate_job_distance(job.copy()) for job in all_jobs]
+    homes = state.get("home_locations") or HOME_LOCATIONS
+
+    # Jobs are enriched in place: all_jobs, processed_jobs and filtered_jobs
+    # are lists of references to the same records, never copies
+    sources = {job.get("source") for job in state.get("all_jobs", [])}
+    failed_boards = state.get("failed_boards", [])
+    if state.get("incremental"):
+        # Only enrich the delta; unchanged jobs were processed on an earlier run
+        unchanged = state.get("unchanged_jobs", [])
+        changed = calculate_distances_batch(state.get("delta_jobs", []), homes)
+        processed_jobs = unchanged + changed
+        get_job_store().save(processed_jobs, sources, failed_boards)
+    else:
+        # Calculate distance for all jobs in one batched pass
+        unchanged = []
+        processed_jobs = changed = calculate_distances_batch(state.get("all_jobs", []), homes)
+
+    # Mirror the results into the search database. Jobs of boards that failed
+    # or were cut off by the deadline are kept rather than deleted as unlisted.
+    errors = []
+    try:
+        get_job_db().save(
+            changed, unchanged,
+            sources=sources,
+            seen_at=state.get("fetch_started_at", ""),
+            failed_boards=failed_boards,
+        )
+    except sqlite3.Error as e:
+        errors.append(log_record("calculate_distance", f"Job database: {e}"))
 
     # Filter to only commutable jobs
     filtered_jobs = [job for job in processed_jobs if job.get("is_commutable", False)]
 
     # Sort by distance (remote first, then by distance)
-    def sort_key(job: Job) -> tuple:
-        distance = job.get("distance_miles")
-        if distance is None:
-            return (1, 999)  # Unknown distance last
-        return (0, distance)
-
-    filtered_jobs.sort(key=sort_key)
+    filtered_jobs.sort(key=listing_order)
 
     return {
         "processed_jobs": processed_jobs,
         "filtered_jobs": filtered_jobs,
+        "top_jobs": top_jobs(filtered_jobs),
         "total_jobs_filtered": len(filtered_jobs),
-        "progress_messages": state.get("progress_messages", []) + [
-            f"Filtered to {len(filtered_jobs)} commutable jobs (within {MAX_COMMUTE_MILES} miles or remote)"
-        ],
+        "errors": errors,
+        "steps_completed": ["calculate_distance"],
+        "logs": [log_record(
+            "calculate_distance",
+            f"Filtered to {len(filtered_jobs)} commutable jobs (within {MAX_COMMUTE_MILES} miles or remote)",
+            count=len(filtered_jobs),
+        )],
     }
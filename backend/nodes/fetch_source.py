@@ -0,0 +1,152 @@
+"""Generic fetch node: one per source type, fanning out over its boards."""
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional
+import httpx
+from langchain_core.runnables import RunnableConfig
+from backend.state import JobSearchState, Job, LogRecord, TimingRecord
+from backend.pipeline_log import log_record, timing_record
+from backend.concurrency import BOARD_TIMEOUT_SECONDS, DEADLINE_ERROR, FETCH_RESERVE_SECONDS, FetchExecutor
+from backend.http_client import get_http_client
+from backend.instrumentation import FetchMetrics, board_metrics, new_metrics, span
+from backend.resilience import (
+    BoardHealthRegistry,
+    board_key,
+    call_with_retries,
+    get_board_health,
+)
+from backend.sources import Board, SourceAdapter, get_adapter, load_boards
+
+
+async def fetch_board(
+    adapter: SourceAdapter,
+    client: httpx.AsyncClient,
+    board: Board,
+    metrics: FetchMetrics,
+    health: BoardHealthRegistry,
+) -> List[Job]:
+    """Fetch one board with retries, recording its metrics (and a span when tracing).
+
+    Called once the board has a fetch slot, so its time budget starts here.
+    """
+    key = board_key(adapter.name, board["slug"])
+    deadline = asyncio.get_running_loop().time() + BOARD_TIMEOUT_SECONDS
+    with board_metrics(metrics), span("fetch_board", source=adapter.name, board=board["slug"]) as current:
+        try:
+            return await call_with_retries(
+                lambda: adapter.fetch(client, board), key, deadline, BOARD_TIMEOUT_SECONDS, health,
+            )
+        finally:
+            if current is not None:
+                current["attributes"].update(metrics)
+
+
+def create_fetch_node(source: str) -> Callable:
+    """Build the graph node that fetches every configured board of ``source``."""
+    adapter = get_adapter(source)
+
+    async def fetch_source_node(state: JobSearchState, config: Optional[RunnableConfig] = None) -> dict:
+        node = f"fetch_{source}"
+        all_jobs: List[Job] = []
+        logs: List[LogRecord] = []
+        errors: List[LogRecord] = []
+        timings: List[TimingRecord] = []
+        failed: List[str] = []
+        cut_off = 0
+        boards = load_boards().get(source, [])
+        metrics: Dict[str, FetchMetrics] = {board["slug"]: new_metrics() for board in boards}
+
+        client = get_http_client(config)
+        health = get_board_health()
+        now = asyncio.get_running_loop().time()
+        # Pipeline deadline (unix time) as an event-loop time, minus the time
+        # merge and distance need
+        cutoff = now + state["deadline"] - time.time() - FETCH_RESERVE_SECONDS if state.get("deadline") else None
+        by_slug = {board["slug"]: board for board in boards}
+        open_for = {board["slug"]: health.open_for(board_key(source, board["slug"])) for board in boards}
+        ranked = health.prioritize([board_key(source, board["slug"]) for board in boards])
+        order = {key: rank for rank, key in enumerate(ranked)}
+
+        # Fetch every board concurrently, most productive first and skipping
+        # boards whose circuit is open. A failing board is reported on its own
+        # (with its status and exception type) and falls back to its last
+        # cached jobs; boards unfinished at the cutoff are cancelled and the
+        # source is flagged partial. Unexpected errors outside the per-board
+        # fetches propagate instead of emptying the source.
+        results = await FetchExecutor().map(
+            (
+                (
+                    board["slug"],
+                    adapter.host,
+                    lambda board=board: fetch_board(
+                        adapter, client, board, metrics[board["slug"]], health,
+                    ),
+                )
+                for board in sorted(boards, key=lambda board: order[board_key(source, board["slug"])])
+                if not open_for[board["slug"]]
+            ),
+            deadline=cutoff,
+        )
+        results += [
+            {"key": slug, "host": adapter.host, "value": None, "elapsed": 0.0,
+             "error": f"skipped after repeated failures, retrying in {seconds:.0f}s"}
+            for slug, seconds in open_for.items() if seconds
+        ]
+        for result in results:
+            board, duration_ms = result["key"], result["elapsed"] * 1000
+            timing = timing_record(node, duration_ms, source=source, board=board)
+            timing.update(metrics[board])
+            timing["parse_ms"] = round(timing["parse_ms"], 1)
+            key = board_key(source, board)
+
+            if result["error"]:
+                error = result["error"]
+                failed.append(key)
+                if error == DEADLINE_ERROR:
+                    cut_off += 1
+                elif not open_for[board]:
+                    health.record_failure(key, error)
+                stale = adapter.cached_jobs(by_slug[board])
+                if stale:
+                    all_jobs.extend(stale)
+                    timing["count"] = timing["jobs_out"] = len(stale)
+                    timing["stale"] = True
+                    error += f" (serving {len(stale)} cached jobs)"
+                timing["error"] = error
+                errors.append(log_record(
+                    node, f"{adapter.label} board '{board}': {error}",
+                    source=source, board=board, duration_ms=duration_ms,
+                ))
+            else:
+                jobs = result["value"]
+                health.record_success(key, len(jobs))
+                all_jobs.extend(jobs)
+                timing["count"] = timing["jobs_out"] = len(jobs)
+                logs.append(log_record(
+                    node, f"{adapter.label} board '{board}': {len(jobs)} jobs",
+                    source=source, board=board, count=len(jobs), duration_ms=duration_ms,
+                ))
+            timings.append(timing)
+        health.save()
+
+        logs.append(log_record(
+            node, f"Fetched {len(all_jobs)} jobs from {len(boards)} {adapter.label} boards",
+            source=source, count=len(all_jobs),
+        ))
+        if cut_off:
+            logs.append(log_record(
+                node, f"{adapter.label}: {cut_off} of {len(boards)} boards cut off by the deadline",
+                source=source, count=cut_off,
+            ))
+        return {
+            "source_jobs": {source: all_jobs},
+            "partial_sources": [source] if cut_off else [],
+            "failed_boards": failed,
+            "errors": errors,
+            "timings": timings,
+            "steps_completed": [node],
+            "logs": logs,
+        }
+
+    fetch_source_node.__name__ = f"fetch_{source}_node"
+    return fetch_source_node
@@ -1,6 +1,72 @@
-"""Merge jobs from all sources and deduplicate."""
-from typing import List
+"""Merge jobs from all sources and deduplicate.
+
+Besides exact repeats (same ``source`` + ``source_id``), the same role is
+often posted on several boards (Greenhouse, Lever, Remotive) or as one req
+per office. Those near-duplicates are found in near-linear time:
+
+1. Blocking: only jobs with the same normalized company and title tokens
+   ("Sr. Backend Engineer (NYC)" ~ "Senior Engineer, Backend") are compared.
+2. MinHash/LSH: within a block, descriptions are reduced to MinHash
+   signatures over word shingles and banded into LSH buckets; jobs sharing a
+   bucket whose signatures agree on at least ``DUPLICATE_THRESHOLD`` of the
+   hashes (estimated Jaccard similarity) are duplicates. Different reqs with
+   the same title but different descriptions stay apart.
+
+Each group of duplicates becomes one canonical job (company boards preferred
+over aggregators) listing every posting URL in ``urls`` and every office in
+``locations``.
+"""
+import html
+import random
+import re
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from backend.state import JobSearchState, Job
+from backend.job_store import get_job_store
+from backend.pipeline_log import log_record
+
+try:
+    import numpy as np
+except ImportError:  # Optional: signatures fall back to pure Python
+    np = None
+
+
+NUM_PERMUTATIONS = 32
+LSH_BANDS = 8                # 8 bands x 4 rows: candidates from ~0.6 similarity up
+DUPLICATE_THRESHOLD = 0.6    # Estimated Jaccard similarity of descriptions
+SHINGLE_WORDS = 3
+MAX_SHINGLE_WORDS = 300      # Only the start of a description is fingerprinted
+MAX_SHINGLE_CHARS = 6000     # (read this much markup to find them)
+SIGNATURE_BATCH = 500        # Descriptions per vectorized MinHash batch
+
+# Company boards carry richer postings than aggregators
+SOURCE_PRIORITY = {"greenhouse": 0, "lever": 1, "remotive": 2}
+# Most flexible arrangement wins when duplicates disagree
+WORK_TYPE_RANK = {"remote": 0, "hybrid": 1, "onsite": 2}
+
+_PRIME = (1 << 31) - 1
+_rng = random.Random(20240101)  # Fixed so signatures are stable across runs
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERMUTATIONS)]
+if np is not None:
+    _A = np.asarray([a for a, _ in _PERMUTATIONS], dtype=np.int64)[:, None]
+    _B = np.asarray([b for _, b in _PERMUTATIONS], dtype=np.int64)[:, None]
+    _MIX = np.int64(1_000_003)
+
+COMPANY_SUFFIXES = re.compile(r"\b(?:inc|llc|ltd|corp|corporation|co|company|technologies|labs|hq)\b")
+TITLE_PHRASES = [
+    (re.compile(r"\bfront[\s-]+end\b"), "frontend"),
+    (re.compile(r"\bback[\s-]+end\b"), "backend"),
+    (re.compile(r"\bfull[\s-]+stack\b"), "fullstack"),
+    (re.compile(r"\([^)]*\)|\[[^\]]*\]"), " "),  # "(Remote)", "[NYC]"
+]
+TITLE_ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "eng": "engineer", "engr": "engineer",
+    "mgr": "manager", "swe": "software engineer", "sde": "software engineer",
+    "ii": "2", "iii": "3", "iv": "4",
+}
+TITLE_STOPWORDS = frozenset({"a", "an", "and", "the", "of", "for", "to", "in", "remote", "hybrid", "onsite"})
+TAG = re.compile(r"<[^>]+>")
+WORD = re.compile(r"\w+")
 
 
 def deduplicate_jobs(jobs: List[Job]) -> List[Job]:
@@ -17,22 +83,220 @@ def deduplicate_jobs(jobs: List[Job]) -> List[Job]:
     return unique_jobs
 
 
+def normalize_company(company: str) -> str:
+    return "".join(WORD.findall(COMPANY_SUFFIXES.sub(" ", company.lower())))
+
+
+def title_tokens(title: str) -> Tuple[str, ...]:
+    """Sorted distinct title words with abbreviations expanded."""
+    text = title.lower()
+    for pattern, replacement in TITLE_PHRASES:
+        text = pattern.sub(replacement, text)
+    words = set()
+    for word in WORD.findall(text):
+        words.update(TITLE_ABBREVIATIONS.get(word, word).split())
+    return tuple(sorted(words - TITLE_STOPWORDS))
+
+
+def description_words(description: str) -> List[int]:
+    """Hashed words of a description's text (markup and entities removed).
+
+    Uses the built-in (per-process) hash: signatures are only compared
+    within one run, never persisted.
+    """
+    text = (description or "")[:MAX_SHINGLE_CHARS]
+    if "&" in text:
+        text = html.unescape(text)  # Entity-escaped markup (Greenhouse ``content``)
+    return list(map(hash, TAG.sub(" ", text).lower().split()[:MAX_SHINGLE_WORDS]))
+
+
+def shingles(words: Sequence[int]) -> Set[int]:
+    """Hashes of every run of ``SHINGLE_WORDS`` consecutive words."""
+    if len(words) < SHINGLE_WORDS:
+        return {hash(tuple(words))} if words else set()
+    return set(map(hash, zip(*(words[i:] for i in range(SHINGLE_WORDS)))))
+
+
+def minhash(words: Sequence[int]) -> Tuple[int, ...]:
+    """MinHash signature of a word list's shingles (no words: all zeros)."""
+    values = [value % _PRIME for value in shingles(words)]
+    if not values:
+        return (0,) * NUM_PERMUTATIONS
+    return tuple(min((a * x + b) % _PRIME for x in values) for a, b in _PERMUTATIONS)
+
+
+def _minhash_batch(word_lists: List[List[int]]) -> List[Tuple[int, ...]]:
+    """``minhash`` for lists of at least SHINGLE_WORDS words, vectorized.
+
+    Shingle hashes for all lists are computed over one concatenated array,
+    then every permutation is applied at once and reduced per list.
+    """
+    lengths = np.fromiter(map(len, word_lists), dtype=np.int64, count=len(word_lists))
+    words = np.fromiter(chain.from_iterable(word_lists), dtype=np.int64, count=int(lengths.sum()))
+    shingle = words.copy()
+    for k in range(1, SHINGLE_WORDS):
+        shingle[:-k] = shingle[:-k] * _MIX + words[k:]  # Wraps around, like a hash should
+
+    # Keep shingles that start and end inside the same list
+    counts = lengths - SHINGLE_WORDS + 1
+    offsets = np.cumsum(counts) - counts
+    starts = np.cumsum(lengths) - lengths
+    x = shingle[np.arange(int(counts.sum())) + np.repeat(starts - offsets, counts)] % _PRIME
+
+    hashed = (_A * x + _B) % _PRIME
+    return [tuple(row) for row in np.minimum.reduceat(hashed, offsets, axis=1).T.tolist()]
+
+
+def signatures(descriptions: List[str]) -> List[Tuple[int, ...]]:
+    """MinHash signatures of many descriptions (batched with NumPy if available)."""
+    word_lists = [description_words(description) for description in descriptions]
+    if np is None:
+        return [minhash(words) for words in word_lists]
+
+    result: List[Optional[Tuple[int, ...]]] = [None] * len(word_lists)
+    long_lists = [i for i, words in enumerate(word_lists) if len(words) >= SHINGLE_WORDS]
+    for batch_start in range(0, len(long_lists), SIGNATURE_BATCH):
+        batch = long_lists[batch_start:batch_start + SIGNATURE_BATCH]
+        for i, signature in zip(batch, _minhash_batch([word_lists[i] for i in batch])):
+            result[i] = signature
+    return [signature or minhash(words) for signature, words in zip(result, word_lists)]
+
+
+def similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for l, r in zip(left, right) if l == r) / NUM_PERMUTATIONS
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        self.parent[self.find(i)] = self.find(j)
+
+
+def duplicate_groups(jobs: List[Job]) -> List[List[int]]:
+    """Indices of jobs grouped into near-duplicates (singletons included)."""
+    blocks: Dict[Tuple[str, Tuple[str, ...]], List[int]] = {}
+    for i, job in enumerate(jobs):
+        key = (normalize_company(job.get("company", "")), title_tokens(job.get("title", "")))
+        blocks.setdefault(key, []).append(i)
+
+    # Signatures only for jobs sharing a block, once per distinct description
+    candidates = [members for members in blocks.values() if len(members) > 1]
+    descriptions = list(dict.fromkeys(
+        jobs[i].get("description") or "" for members in candidates for i in members
+    ))
+    signature_of = dict(zip(descriptions, signatures(descriptions)))
+
+    groups = _UnionFind(len(jobs))
+    rows = NUM_PERMUTATIONS // LSH_BANDS
+    for members in candidates:
+        member_signatures = {}
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        for i in members:
+            signature = member_signatures[i] = signature_of[jobs[i].get("description") or ""]
+            for band in range(LSH_BANDS):
+                buckets.setdefault((band, signature[band * rows:(band + 1) * rows]), []).append(i)
+
+        for bucket in buckets.values():
+            first = bucket[0]
+            for i in bucket[1:]:
+                if groups.find(i) != groups.find(first) and \
+                        similarity(member_signatures[first], member_signatures[i]) >= DUPLICATE_THRESHOLD:
+                    groups.union(i, first)
+
+    grouped: Dict[int, List[int]] = {}
+    for i in range(len(jobs)):
+        grouped.setdefault(groups.find(i), []).append(i)
+    return list(grouped.values())
+
+
+def _unique(values: Iterable[Optional[str]]) -> List[str]:
+    return list(dict.fromkeys(value for value in values if value))
+
+
+def merge_duplicates(group: List[Job]) -> Job:
+    """Fold a group of duplicates into its canonical job, in place."""
+    # Deterministic choice, so incremental runs see the same canonical key
+    group = sorted(group, key=lambda job: (
+        SOURCE_PRIORITY.get(job.get("source"), len(SOURCE_PRIORITY)),
+        -len(job.get("description") or ""),
+        job.get("source_id", ""),
+    ))
+    canonical = group[0]
+    urls = _unique(url for job in group for url in (job.get("urls") or [job.get("url")]))
+    locations = _unique(location for job in group for location in (job.get("locations") or [job.get("location")]))
+    canonical["urls"] = urls if len(urls) > 1 else None
+    canonical["locations"] = locations if len(locations) > 1 else None
+    canonical["work_type"] = min(
+        (job.get("work_type") or "onsite" for job in group),
+        key=lambda work_type: WORK_TYPE_RANK.get(work_type, len(WORK_TYPE_RANK)),
+    )
+    canonical["skills"] = _unique(skill for job in group for skill in job.get("skills") or [])
+    return canonical
+
+
+def merge_near_duplicates(jobs: List[Job]) -> List[Job]:
+    """Collapse cross-source and per-location duplicates into canonical jobs."""
+    merged = []
+    for members in duplicate_groups(jobs):
+        if len(members) == 1:
+            merged.append(jobs[members[0]])
+        else:
+            merged.append(merge_duplicates([jobs[i] for i in members]))
+    return merged
+
+
 async def merge_jobs_node(state: JobSearchState) -> dict:
     """Merge jobs from all sources into a single list."""
     all_jobs: List[Job] = []
 
-    # Collect from all sources
-    all_jobs.extend(state.get("remotive_jobs", []))
-    all_jobs.extend(state.get("greenhouse_jobs", []))
-    all_jobs.extend(state.get("lever_jobs", []))
+    # Collect from all sources (in a fixed order: fetchers finish in any order)
+    source_jobs = state.get("source_jobs", {})
+    for source in sorted(source_jobs):
+        all_jobs.extend(source_jobs[source])
 
-    # Deduplicate
+    # Deduplicate: exact repeats, then near-duplicates across sources and offices
     unique_jobs = deduplicate_jobs(all_jobs)
+    merged_jobs = merge_near_duplicates(unique_jobs)
 
-    return {
-        "all_jobs": unique_jobs,
-        "total_jobs_found": len(unique_jobs),
-        "progress_messages": state.get("progress_messages", []) + [
-            f"Merged {len(unique_jobs)} unique jobs from all sources"
+    update = {
+        "all_jobs": merged_jobs,
+        "total_jobs_found": len(merged_jobs),
+        "steps_completed": ["merge_jobs"],
+        "logs": [
+            log_record("merge_jobs", f"Merged {len(merged_jobs)} unique jobs from all sources",
+                       count=len(merged_jobs))
         ],
     }
+    if len(merged_jobs) < len(unique_jobs):
+        update["logs"].append(log_record(
+            "merge_jobs",
+            f"Folded {len(unique_jobs) - len(merged_jobs)} duplicate postings into their canonical jobs",
+            count=len(unique_jobs) - len(merged_jobs),
+        ))
+
+    if state.get("incremental"):
+        # Only new/changed jobs go on to enrichment; the rest come from the store
+        active_sources = {job.get("source") for job in unique_jobs}
+        delta_jobs, unchanged_jobs, job_diff = get_job_store().diff(
+            merged_jobs, active_sources, state.get("failed_boards", []),
+        )
+        update["delta_jobs"] = delta_jobs
+        update["unchanged_jobs"] = unchanged_jobs
+        update["job_diff"] = job_diff
+        update["logs"].append(log_record(
+            "merge_jobs",
+            f"{len(job_diff['new'])} new, {len(job_diff['changed'])} changed, "
+            f"{len(job_diff['removed'])} removed since last run",
+            count=len(delta_jobs),
+        ))
+
+    return update
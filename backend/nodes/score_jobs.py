@@ -0,0 +1,63 @@
+"""Extract skills from descriptions and score jobs against the search keywords."""
+import heapq
+import math
+from typing import Dict, Iterable, List, Sequence
+from backend.state import JobSearchState, Job
+from backend.pipeline_log import log_record
+from backend.skills import description_skills, flush_skill_cache, match_score, merge_skills
+
+
+TOP_JOBS = 10
+
+
+def score_jobs(jobs: Iterable[Job], keywords: Sequence[str]) -> int:
+    """Fill ``skills`` and ``match_score`` in place; returns the number of jobs.
+
+    Each distinct description is looked up (or extracted) once per run.
+    """
+    skills_by_description: Dict[str, List[str]] = {}
+    count = 0
+    for job in jobs:
+        description = job.get("description") or ""
+        extracted = skills_by_description.get(description)
+        if extracted is None:
+            extracted = skills_by_description[description] = description_skills(description)
+        job["skills"] = merge_skills(job.get("skills") or [], extracted)
+        job["match_score"] = match_score(job.get("title", ""), job["skills"], keywords)
+        count += 1
+    return count
+
+
+def rank_key(job: Job) -> tuple:
+    """Higher match score first, then the shorter commute."""
+    distance = job.get("distance_miles")
+    return (job.get("match_score") or 0.0, -distance if distance is not None else -math.inf)
+
+
+def top_jobs(jobs: Iterable[Job], k: int = TOP_JOBS) -> List[Job]:
+    """The ``k`` best-matching jobs, via a bounded heap instead of a full sort."""
+    return heapq.nlargest(k, jobs, key=rank_key)
+
+
+async def score_jobs_node(state: JobSearchState) -> dict:
+    """Extract skills and compute match scores for jobs that need processing."""
+    keywords = state.get("keywords") or []
+    if state.get("incremental"):
+        # Unchanged jobs keep their stored scores (unless stored before scoring existed)
+        jobs = state.get("delta_jobs", []) + [
+            job for job in state.get("unchanged_jobs", []) if job.get("match_score") is None
+        ]
+    else:
+        jobs = state.get("all_jobs", [])
+
+    count = score_jobs(jobs, keywords)
+    flush_skill_cache()
+
+    return {
+        "steps_completed": ["score_jobs"],
+        "logs": [log_record(
+            "score_jobs",
+            f"Extracted skills and scored {count} jobs against {len(keywords)} keywords",
+            count=count,
+        )],
+    }
@@ -0,0 +1,92 @@
+"""Builders for the structured ``logs`` / ``errors`` / ``timings`` channels."""
+import functools
+import time
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from backend.instrumentation import span
+from backend.state import LogRecord, TimingRecord
+
+
+def log_record(
+    node: str,
+    message: str,
+    source: Optional[str] = None,
+    board: Optional[str] = None,
+    count: Optional[int] = None,
+    duration_ms: Optional[float] = None,
+) -> LogRecord:
+    """A log or error entry; unset fields are omitted."""
+    record: LogRecord = {"node": node, "message": message}
+    if source is not None:
+        record["source"] = source
+    if board is not None:
+        record["board"] = board
+    if count is not None:
+        record["count"] = count
+    if duration_ms is not None:
+        record["duration_ms"] = round(duration_ms, 1)
+    return record
+
+
+def timing_record(
+    node: str,
+    duration_ms: float,
+    source: Optional[str] = None,
+    board: Optional[str] = None,
+    count: Optional[int] = None,
+) -> TimingRecord:
+    record: TimingRecord = {"node": node, "duration_ms": round(duration_ms, 1)}
+    if source is not None:
+        record["source"] = source
+    if board is not None:
+        record["board"] = board
+    if count is not None:
+        record["count"] = count
+    return record
+
+
+def messages(records: Iterable[LogRecord], include_boards: bool = True) -> List[str]:
+    """Human-readable lines, optionally skipping per-board entries."""
+    return [
+        record["message"] for record in records
+        if include_boards or record.get("board") is None
+    ]
+
+
+def timings_summary(records: Iterable[TimingRecord]) -> dict:
+    """API view of the ``timings`` channel: per node, and boards slowest first."""
+    nodes, boards = [], []
+    for record in records:
+        (boards if record.get("board") is not None else nodes).append(record)
+    boards.sort(key=lambda record: record["duration_ms"], reverse=True)
+    return {
+        "nodes": nodes,
+        "boards": boards,
+        "bytes": sum(record.get("bytes") or 0 for record in boards),
+    }
+
+
+JobCounts = Callable[[Any, dict], Tuple[Optional[int], Optional[int]]]
+
+
+def timed_node(name: str, node: Callable, counts: Optional[JobCounts] = None) -> Callable:
+    """Wrap a graph node so each run appends its wall time to ``timings``.
+
+    ``counts(state, update)`` returns the node's ``(jobs_in, jobs_out)``.
+    The run is also traced as a span when tracing is enabled.
+    """
+
+    @functools.wraps(node)  # Keeps the signature LangGraph inspects for ``config``
+    async def wrapper(state: Any, *args, **kwargs) -> dict:
+        with span(name) as current:
+            start = time.perf_counter()
+            update = await node(state, *args, **kwargs)
+            timing = timing_record(name, (time.perf_counter() - start) * 1000)
+            if counts is not None:
+                timing["jobs_in"], timing["jobs_out"] = counts(state, update)
+            if current is not None:
+                current["attributes"].update(timing)
+        update.setdefault("timings", []).append(timing)
+        return update
+
+    return wrapper
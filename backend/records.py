@@ -0,0 +1,153 @@
+"""Compact in-memory job records.
+
+``Job`` (backend/state.py) documents the job schema; at runtime jobs are
+``JobRecord`` instances instead of 19-key dicts:
+
+- slotted dataclass, so there is no per-job ``__dict__`` or key table;
+- repetitive fields (``source``, ``board``, ``work_type``, ``company``,
+  ``location``) are interned, so 50k jobs share a handful of strings;
+- equal descriptions share one string, so a posting repeated per office
+  or seen again on the next run is held once. They are pooled through a
+  weak table (not ``sys.intern``, whose strings are never freed on some
+  Python versions), so a description is freed with the last record using it.
+
+Records keep the dict interface (``job["title"]``, ``job.get(...)``,
+assignment), so nodes treat records and plain ``Job`` dicts (e.g. loaded
+from a cache file) the same way. Serialize with ``to_jsonable``.
+"""
+import sys
+import weakref
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field, fields
+from typing import Any, Iterator, List, Optional
+
+from backend.html_text import snippet as description_snippet
+from backend.state import Job
+
+
+INTERNED_FIELDS = frozenset({"source", "board", "work_type", "company", "location"})
+
+
+class SharedText(str):
+    """A ``str`` that can be weakly referenced, so it can sit in a weak pool."""
+    __slots__ = ("__weakref__",)
+
+
+# hash(text) -> the description string records currently share
+_descriptions: "weakref.WeakValueDictionary[int, SharedText]" = weakref.WeakValueDictionary()
+
+
+def share_description(text: Optional[str]) -> str:
+    """The pooled copy of ``text`` (pooling it if it is new); "" for None."""
+    if not text:
+        return ""
+    key = hash(text)
+    shared = _descriptions.get(key)
+    if shared is None:
+        shared = _descriptions[key] = SharedText(text)
+    elif shared != text:
+        return text  # Hash collision: keep this one unshared
+    return shared
+
+
+@dataclass(slots=True)
+class JobRecord(MutableMapping):
+    """Slotted job with the same keys as ``Job``; see the module docstring."""
+
+    source: str = ""
+    source_id: str = ""
+    board: str = ""
+    company: str = ""
+    title: str = ""
+    description: str = ""
+    location: str = ""
+    work_type: str = "onsite"
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    url: str = ""
+    posted_at: Optional[str] = None
+    skills: List[str] = field(default_factory=list)
+    summary: Optional[str] = None
+    level: Optional[str] = None
+    discipline: Optional[str] = None
+    distance_miles: Optional[float] = None
+    is_commutable: bool = False
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    urls: Optional[List[str]] = None
+    locations: Optional[List[str]] = None
+    match_score: Optional[float] = None
+
+    def __post_init__(self):
+        self.description = share_description(self.description)
+        for name in INTERNED_FIELDS:
+            value = getattr(self, name)
+            if value:
+                setattr(self, name, sys.intern(value))
+
+    @classmethod
+    def from_job(cls, job: Job) -> "JobRecord":
+        """Build a record from a ``Job`` dict, ignoring unknown keys."""
+        if isinstance(job, JobRecord):
+            return job
+        return cls(**{key: value for key, value in job.items() if key in RECORD_FIELDS})
+
+    @property
+    def snippet(self) -> str:
+        return description_snippet(self.description)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in JOB_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in JOB_KEYS else default
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "description":
+            value = share_description(value)
+        if key in RECORD_FIELDS:
+            setattr(self, key, sys.intern(value) if key in INTERNED_FIELDS and value else value)
+        else:
+            raise KeyError(f"JobRecord has no field '{key}'")
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("JobRecord fields cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(JOB_KEYS)
+
+    def __len__(self) -> int:
+        return len(JOB_KEYS)
+
+    def copy(self) -> "JobRecord":
+        return JobRecord(*(getattr(self, name) for name in RECORD_FIELDS))
+
+    def to_dict(self) -> Job:
+        """Plain ``Job`` dict of the stored fields (without the derived ``snippet``)."""
+        return {key: getattr(self, key) for key in STORED_KEYS}
+
+
+RECORD_FIELDS = tuple(f.name for f in fields(JobRecord))
+# Public keys, in Job order; ``snippet`` is derived from the description
+STORED_KEYS = RECORD_FIELDS
+JOB_KEYS = STORED_KEYS + ("snippet",)
+
+# Left out of API responses unless asked for: list views show ``snippet``
+PAYLOAD_OMITTED_FIELDS = frozenset({"description"})
+
+
+def job_payload(job: Job, include_description: bool = False) -> dict:
+    """API view of a job: every field except the full description text."""
+    payload = {key: value for key, value in job.items() if include_description or key not in PAYLOAD_OMITTED_FIELDS}
+    if "snippet" not in payload:
+        payload["snippet"] = description_snippet(job.get("description") or "")
+    return payload
+
+
+def to_jsonable(value: Any) -> Any:
+    """``json.dumps`` default hook: records become dicts, anything else a string."""
+    if isinstance(value, JobRecord):
+        return value.to_dict()
+    return str(value)
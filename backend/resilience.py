@@ -0,0 +1,204 @@
+"""Per-board resilience: adaptive timeouts, jittered retries, circuit breaker.
+
+- Timeouts: each attempt gets a timeout derived from the board's recent
+  successful latencies (a multiple of their p95), so a board that normally
+  answers in 300ms isn't given the full budget to hang.
+- Retries: timeouts, connection errors, 429 and 5xx are retried with
+  full-jitter exponential backoff, but only while the board's total deadline
+  leaves room for another attempt.
+- Circuit breaker: after ``FAILURE_THRESHOLD`` consecutive failed fetches a
+  board is skipped for ``COOLDOWN_SECONDS``; the fetch node serves its last
+  cached jobs meanwhile. The first fetch after the cooldown is a trial: a
+  success closes the circuit, a failure reopens it.
+- Priority: boards start in order of expected jobs per second (last yield
+  over median latency), so a pipeline deadline cuts off the least useful.
+
+Health (latency history, failure streak, open-until time) is kept per board
+in memory and persisted to a small JSON file under CACHE_DIR, so warm
+serverless invocations share it.
+"""
+import asyncio
+import json
+import math
+import os
+import random
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypedDict
+
+import httpx
+
+from backend.cache_files import write_json_atomic
+from backend.instrumentation import record_metric
+from backend.state import CACHE_DIR
+
+
+HEALTH_PATH = os.path.join(CACHE_DIR, "board_health.json")
+
+LATENCY_WINDOW = 20          # Recent successful latencies kept per board
+MIN_SAMPLES = 3              # History needed before the timeout adapts
+TIMEOUT_MULTIPLIER = 3.0     # Attempt timeout = p95 latency x this...
+MIN_ATTEMPT_TIMEOUT = 2.0    # ...but never below this (seconds)
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 0.25
+BACKOFF_CAP_SECONDS = 2.0
+FAILURE_THRESHOLD = 3        # Consecutive failed fetches that open the circuit
+COOLDOWN_SECONDS = 15 * 60
+
+
+class BoardHealth(TypedDict):
+    latencies: List[float]   # Seconds, most recent last
+    jobs: Optional[int]      # Jobs from the last successful fetch
+    failures: int            # Consecutive failed fetches
+    open_until: float        # Unix time the circuit stays open until (0 = closed)
+    last_error: Optional[str]
+
+
+def board_key(source: str, slug: str) -> str:
+    return f"{source}:{slug}"
+
+
+class BoardHealthRegistry:
+    """Health of every board, loaded lazily from and saved to ``path``."""
+
+    def __init__(self, path: str = HEALTH_PATH):
+        self.path = path
+        self._boards: Optional[Dict[str, BoardHealth]] = None
+
+    def _load(self) -> Dict[str, BoardHealth]:
+        if self._boards is None:
+            try:
+                with open(self.path) as f:
+                    self._boards = json.load(f)
+            except (OSError, ValueError):
+                self._boards = {}
+        return self._boards
+
+    def get(self, key: str) -> BoardHealth:
+        boards = self._load()
+        if key not in boards:
+            boards[key] = {"latencies": [], "jobs": None, "failures": 0, "open_until": 0.0,
+                           "last_error": None}
+        return boards[key]
+
+    def timeout_for(self, key: str, default: float) -> float:
+        """Attempt timeout from the board's latency history, capped at ``default``."""
+        latencies = self.get(key)["latencies"]
+        if len(latencies) < MIN_SAMPLES:
+            return default
+        ordered = sorted(latencies)
+        p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+        return min(default, max(MIN_ATTEMPT_TIMEOUT, p95 * TIMEOUT_MULTIPLIER))
+
+    def prioritize(self, keys: List[str]) -> List[str]:
+        """Order ``keys`` by expected jobs per second, best first.
+
+        Boards without history are assumed average, so new boards still run
+        early while proven slow or empty boards go last under a deadline.
+        """
+        health = [self.get(key) for key in keys]
+        yields = [h["jobs"] for h in health if h.get("jobs") is not None]
+        latencies = [statistics.median(h["latencies"]) for h in health if h["latencies"]]
+        default_yield = statistics.fmean(yields) if yields else 1.0
+        default_latency = statistics.median(latencies) if latencies else 1.0
+
+        def rate(h: BoardHealth) -> float:
+            jobs = h["jobs"] if h.get("jobs") is not None else default_yield
+            latency = statistics.median(h["latencies"]) if h["latencies"] else default_latency
+            return jobs / max(latency, 0.001)
+
+        return [key for _, key in sorted(zip(health, keys), key=lambda pair: -rate(pair[0]))]
+
+    def open_for(self, key: str) -> float:
+        """Seconds left on an open circuit, 0 when requests may go through."""
+        return max(0.0, self.get(key)["open_until"] - time.time())
+
+    def record_latency(self, key: str, seconds: float) -> None:
+        latencies = self.get(key)["latencies"]
+        latencies.append(round(seconds, 3))
+        del latencies[:-LATENCY_WINDOW]
+
+    def record_success(self, key: str, jobs: int) -> None:
+        health = self.get(key)
+        health.update(jobs=jobs, failures=0, open_until=0.0, last_error=None)
+
+    def record_failure(self, key: str, error: str) -> None:
+        health = self.get(key)
+        health["failures"] += 1
+        health["last_error"] = error
+        if health["failures"] >= FAILURE_THRESHOLD:
+            health["open_until"] = time.time() + COOLDOWN_SECONDS
+
+    def save(self) -> None:
+        if self._boards is None:
+            return
+        try:
+            write_json_atomic(self.path, self._boards)
+        except OSError:
+            pass  # Health is an optimization; losing it only resets the history
+
+
+_registry: Optional[BoardHealthRegistry] = None
+
+
+def get_board_health() -> BoardHealthRegistry:
+    """Return the process-wide board health registry."""
+    global _registry
+    if _registry is None:
+        _registry = BoardHealthRegistry()
+    return _registry
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Timeouts, transport errors, 429 and 5xx are worth another attempt."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, (asyncio.TimeoutError, httpx.TransportError))
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number ``attempt + 1``."""
+    return random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+async def call_with_retries(
+    call: Callable[[], Awaitable[Any]],
+    key: str,
+    deadline: float,
+    default_timeout: float,
+    registry: Optional[BoardHealthRegistry] = None,
+) -> Any:
+    """Run ``call`` with adaptive per-attempt timeouts and jittered retries.
+
+    ``deadline`` is an event-loop time bounding all attempts and backoff
+    sleeps. The last error is raised once attempts or budget run out.
+    """
+    registry = registry or get_board_health()
+    loop = asyncio.get_running_loop()
+    attempt = 0
+    while True:
+        timeout = min(registry.timeout_for(key, default_timeout), deadline - loop.time())
+        start = loop.time()
+        try:
+            try:
+                value = await asyncio.wait_for(call(), max(timeout, 0.0))
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f"timed out after {timeout:.1f}s") from None
+        except asyncio.CancelledError:
+            # Cut off by the pipeline deadline: the elapsed time is a lower
+            # bound on the latency, enough to rank the board lower next time
+            registry.record_latency(key, loop.time() - start)
+            raise
+        except Exception as e:
+            if not is_retryable(e) or attempt + 1 >= MAX_ATTEMPTS:
+                raise
+            delay = backoff_delay(attempt)
+            if deadline - loop.time() - delay < MIN_ATTEMPT_TIMEOUT:
+                raise  # No budget left for a meaningful attempt
+            attempt += 1
+            record_metric("retries", 1, add=True)
+            await asyncio.sleep(delay)
+            continue
+        registry.record_latency(key, loop.time() - start)
+        return value
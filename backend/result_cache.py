@@ -0,0 +1,201 @@
+"""Stale-while-revalidate cache for full pipeline results.
+
+The API serves the last good snapshot immediately. Once it is older than the
+TTL, a refresh starts in the background while callers keep getting the stale
+snapshot. Concurrent refreshes with the same arguments collapse onto one
+in-flight pipeline run (single-flight), so many dashboard users never
+trigger duplicate fetches.
+
+Snapshots are persisted through a pluggable backend (pre-serialized files,
+see backend/snapshot_store.py, or SQLite) so a warm restart can serve the
+previous result right away.
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypedDict
+
+from backend.records import to_jsonable
+from backend.snapshot_store import SnapshotStore
+from backend.state import CACHE_DIR
+
+
+RESULT_TTL_SECONDS = float(os.environ.get("BAY_AREA_RADAR_RESULT_TTL", 15 * 60))
+RESULT_CACHE_BACKEND = os.environ.get("BAY_AREA_RADAR_RESULT_CACHE", "file")  # file | sqlite | memory
+
+
+class Snapshot(TypedDict):
+    created_at: float        # Unix time the pipeline run finished
+    value: Any               # JSON-serializable API response
+
+
+class CacheInfo(TypedDict):
+    """Cache metadata returned alongside each response."""
+    status: str              # 'hit', 'stale' or 'miss'
+    age_seconds: float
+    refreshing: bool         # A background refresh is in flight
+    last_error: Optional[str]
+
+
+class MemoryBackend:
+    """Keeps the snapshot in process memory only."""
+
+    def __init__(self):
+        self._snapshot: Optional[Snapshot] = None
+
+    def load(self) -> Optional[Snapshot]:
+        return self._snapshot
+
+    def save(self, snapshot: Snapshot) -> None:
+        self._snapshot = snapshot
+
+
+class SQLiteBackend:
+    """Stores snapshots in a SQLite table keyed by name."""
+
+    def __init__(self, path: str = os.path.join(CACHE_DIR, "results.db"), key: str = "jobs"):
+        self.path = path
+        self.key = key
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots "
+                "(key TEXT PRIMARY KEY, created_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def load(self) -> Optional[Snapshot]:
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT created_at, value FROM snapshots WHERE key = ?", (self.key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return {"created_at": row[0], "value": json.loads(row[1])}
+
+    def save(self, snapshot: Snapshot) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots (key, created_at, value) VALUES (?, ?, ?)",
+                (self.key, snapshot["created_at"], json.dumps(snapshot["value"], default=to_jsonable)),
+            )
+
+
+def create_backend(name: str = RESULT_CACHE_BACKEND):
+    """Build a snapshot backend by name."""
+    if name == "sqlite":
+        return SQLiteBackend()
+    if name == "memory":
+        return MemoryBackend()
+    return SnapshotStore()
+
+
+class ResultCache:
+    """Single-flight, stale-while-revalidate cache around an async compute.
+
+    Must be used from a single event loop (see backend/runtime.py).
+    """
+
+    def __init__(
+        self,
+        compute: Callable[..., Awaitable[Any]],
+        backend=None,
+        ttl: float = RESULT_TTL_SECONDS,
+    ):
+        self.compute = compute
+        self.backend = backend if backend is not None else create_backend()
+        self.ttl = ttl
+        self._snapshot: Optional[Snapshot] = None
+        self._inflight: Dict[Tuple, asyncio.Task] = {}  # Keyed by compute kwargs
+        self._last_error: Optional[str] = None
+
+    def _load(self) -> Optional[Snapshot]:
+        if self._snapshot is None:
+            try:
+                self._snapshot = self.backend.load()
+            except Exception:
+                self._snapshot = None
+        return self._snapshot
+
+    @property
+    def created_at(self) -> Optional[float]:
+        """When the snapshot held in memory was computed (None if none is loaded)."""
+        return self._snapshot["created_at"] if self._snapshot is not None else None
+
+    @property
+    def last_error(self) -> Optional[str]:
+        return self._last_error
+
+    def _info(self, status: str, snapshot: Snapshot) -> CacheInfo:
+        return {
+            "status": status,
+            "age_seconds": round(max(0.0, time.time() - snapshot["created_at"]), 1),
+            "refreshing": bool(self._inflight),
+            "last_error": self._last_error,
+        }
+
+    async def get(self, force_refresh: bool = False, **kwargs) -> Tuple[Any, CacheInfo]:
+        """Return ``(value, info)``, serving stale data while refreshing.
+
+        ``kwargs`` are passed to ``compute`` when this call starts a run.
+        """
+        snapshot = self._load()
+
+        if snapshot is None or force_refresh:
+            snapshot = await self.refresh(**kwargs)
+            return snapshot["value"], self._info("miss", snapshot)
+
+        if time.time() - snapshot["created_at"] > self.ttl:
+            self._start_refresh(**kwargs)
+            return snapshot["value"], self._info("stale", snapshot)
+
+        return snapshot["value"], self._info("hit", snapshot)
+
+    async def refresh(self, **kwargs) -> Snapshot:
+        """Run compute, or join the run with the same ``kwargs`` already in flight.
+
+        A run with other arguments (a full ``force_refresh`` while an
+        incremental one is in flight) starts alongside it rather than
+        returning the other run's result.
+        """
+        task = self._start_refresh(**kwargs)
+        return await asyncio.shield(task)
+
+    async def revalidate(self, **kwargs) -> None:
+        """Start a background refresh, unless a matching one is in flight, without waiting."""
+        self._start_refresh(**kwargs)
+
+    def _start_refresh(self, **kwargs) -> asyncio.Task:
+        key = tuple(sorted(kwargs.items()))
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(self._run(**kwargs))
+            task.add_done_callback(partial(self._refresh_done, key))
+        return task
+
+    async def _run(self, **kwargs) -> Snapshot:
+        self._last_error = None
+        value = await self.compute(**kwargs)
+        snapshot: Snapshot = {"created_at": time.time(), "value": value}
+        self._snapshot = snapshot
+        try:
+            self.backend.save(snapshot)
+        except Exception as e:
+            self._last_error = f"Snapshot save failed: {e}"
+        return snapshot
+
+    def _refresh_done(self, key: Tuple, task: asyncio.Task) -> None:
+        del self._inflight[key]
+        if task.cancelled():
+            return
+        error = task.exception()  # Also marks a background failure as retrieved
+        if error:
+            self._last_error = f"Refresh failed: {error}"
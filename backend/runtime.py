@@ -0,0 +1,62 @@
+"""Long-lived event loop for the synchronous serverless handlers.
+
+``BaseHTTPRequestHandler`` methods are synchronous, so each request hands its
+coroutine to one event loop running in a daemon thread. Keeping a single loop
+lets pooled HTTP connections, single-flight refreshes and background tasks
+outlive the request that started them.
+"""
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use."""
+    global _loop
+
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_loop.run_forever, name="bay-area-radar-loop", daemon=True)
+            thread.start()
+    return _loop
+
+
+def run_sync(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the background loop and block for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result(timeout)
+
+
+def iterate_sync(agen: AsyncIterator[Any]) -> Iterator[Any]:
+    """Consume an async generator from a synchronous handler thread.
+
+    Items are handed over as soon as they are produced. Closing the returned
+    iterator early (e.g. client disconnect) cancels the producer.
+    """
+    items: "queue.Queue" = queue.Queue()
+    done = object()
+
+    async def pump():
+        try:
+            async for item in agen:
+                items.put((True, item))
+        except Exception as e:
+            items.put((False, e))
+        finally:
+            items.put((True, done))
+
+    future = asyncio.run_coroutine_threadsafe(pump(), get_loop())
+    try:
+        while True:
+            ok, item = items.get()
+            if not ok:
+                raise item
+            if item is done:
+                return
+            yield item
+    finally:
+        future.cancel()
@@ -0,0 +1,213 @@
+"""Skill extraction from job descriptions and keyword match scoring.
+
+Like backend/titles.py, the whole skill dictionary is compiled once into a
+single regex, so extracting skills is one ``finditer`` scan per description
+(plus one for the few case-sensitive names). Descriptions rarely change
+between runs, so results are memoized by a hash of the description text, in
+memory and in a persistent cache file under CACHE_DIR.
+
+Scoring then only looks at the title and the extracted skills, never the
+description again, so re-scoring a job with memoized skills is cheap.
+"""
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from backend.cache_files import JsonCache
+from backend.state import CACHE_DIR
+
+
+SKILL_CACHE_PATH = os.path.join(CACHE_DIR, "skills_cache.json")
+MAX_SCAN_CHARS = 20000           # Skills are named early; don't scan legal boilerplate
+MAX_SKILL_CACHE_ENTRIES = 50000  # Beyond this, flush keeps only this process's entries
+
+# Display name -> patterns, matched on lowercased text as whole words
+SKILL_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "Python": (r"python",),
+    "Java": (r"java",),
+    "Kotlin": (r"kotlin",),
+    "Scala": (r"scala",),
+    "Go": (r"golang",),
+    "Rust": (r"rust",),
+    "C++": (r"c\+\+", r"cpp"),
+    "C#": (r"c#", r"\.net", r"asp\.net"),
+    "Ruby": (r"ruby", r"ruby on rails"),
+    "TypeScript": (r"typescript",),
+    "JavaScript": (r"javascript", r"ecmascript"),
+    "Swift": (r"swiftui",),
+    "Objective-C": (r"objective-c",),
+    "PHP": (r"php",),
+    "Elixir": (r"elixir",),
+    "SQL": (r"sql",),
+    "React": (r"react\.js", r"reactjs"),
+    "React Native": (r"react native",),
+    "Next.js": (r"next\.js", r"nextjs"),
+    "Vue": (r"vue", r"vue\.js"),
+    "Angular": (r"angular",),
+    "Node.js": (r"node\.js", r"nodejs"),
+    "GraphQL": (r"graphql",),
+    "gRPC": (r"grpc",),
+    "AWS": (r"aws", r"amazon web services"),
+    "GCP": (r"gcp", r"google cloud"),
+    "Azure": (r"azure",),
+    "Kubernetes": (r"kubernetes", r"k8s"),
+    "Docker": (r"docker",),
+    "Terraform": (r"terraform",),
+    "Linux": (r"linux",),
+    "PostgreSQL": (r"postgres", r"postgresql"),
+    "MySQL": (r"mysql",),
+    "MongoDB": (r"mongodb", r"mongo"),
+    "Redis": (r"redis",),
+    "Kafka": (r"kafka",),
+    "Spark": (r"apache spark", r"pyspark", r"spark sql", r"spark streaming"),
+    "Airflow": (r"airflow",),
+    "Snowflake": (r"snowflake",),
+    "BigQuery": (r"bigquery",),
+    "DynamoDB": (r"dynamodb",),
+    "Elasticsearch": (r"elasticsearch", r"opensearch"),
+    "PyTorch": (r"pytorch",),
+    "TensorFlow": (r"tensorflow",),
+    "LLMs": (r"llms?", r"large language models?"),
+    "Machine Learning": (r"machine learning",),
+    "Distributed Systems": (r"distributed systems",),
+    "Microservices": (r"microservices?",),
+    "CI/CD": (r"ci/cd", r"continuous integration"),
+}
+
+# Names that are also common words, matched case-sensitively ("Go", not "go";
+# "React", not "react to incidents"; "Spark", not "we spark creativity";
+# "Rails", not "guard rails"). "Go-" and "Go to" are "go-to-market", not the
+# language.
+CASE_SENSITIVE_SKILL_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "Go": (r"Go(?!-|\s+to\b)",),
+    "Swift": (r"Swift",),
+    "React": (r"React",),
+    "React Native": (r"React Native",),  # So "React Native" isn't also "React"
+    "Spark": (r"Spark",),
+    "Ruby": (r"Rails",),
+}
+
+
+def _compile(patterns: Dict[str, Tuple[str, ...]]) -> re.Pattern:
+    # One flat alternation, longest first so "react native" beats "react".
+    # (Named groups per skill, as in titles.py, make this scan ~5x slower.)
+    alternatives = sorted({p for skill_patterns in patterns.values() for p in skill_patterns}, key=len, reverse=True)
+    # Whole words only; "+", "#" and "." may end a name but not run on from one,
+    # and "-free"/"-proof" compounds ("rust-free") aren't mentions
+    return re.compile(rf"(?<![\w.+#])(?:{'|'.join(alternatives)})(?![\w+#]|\.\w|-(?:free|proof)\b)")
+
+
+SKILL_PATTERN = _compile(SKILL_PATTERNS)
+CASE_SENSITIVE_SKILL_PATTERN = _compile(CASE_SENSITIVE_SKILL_PATTERNS)
+# Leading word of each pattern: the case-sensitive scan is skipped when none occurs
+_CASE_SENSITIVE_LITERALS = sorted({
+    re.match(r"\w+", p).group() for patterns in CASE_SENSITIVE_SKILL_PATTERNS.values() for p in patterns
+})
+_SKILL_MATCHERS = [
+    (skill, re.compile("|".join(patterns)))
+    for table in (SKILL_PATTERNS, CASE_SENSITIVE_SKILL_PATTERNS)
+    for skill, patterns in table.items()
+]
+
+
+@lru_cache(maxsize=1024)
+def _skill_named(text: str) -> Optional[str]:
+    """The skill a matched piece of text names."""
+    for skill, pattern in _SKILL_MATCHERS:
+        if pattern.fullmatch(text):
+            return skill
+    return None
+
+
+def extract_skills(text: str) -> List[str]:
+    """Skills named in ``text``, in order of first mention."""
+    text = text[:MAX_SCAN_CHARS]
+    matches = [(match.start(), match.group()) for match in SKILL_PATTERN.finditer(text.lower())]
+    if any(literal in text for literal in _CASE_SENSITIVE_LITERALS):
+        matches += [(match.start(), match.group()) for match in CASE_SENSITIVE_SKILL_PATTERN.finditer(text)]
+        matches.sort()
+    return list(dict.fromkeys(_skill_named(matched) for _, matched in matches))
+
+
+def description_digest(description: str) -> str:
+    """Short, stable hash of a description (the memoization key)."""
+    return hashlib.blake2b(description.encode(), digest_size=8).hexdigest()
+
+
+class SkillCache(JsonCache):
+    """Persistent map of description digest -> extracted skills.
+
+    Keyed by a fingerprint of the skill patterns, so editing the dictionary
+    invalidates old entries.
+    """
+
+    def __init__(self, path: str = SKILL_CACHE_PATH):
+        super().__init__(path, dictionary_fingerprint, max_entries=MAX_SKILL_CACHE_ENTRIES)
+
+
+@lru_cache(maxsize=1)
+def dictionary_fingerprint() -> str:
+    """Hash of the skill dictionary."""
+    tables = [SKILL_PATTERNS, CASE_SENSITIVE_SKILL_PATTERNS]
+    return hashlib.sha1(json.dumps(tables, sort_keys=True).encode()).hexdigest()[:12]
+
+
+skill_cache = SkillCache()
+
+
+def description_skills(description: str) -> List[str]:
+    """``extract_skills`` memoized by the description's hash."""
+    key = description_digest(description)
+    skills = skill_cache.get(key)
+    if skills is None:
+        skills = extract_skills(description)
+        skill_cache.put(key, skills)
+    return skills
+
+
+def flush_skill_cache() -> None:
+    """Persist newly extracted descriptions (call once per pipeline run)."""
+    skill_cache.flush()
+
+
+def merge_skills(tags: Iterable[str], extracted: Iterable[str]) -> List[str]:
+    """Source tags first, then extracted skills they don't already name."""
+    merged: Dict[str, str] = {}
+    for skill in (*tags, *extracted):
+        merged.setdefault(skill.lower(), skill)
+    return list(merged.values())
+
+
+@lru_cache(maxsize=64)
+def _keyword_matchers(keywords: Tuple[str, ...]) -> List[Tuple[re.Pattern, Optional[str]]]:
+    """Per keyword: a title pattern and the skill it names (if any)."""
+    matchers = []
+    for keyword in keywords:
+        # A keyword is chosen, not prose: "react" or "go" means the skill
+        skills = extract_skills(keyword) or extract_skills(keyword.title())
+        matchers.append((
+            re.compile(rf"\b{re.escape(keyword)}", re.IGNORECASE),
+            skills[0].lower() if skills else None,
+        ))
+    return matchers
+
+
+def match_score(title: str, skills: Sequence[str], keywords: Sequence[str]) -> float:
+    """Share of ``keywords`` a job matches, 0-100.
+
+    A keyword in the title counts fully; one that names a skill the job
+    lists (e.g. "golang" for "Go") counts half.
+    """
+    if not keywords:
+        return 0.0
+    job_skills = {skill.lower() for skill in skills}
+    points = 0.0
+    for pattern, skill in _keyword_matchers(tuple(keyword.lower() for keyword in keywords)):
+        if pattern.search(title):
+            points += 1.0
+        elif skill is not None and skill in job_skills:
+            points += 0.5
+    return round(100 * points / len(keywords), 1)
@@ -0,0 +1,160 @@
+"""Versioned, pre-serialized snapshots of the jobs response.
+
+Each pipeline run (the daily cron, or a refresh) serializes its response
+once and writes it under SNAPSHOT_DIR as ready-to-send bodies:
+
+    <version>.json       the JSON body
+    <version>.json.gz    gzip of it
+    <version>.json.br    brotli of it (when brotli is installed)
+    current.json         manifest naming the current version
+
+The body files are written first and the manifest is swapped in last
+(atomic rename), so a reader sees either the old version or the new one,
+never a mix. The version is the format number plus a hash of the body,
+and each variant's ETag is precomputed in the manifest.
+
+``/api/jobs`` then answers the default query by sending these bytes as-is:
+no pipeline run, JSON encoding or compression on the request path.
+
+SNAPSHOT_DIR is local disk, so only processes sharing it (one server, or
+a container with a volume) see the cron's snapshot; serverless instances
+each have their own /tmp and fall back to running the pipeline.
+"""
+import gzip
+import json
+import os
+from typing import Dict, Optional, Tuple, TypedDict
+
+from backend.api_response import EncodedBody, body_digest, dumps, make_etag, negotiate_encoding
+from backend.cache_files import write_atomic
+from backend.state import CACHE_DIR
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip variant only
+    brotli = None
+
+
+SNAPSHOT_DIR = os.environ.get("BAY_AREA_RADAR_SNAPSHOT_DIR", os.path.join(CACHE_DIR, "snapshots"))
+SNAPSHOT_FORMAT = 1          # Bump when the response layout changes
+KEEP_VERSIONS = 3            # Older bodies are deleted; readers may still be sending these
+# Compressed once per run, not per request, so use the best ratios
+SNAPSHOT_GZIP_LEVEL = 9
+SNAPSHOT_BROTLI_QUALITY = 11
+
+MANIFEST_NAME = "current.json"
+SUFFIXES = {None: ".json", "gzip": ".json.gz", "br": ".json.br"}
+
+
+class SnapshotManifest(TypedDict):
+    format: int
+    version: str             # "<format>-<body hash>"
+    created_at: float        # Unix time the pipeline run finished
+    files: Dict[str, str]    # Content coding ("identity", "gzip", "br") -> file name
+    sizes: Dict[str, int]    # Content coding -> bytes
+    etags: Dict[str, str]    # Content coding -> ETag
+
+
+class SnapshotStore:
+    """Snapshot backend for ``ResultCache`` that also serves encoded bodies."""
+
+    def __init__(self, directory: str = SNAPSHOT_DIR):
+        self.directory = directory
+        self._manifest: Optional[SnapshotManifest] = None
+        self._manifest_mtime: Optional[float] = None
+        self._bodies: Dict[Tuple[str, str], bytes] = {}
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def manifest(self) -> Optional[SnapshotManifest]:
+        """The current version's manifest (re-read only when it changes)."""
+        path = self._path(MANIFEST_NAME)
+        try:
+            mtime = os.stat(path).st_mtime
+            if mtime != self._manifest_mtime:
+                with open(path) as f:
+                    manifest = json.load(f)
+                if manifest.get("format") != SNAPSHOT_FORMAT:
+                    return None
+                self._manifest, self._manifest_mtime = manifest, mtime
+        except (OSError, ValueError):
+            return None
+        return self._manifest
+
+    def _read(self, manifest: SnapshotManifest, coding: str) -> bytes:
+        key = (manifest["version"], coding)
+        body = self._bodies.get(key)
+        if body is None:
+            with open(self._path(manifest["files"][coding]), "rb") as f:
+                body = f.read()
+            self._bodies = {k: v for k, v in self._bodies.items() if k[0] == manifest["version"]}
+            self._bodies[key] = body
+        return body
+
+    def encoded(self, accept_encoding: Optional[str]) -> Optional[Tuple[SnapshotManifest, EncodedBody]]:
+        """The current snapshot's body in the best coding the client accepts."""
+        manifest = self.manifest()
+        if manifest is None:
+            return None
+        encoding = negotiate_encoding(accept_encoding, [c for c in ("br", "gzip") if c in manifest["files"]])
+        coding = encoding or "identity"
+        try:
+            body = self._read(manifest, coding)
+        except OSError:
+            return None  # Pruned by a newer run; the caller falls back to the cache
+        return manifest, EncodedBody(body, encoding, manifest["etags"][coding])
+
+    def load(self) -> Optional[dict]:
+        """The current snapshot as ``{created_at, value}`` (parses the JSON body)."""
+        manifest = self.manifest()
+        if manifest is None:
+            return None
+        try:
+            value = json.loads(self._read(manifest, "identity"))
+        except (OSError, ValueError):
+            return None
+        return {"created_at": manifest["created_at"], "value": value}
+
+    def save(self, snapshot: dict) -> None:
+        """Serialize, compress and publish a new snapshot version."""
+        body = dumps(snapshot["value"])
+        digest = body_digest(body)
+        version = f"{SNAPSHOT_FORMAT}-{digest[:16]}"
+
+        variants = {"identity": body, "gzip": gzip.compress(body, compresslevel=SNAPSHOT_GZIP_LEVEL, mtime=0)}
+        if brotli is not None:
+            variants["br"] = brotli.compress(body, quality=SNAPSHOT_BROTLI_QUALITY)
+
+        files = {}
+        for coding, data in variants.items():
+            files[coding] = version + SUFFIXES[None if coding == "identity" else coding]
+            write_atomic(self._path(files[coding]), data)
+
+        manifest: SnapshotManifest = {
+            "format": SNAPSHOT_FORMAT,
+            "version": version,
+            "created_at": snapshot["created_at"],
+            "files": files,
+            "sizes": {coding: len(data) for coding, data in variants.items()},
+            "etags": {coding: make_etag(digest, None if coding == "identity" else coding) for coding in variants},
+        }
+        write_atomic(self._path(MANIFEST_NAME), json.dumps(manifest).encode())
+        self._prune(version)
+
+    def _prune(self, current: str) -> None:
+        """Delete body files of all but the newest KEEP_VERSIONS versions."""
+        try:
+            names = [name for name in os.listdir(self.directory)
+                     if name != MANIFEST_NAME and ".json" in name and not name.endswith(".tmp")]
+            by_version: Dict[str, float] = {}
+            for name in names:
+                version = name.split(".json", 1)[0]
+                mtime = os.stat(self._path(name)).st_mtime
+                by_version[version] = max(mtime, by_version.get(version, 0.0))
+            keep = {current, *sorted(by_version, key=by_version.get, reverse=True)[:KEEP_VERSIONS]}
+            for name in names:
+                if name.split(".json", 1)[0] not in keep:
+                    os.remove(self._path(name))
+        except OSError:
+            pass  # Best effort; a leftover file is harmless
@@ -0,0 +1,25 @@
+"""Job source adapters and their registry.
+
+Importing this package registers every built-in adapter. Each adapter
+implements ``fetch(client, board)``; boards come from backend/data/boards.json.
+"""
+from .base import (
+    Board,
+    SourceAdapter,
+    SOURCE_ADAPTERS,
+    register_source,
+    get_adapter,
+    load_boards,
+    make_job,
+)
+from . import remotive, greenhouse, lever  # noqa: F401  (registers adapters)
+
+__all__ = [
+    'Board',
+    'SourceAdapter',
+    'SOURCE_ADAPTERS',
+    'register_source',
+    'get_adapter',
+    'load_boards',
+    'make_job',
+]
@@ -0,0 +1,198 @@
+"""Common interface and helpers for job source adapters."""
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Type, TypedDict
+
+import httpx
+
+from backend.state import Job
+from backend.html_text import html_to_text
+from backend.http_cache import fetch_cached, fetch_cached_stream, get_cache
+from backend.instrumentation import record_metric
+from backend.json_stream import ItemStream
+from backend.records import JobRecord
+from backend.titles import TITLE_PATTERN, TitleLabels, classify_title, classify_titles
+
+
+BOARDS_PATH = os.environ.get(
+    "BAY_AREA_RADAR_BOARDS",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "boards.json"),
+)
+
+# Bump when parsed jobs change (parse_item, make_job, html_to_text, the Job
+# fields), so the HTTP cache stops reusing jobs parsed the old way
+PARSER_VERSION = "3"
+
+
+@lru_cache(maxsize=1)
+def parser_fingerprint() -> str:
+    """Hash of the parser version and the title dictionary."""
+    return hashlib.sha1(f"{PARSER_VERSION}:{TITLE_PATTERN.pattern}".encode()).hexdigest()[:12]
+
+
+class Board(TypedDict, total=False):
+    """One board (company, or category for aggregators) of a source."""
+    slug: str
+    company: str
+
+
+class SourceAdapter:
+    """Fetches and normalizes jobs for one board of a source type.
+
+    Subclasses describe the endpoint (``url``/``params``), where the job
+    array lives in the payload and how to turn one item into a Job
+    (``parse_item``). Titles are classified before an item is normalized,
+    and by default the body is parsed as it streams in, one item at a time,
+    so large payloads are never held whole. Override ``fetch`` for anything else.
+    """
+
+    name: str = ""           # Registry key, also used as Job.source
+    label: str = ""          # Human-readable name for progress messages
+    host: str = ""           # API host, for per-host concurrency caps
+    items_key: Optional[str] = "jobs"   # Payload key of the job array; None for a top-level array
+    title_field: str = "title"
+    stream: bool = True      # Parse incrementally (backend/json_stream.py)
+
+    def url(self, board: Board) -> str:
+        raise NotImplementedError
+
+    def params(self, board: Board) -> Optional[Dict[str, Any]]:
+        return None
+
+    def parse_item(self, item: Dict[str, Any], labels: TitleLabels, board: Board) -> Job:
+        raise NotImplementedError
+
+    def _parse_target(self, item: Dict[str, Any], labels: TitleLabels, board: Board) -> Job:
+        job = self.parse_item(item, labels, board)
+        job["board"] = board["slug"]
+        return job
+
+    def parse(self, data: Any, board: Board) -> List[Job]:
+        """Filter and normalize a fully decoded payload."""
+        items = data if self.items_key is None else data.get(self.items_key, [])
+        titles = [item.get(self.title_field) or "" for item in items]
+        jobs = [
+            self._parse_target(item, labels, board)
+            for item, labels in zip(items, classify_titles(titles))
+            if labels.is_target
+        ]
+        record_metric("jobs_in", len(items))
+        record_metric("jobs_out", len(jobs))
+        return jobs
+
+    async def parse_stream(self, chunks: AsyncIterator[bytes], board: Board) -> List[Job]:
+        """Filter and normalize items as the body arrives, holding one item at a time."""
+        stream = ItemStream(self.items_key)
+        jobs: List[Job] = []
+        seen = 0
+        parse_seconds = 0.0
+
+        def keep_targets(items: List[Any]) -> None:
+            nonlocal seen
+            seen += len(items)
+            for item in items:
+                labels = classify_title(item.get(self.title_field) or "")
+                if labels.is_target:
+                    jobs.append(self._parse_target(item, labels, board))
+
+        async for chunk in chunks:
+            start = time.perf_counter()  # Parse time excludes waiting on the network
+            keep_targets(stream.feed(chunk))
+            parse_seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        keep_targets(stream.close())
+        parse_seconds += time.perf_counter() - start
+        record_metric("jobs_in", seen)
+        record_metric("jobs_out", len(jobs))
+        record_metric("parse_ms", parse_seconds * 1000, add=True)
+        return jobs
+
+    async def fetch(self, client: httpx.AsyncClient, board: Board) -> List[Job]:
+        """Fetch one board; a missing board (404) yields no jobs."""
+        # Conditional request: a 304 reuses the jobs parsed on the last run
+        if self.stream:
+            jobs, status = await fetch_cached_stream(
+                client,
+                self.url(board),
+                parse_stream=lambda chunks: self.parse_stream(chunks, board),
+                params=self.params(board),
+                version=parser_fingerprint(),
+            )
+        else:
+            jobs, status = await fetch_cached(
+                client,
+                self.url(board),
+                parse=lambda response: self.parse(response.json(), board),
+                params=self.params(board),
+                version=parser_fingerprint(),
+            )
+        if status == 404:
+            return []
+        if status == 304:
+            # Cached values were stored as JSON dicts
+            record_metric("jobs_out", len(jobs))
+            return [JobRecord.from_job(job) for job in jobs]
+        return jobs
+
+    def cached_jobs(self, board: Board) -> Optional[List[Job]]:
+        """The board's jobs from its last successful fetch, if still cached (and
+        parsed by this version of the parser)."""
+        cache = get_cache()
+        url = str(httpx.URL(self.url(board), params=self.params(board)))
+        entry = cache.get(url, parser_fingerprint()) if cache else None
+        if not entry or entry.get("value") is None:
+            return None
+        return [JobRecord.from_job(job) for job in entry["value"]]
+
+
+SOURCE_ADAPTERS: Dict[str, SourceAdapter] = {}
+
+
+def register_source(cls: Type[SourceAdapter]) -> Type[SourceAdapter]:
+    """Class decorator adding an adapter to the registry."""
+    SOURCE_ADAPTERS[cls.name] = cls()
+    return cls
+
+
+def get_adapter(name: str) -> SourceAdapter:
+    return SOURCE_ADAPTERS[name]
+
+
+@lru_cache(maxsize=None)
+def load_boards(path: str = BOARDS_PATH) -> Dict[str, List[Board]]:
+    """Boards per source from the declarative config file."""
+    with open(path) as f:
+        data = json.load(f)
+    return {source: boards for source, boards in data.items() if not source.startswith("_")}
+
+
+def work_type_from_location(location: str) -> str:
+    """Infer remote/hybrid/onsite from a location string."""
+    location_lower = location.lower() if location else ""
+    if "remote" in location_lower:
+        return "remote"
+    if "hybrid" in location_lower:
+        return "hybrid"
+    return "onsite"
+
+
+def make_job(source: str, source_id: str, company: str, title: str, **fields) -> Job:
+    """Build a compact job record with computed fields reset.
+
+    The description is converted from the board's markup to capped plain text.
+    """
+    work_type = fields.pop("work_type", "onsite")
+    description = html_to_text(fields.pop("description", ""))
+    return JobRecord(
+        source=source,
+        source_id=source_id,
+        company=company,
+        title=title,
+        description=description,
+        work_type=work_type,
+        is_commutable=work_type == "remote",  # Remote is always commutable
+        **fields,
+    )
@@ -0,0 +1,38 @@
+"""Greenhouse job boards (Bay Area startups)."""
+from typing import Any, Dict, Optional
+
+from backend.state import Job
+from backend.sources.base import Board, SourceAdapter, register_source, make_job, work_type_from_location
+from backend.titles import TitleLabels
+
+
+@register_source
+class GreenhouseSource(SourceAdapter):
+    name = "greenhouse"
+    label = "Greenhouse"
+    host = "boards-api.greenhouse.io"
+
+    def url(self, board: Board) -> str:
+        return f"https://{self.host}/v1/boards/{board['slug']}/jobs"
+
+    def params(self, board: Board) -> Optional[Dict[str, Any]]:
+        # content=true inlines every description; streaming keeps that cheap
+        return {"content": "true"}
+
+    def parse_item(self, item: Dict[str, Any], labels: TitleLabels, board: Board) -> Job:
+        location_data = item.get("location", {})
+        location = location_data.get("name", "") if isinstance(location_data, dict) else str(location_data)
+
+        return make_job(
+            "greenhouse",
+            str(item.get("id", "")),
+            board.get("company", ""),
+            item.get("title", ""),
+            description=item.get("content", ""),
+            location=location,
+            work_type=work_type_from_location(location),
+            url=item.get("absolute_url", ""),
+            posted_at=item.get("updated_at"),
+            level=labels.level,
+            discipline=labels.discipline,
+        )
@@ -0,0 +1,38 @@
+"""Lever job boards (Bay Area companies)."""
+from typing import Any, Dict
+
+from backend.state import Job
+from backend.sources.base import Board, SourceAdapter, register_source, make_job, work_type_from_location
+from backend.titles import TitleLabels
+
+
+@register_source
+class LeverSource(SourceAdapter):
+    name = "lever"
+    label = "Lever"
+    host = "api.lever.co"
+    items_key = None         # Lever returns a bare array of postings
+    title_field = "text"
+
+    def url(self, board: Board) -> str:
+        return f"https://{self.host}/v0/postings/{board['slug']}"
+
+    def parse_item(self, item: Dict[str, Any], labels: TitleLabels, board: Board) -> Job:
+        categories = item.get("categories", {})
+        location = categories.get("location", "") or ""
+        team = categories.get("team", "")
+
+        return make_job(
+            "lever",
+            item.get("id", ""),
+            board.get("company", ""),
+            item.get("text", ""),
+            description=item.get("descriptionPlain", "") or item.get("description", ""),
+            location=location,
+            work_type=work_type_from_location(location),
+            url=item.get("hostedUrl", ""),
+            posted_at=None,  # Lever doesn't provide this in API
+            summary=f"Team: {team}" if team else None,
+            level=labels.level,
+            discipline=labels.discipline,
+        )
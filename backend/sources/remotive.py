@@ -0,0 +1,42 @@
+"""Remotive API (remote jobs, free, no API key).
+
+Boards are Remotive categories rather than companies.
+"""
+from typing import Any, Dict, Optional
+
+from backend.state import Job
+from backend.sources.base import Board, SourceAdapter, register_source, make_job
+from backend.titles import TitleLabels
+
+
+@register_source
+class RemotiveSource(SourceAdapter):
+    name = "remotive"
+    label = "Remotive"
+    host = "remotive.com"
+
+    def url(self, board: Board) -> str:
+        return f"https://{self.host}/api/remote-jobs"
+
+    def params(self, board: Board) -> Optional[Dict[str, Any]]:
+        return {"category": board.get("slug", "software-dev"), "limit": 50}
+
+    def parse_item(self, item: Dict[str, Any], labels: TitleLabels, board: Board) -> Job:
+        salary = item.get("salary", "")
+        tags = item.get("tags", [])
+
+        return make_job(
+            "remotive",
+            str(item.get("id", "")),
+            item.get("company_name", ""),
+            item.get("title", ""),
+            description=item.get("description", ""),
+            location=item.get("candidate_required_location", "Worldwide"),
+            work_type="remote",
+            url=item.get("url", ""),
+            posted_at=item.get("publication_date"),
+            summary=f"Salary: {salary}" if salary else None,
+            skills=tags[:10] if tags else [],  # Limit to 10 skills
+            level=labels.level,
+            discipline=labels.discipline,
+        )
@@ -1,15 +1,22 @@
 """LangGraph state definition for job search pipeline."""
-from typing import TypedDict, List, Optional, Any
+import os
+import tempfile
+from typing import Annotated, TypedDict, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 
 class Job(TypedDict, total=False):
-    """Normalized job structure from any source."""
-    source: str              # 'remotive', 'usajobs', 'greenhouse', 'lever'
+    """Normalized job structure from any source.
+
+    Fetchers produce compact ``backend.records.JobRecord`` instances with
+    these same keys; plain dicts appear when jobs are loaded from caches.
+    """
+    source: str              # Source adapter name: 'remotive', 'greenhouse', 'lever', ...
     source_id: str           # Original job ID from source
+    board: str               # Slug of the board it was fetched from
     company: str
     title: str
-    description: str
+    description: str         # Plain text, capped (backend/html_text.py)
     location: str
     work_type: str           # 'remote', 'hybrid', 'onsite'
     salary_min: Optional[int]
@@ -17,41 +24,108 @@ class Job(TypedDict, total=False):
     url: str
     posted_at: Optional[str]
     # Computed fields
-    skills: List[str]
+    skills: List[str]        # Source tags plus skills found in the description (backend/skills.py)
     summary: Optional[str]
+    level: Optional[str]     # 'principal', 'staff', 'architect', 'senior', 'lead'
+    discipline: Optional[str]  # 'frontend', 'backend', 'platform', ... (backend/titles.py)
     distance_miles: Optional[float]
     is_commutable: bool
     latitude: Optional[float]
     longitude: Optional[float]
+    # Near-duplicates merged into this job (backend/nodes/merge_jobs.py)
+    urls: Optional[List[str]]        # Every posting URL, this job's first (None = just ``url``)
+    locations: Optional[List[str]]   # Every office across the duplicates (None = just ``location``)
+    match_score: Optional[float]     # 0-100 match against the search keywords
+    snippet: str                     # Start of the description for list views (derived)
+
+
+class LogRecord(TypedDict, total=False):
+    """Structured progress or error entry (``board`` set for per-board events)."""
+    node: str
+    source: Optional[str]
+    board: Optional[str]
+    message: str
+    count: Optional[int]         # Jobs produced or kept
+    duration_ms: Optional[float]
+
+
+class TimingRecord(TypedDict, total=False):
+    """Wall time and counters of one node run or board fetch."""
+    node: str
+    source: Optional[str]
+    board: Optional[str]
+    duration_ms: float
+    count: Optional[int]         # Jobs out (same as jobs_out)
+    jobs_in: Optional[int]
+    jobs_out: Optional[int]
+    # Board fetches only (see backend/instrumentation.py)
+    status: Optional[int]
+    bytes: Optional[int]
+    retries: Optional[int]
+    parse_ms: Optional[float]
+    error: Optional[str]
+    stale: Optional[bool]        # Failed board served from its last cached jobs
+
+
+def append_records(left: Optional[list], right: Optional[list]) -> list:
+    """Append-only reducer that extends the channel's list in place.
+
+    ``operator.add`` builds a new list on every update, so hundreds of
+    per-board updates would copy the log quadratically; extending keeps the
+    total work linear. (The pipeline doesn't checkpoint state history.)
+    """
+    if left is None:
+        return list(right or [])
+    if right:
+        left.extend(right)
+    return left
+
+
+def merge_dicts(left: Optional[dict], right: Optional[dict]) -> dict:
+    """Reducer combining per-branch dict updates (later keys win)."""
+    return {**(left or {}), **(right or {})}
 
 
 class JobSearchState(TypedDict, total=False):
     """State for the job search LangGraph pipeline."""
     # Input configuration
-    sources: List[str]           # ['remotive', 'usajobs', 'greenhouse', 'lever']
+    sources: List[str]           # Registered source adapters to run (backend/sources)
     keywords: List[str]          # Search keywords
+    incremental: bool            # Only process jobs that changed since the last run
+    home_locations: List[Tuple[float, float]]  # (lat, lng) per home; nearest one wins
+    deadline: Optional[float]    # Unix time by which the run must finish (None = no limit)
 
     # Progress tracking (for streaming UI)
+    # Append-only channels: nodes (including parallel fetch branches) return
+    # only their own entries and the reducer appends them.
     current_step: str
-    steps_completed: List[str]
-    progress_messages: List[str]
+    steps_completed: Annotated[List[str], append_records]
+    logs: Annotated[List[LogRecord], append_records]
+    timings: Annotated[List[TimingRecord], append_records]
 
-    # Fetched data (raw from each source)
-    remotive_jobs: List[Job]
-    usajobs_jobs: List[Job]
-    greenhouse_jobs: List[Job]
-    lever_jobs: List[Job]
+    # Fetched data (raw from each source), keyed by source name.
+    # Each parallel fetch node adds its own key.
+    source_jobs: Annotated[Dict[str, List[Job]], merge_dicts]
+    partial_sources: Annotated[List[str], append_records]  # Boards cut off by the deadline
+    # Board keys (``source:slug``) that failed, were skipped or were cut off;
+    # their stored jobs are kept rather than reported as removed
+    failed_boards: Annotated[List[str], append_records]
 
     # Merged and processed
     all_jobs: List[Job]
     processed_jobs: List[Job]
 
+    # Incremental mode (see backend/job_store.py)
+    delta_jobs: List[Job]        # New or changed since the last run - need processing
+    unchanged_jobs: List[Job]    # Processed versions reused from the job store
+    job_diff: dict               # {"new": [...], "changed": [...], "removed": [...]} job keys
+
     # Final output
     filtered_jobs: List[Job]     # Jobs matching criteria
     top_jobs: List[Job]          # Top 10 by match score
 
     # Errors
-    errors: List[str]
+    errors: Annotated[List[LogRecord], append_records]
 
     # Metadata
     fetch_started_at: str
@@ -64,3 +138,10 @@ class JobSearchState(TypedDict, total=False):
 HOME_LAT = 37.2358
 HOME_LNG = -121.8606
 MAX_COMMUTE_MILES = 25  # Covers up to Palo Alto
+HOME_LOCATIONS = [(HOME_LAT, HOME_LNG)]
+
+# Local storage for caches (serverless functions can only write under /tmp)
+CACHE_DIR = os.environ.get(
+    "BAY_AREA_RADAR_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "bay-area-radar"),
+)
@@ -0,0 +1,167 @@
+"""Compact progress/job events for streaming the pipeline to the UI.
+
+``stream_pipeline_events`` turns LangGraph's ``astream_events`` into a small
+event schema that the dashboard (``ProgressTimeline``) consumes directly:
+
+    {"event": "progress", "type": "start", "node": ..., "message": ...}
+    {"event": "progress", "type": "complete", "node": ..., "message": ..., "jobs_count": n, "duration_ms": ...}
+    {"event": "jobs", "node": ..., "jobs": [...]}      # commutable jobs, per fetcher
+    {"event": "complete", "jobs": [...], "total_found": ..., ...}
+    {"event": "error", "message": ...}
+
+Job batches are sent as soon as each fetcher finishes, so the first jobs
+appear long before the slowest source returns. Jobs carry a ``snippet``
+instead of the full description (``backend.records.job_payload``).
+"""
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+import httpx
+
+from backend.concurrency import PIPELINE_TIME_BUDGET_SECONDS
+from backend.graph import create_job_search_graph, create_initial_state
+from backend.nodes.calculate_distance import calculate_distances_batch
+from backend.instrumentation import flush_spans
+from backend.pipeline_log import messages, timings_summary
+from backend.api_response import dumps
+from backend.records import job_payload
+from backend.sources import SOURCE_ADAPTERS
+from backend.state import Job
+
+
+NODE_MESSAGES = {
+    "merge_jobs": ("Merging and deduplicating jobs...", "Merged {count} total jobs"),
+    "score_jobs": ("Extracting skills and scoring matches...", "Scored {count} jobs"),
+    "calculate_distance": ("Calculating distances and filtering...", "{count} jobs match your criteria"),
+}
+
+FETCH_PREFIX = "fetch_"
+
+
+def fetch_source(node: str) -> Optional[str]:
+    """Source name of a generated fetch node, or None for other nodes."""
+    if node.startswith(FETCH_PREFIX) and node[len(FETCH_PREFIX):] in SOURCE_ADAPTERS:
+        return node[len(FETCH_PREFIX):]
+    return None
+
+
+def is_pipeline_node(node: str) -> bool:
+    return node in NODE_MESSAGES or fetch_source(node) is not None
+
+
+def node_message(node: str, phase: str, count: int = 0) -> str:
+    source = fetch_source(node)
+    if source:
+        label = SOURCE_ADAPTERS[source].label
+        start, end = f"Fetching jobs from {label}...", f"Found {{count}} jobs from {label}"
+    else:
+        start, end = NODE_MESSAGES.get(node, (f"Processing {node}...", f"Completed {node}"))
+    return start if phase == "start" else end.format(count=count)
+
+
+def fetched_jobs(node: str, output: dict) -> List[Job]:
+    """Jobs a fetch node wrote to the ``source_jobs`` channel."""
+    return (output.get("source_jobs") or {}).get(fetch_source(node), [])
+
+
+def node_jobs_count(node: str, output: dict) -> int:
+    if fetch_source(node):
+        return len(fetched_jobs(node, output))
+    if node == "merge_jobs":
+        return output.get("total_jobs_found", 0)
+    if node == "score_jobs":
+        return output["logs"][0].get("count", 0)
+    if node == "calculate_distance":
+        return output.get("total_jobs_filtered", 0)
+    return 0
+
+
+def node_duration_ms(output: dict) -> Optional[float]:
+    """The node's own wall time from the timing record ``timed_node`` adds."""
+    for record in output.get("timings", []):
+        if record.get("board") is None:
+            return record["duration_ms"]
+    return None
+
+
+def commutable_jobs(jobs: List[Job]) -> List[Job]:
+    """Provisional distance filter so fetcher batches match the final list.
+
+    Enriches the records in place; calculate_distance later writes the same values.
+    """
+    processed = calculate_distances_batch(jobs)
+    return [job for job in processed if job.get("is_commutable", False)]
+
+
+async def stream_pipeline_events(
+    http_client: Optional[httpx.AsyncClient] = None,
+    incremental: bool = False,
+    time_budget: Optional[float] = PIPELINE_TIME_BUDGET_SECONDS,
+) -> AsyncIterator[dict]:
+    """Run the pipeline, yielding compact events as nodes start and finish."""
+    graph = create_job_search_graph()
+    initial_state = create_initial_state(incremental, time_budget)
+    config = {"configurable": {"http_client": http_client}} if http_client else None
+
+    final_state = None
+    try:
+        async for event in graph.astream_events(initial_state, config=config, version="v2"):
+            kind = event.get("event")
+            name = event.get("name", "")
+
+            # Pipeline finished: the root run's output is the full state
+            if kind == "on_chain_end" and not event.get("parent_ids"):
+                final_state = event.get("data", {}).get("output")
+                continue
+
+            # Only graph nodes, not runnables nested inside them
+            if not is_pipeline_node(name) or event.get("metadata", {}).get("langgraph_node") != name:
+                continue
+
+            if kind == "on_chain_start":
+                yield {"event": "progress", "type": "start", "node": name,
+                       "message": node_message(name, "start")}
+
+            elif kind == "on_chain_end":
+                output = event.get("data", {}).get("output") or {}
+                count = node_jobs_count(name, output)
+                if fetch_source(name):
+                    batch = commutable_jobs(fetched_jobs(name, output))
+                    if batch:
+                        yield {"event": "jobs", "node": name, "jobs": [job_payload(job) for job in batch]}
+                yield {"event": "progress", "type": "complete", "node": name,
+                       "message": node_message(name, "end", count), "jobs_count": count,
+                       "duration_ms": node_duration_ms(output)}
+
+    except Exception as e:
+        yield {"event": "error", "message": str(e)}
+        return
+    finally:
+        flush_spans()
+
+    final_state = final_state or {}
+    yield {
+        "event": "complete",
+        "success": True,
+        "jobs": [job_payload(job) for job in final_state.get("filtered_jobs", [])],
+        "total_found": final_state.get("total_jobs_found", 0),
+        "total_filtered": final_state.get("total_jobs_filtered", 0),
+        "progress": messages(final_state.get("logs", []), include_boards=False),
+        "errors": messages(final_state.get("errors", [])),
+        "partial_sources": final_state.get("partial_sources", []),
+        "timings": timings_summary(final_state.get("timings", [])),
+        "diff": final_state.get("job_diff") or None,
+        "fetch_started_at": final_state.get("fetch_started_at"),
+        "fetch_completed_at": datetime.now().isoformat(),
+    }
+
+
+def format_sse(event: dict) -> bytes:
+    """Encode an event as a Server-Sent Events frame."""
+    data = {key: value for key, value in event.items() if key != "event"}
+    return f"event: {event['event']}\ndata: ".encode() + dumps(data) + b"\n\n"
+
+
+def format_ndjson(event: dict) -> bytes:
+    """Encode an event as one line of newline-delimited JSON."""
+    return dumps(event) + b"\n"
@@ -0,0 +1,123 @@
+"""Job title classification shared by every source adapter.
+
+All keywords are compiled once into a single regex with one named group per
+label, so classifying a title is one ``finditer`` scan. Titles repeat a lot
+across boards, so results are memoized per lowercased title.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+# Seniority levels, highest rank first; a title gets the highest one it names
+LEVEL_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "principal": (r"principal", r"distinguished"),
+    "staff": (r"staff",),
+    "architect": (r"architect",),
+    "senior": (r"senior", r"sr\b\.?", r"snr"),
+    "lead": (r"lead", r"tech lead"),
+}
+
+DISCIPLINE_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "frontend": (r"front[- ]?end", r"ui", r"web"),
+    "backend": (r"back[- ]?end", r"server[- ]?side", r"api"),
+    "fullstack": (r"full[- ]?stack",),
+    "mobile": (r"mobile", r"ios", r"android"),
+    "platform": (r"platform",),
+    "infrastructure": (r"infrastructure", r"infra", r"devops", r"sre", r"site reliability", r"cloud"),
+    "data": (r"data",),
+    "ml": (r"machine learning", r"ml", r"ai", r"deep learning"),
+    "security": (r"security",),
+}
+
+# Generic engineering words. Discipline words in ENGINEERING_DISCIPLINE_PATTERNS
+# also count ("Frontend, Payments"); vaguer ones like "web" or "data" don't.
+ENGINEERING_PATTERNS: Tuple[str, ...] = (
+    r"engineer\w*", r"developer", r"software", r"swe", r"programmer",
+)
+ENGINEERING_DISCIPLINE_PATTERNS = frozenset({
+    r"front[- ]?end", r"back[- ]?end", r"full[- ]?stack", r"platform",
+})
+
+LEVEL_RANK = {level: rank for rank, level in enumerate(LEVEL_PATTERNS)}
+
+
+class TitleLabels(NamedTuple):
+    """Structured labels for one job title."""
+    is_engineering: bool
+    level: Optional[str]         # Highest seniority named, e.g. 'staff'
+    discipline: Optional[str]    # First discipline named, e.g. 'frontend'
+
+    @property
+    def is_target(self) -> bool:
+        """Senior-or-above engineering role (what the dashboard shows)."""
+        return self.is_engineering and self.level is not None
+
+
+def _compile() -> Tuple[re.Pattern, Dict[str, Tuple[str, str]]]:
+    groups: Dict[str, Tuple[str, str]] = {}
+    alternatives: List[str] = []
+
+    def add(kind: str, label: str, patterns: Iterable[str]) -> None:
+        group = f"g{len(groups)}"
+        groups[group] = (kind, label)
+        # Longest alternatives first so "tech lead" beats "lead"
+        ordered = sorted(patterns, key=len, reverse=True)
+        alternatives.append(f"(?P<{group}>{'|'.join(ordered)})")
+
+    for level, patterns in LEVEL_PATTERNS.items():
+        add("level", level, patterns)
+    for discipline, patterns in DISCIPLINE_PATTERNS.items():
+        strong = [p for p in patterns if p in ENGINEERING_DISCIPLINE_PATTERNS]
+        weak = [p for p in patterns if p not in ENGINEERING_DISCIPLINE_PATTERNS]
+        if strong:
+            add("engineering_discipline", discipline, strong)
+        if weak:
+            add("discipline", discipline, weak)
+    add("engineering", "engineering", ENGINEERING_PATTERNS)
+
+    # Keywords must start at a word boundary; only "engineer" may run on
+    pattern = re.compile(rf"\b(?:{'|'.join(alternatives)})(?![a-z])")
+    return pattern, groups
+
+
+TITLE_PATTERN, _GROUPS = _compile()
+
+
+@lru_cache(maxsize=16384)
+def _classify_lower(title_lower: str) -> TitleLabels:
+    is_engineering = False
+    level: Optional[str] = None
+    discipline: Optional[str] = None
+
+    for match in TITLE_PATTERN.finditer(title_lower):
+        kind, label = _GROUPS[match.lastgroup]
+        if kind == "level":
+            if level is None or LEVEL_RANK[label] < LEVEL_RANK[level]:
+                level = label
+        elif kind == "engineering":
+            is_engineering = True
+        else:
+            if discipline is None:
+                discipline = label
+            if kind == "engineering_discipline":
+                is_engineering = True
+
+    return TitleLabels(is_engineering, level, discipline)
+
+
+def classify_title(title: str) -> TitleLabels:
+    """Engineering flag, seniority level and discipline of a job title."""
+    return _classify_lower(title.lower())
+
+
+def classify_titles(titles: Iterable[str]) -> List[TitleLabels]:
+    """Classify many titles, scanning each distinct title once."""
+    seen: Dict[str, TitleLabels] = {}
+    labels: List[TitleLabels] = []
+    for title in titles:
+        result = seen.get(title)
+        if result is None:
+            result = seen[title] = _classify_lower(title.lower())
+        labels.append(result)
+    return labels
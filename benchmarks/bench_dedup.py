@@ -0,0 +1,148 @@
+"""Benchmark: blocked MinHash/LSH deduplication vs naive pairwise comparison.
+
+Generates postings where each role appears one to four times (on another
+board with escaped HTML and a slightly different title, or as one req per
+office) next to same-titled roles with different descriptions, which must
+stay apart. Reports wall time, comparisons and pairwise precision/recall
+against the generated ground truth. The naive detector compares every pair
+(company + title tokens, then exact shingle Jaccard) and only runs up to
+``--naive-max`` postings; larger sizes are extrapolated quadratically.
+
+Usage:
+    python benchmarks/bench_dedup.py [--sizes 1000,10000,100000] [--naive-max 4000]
+"""
+import argparse
+import html
+import os
+import random
+import sys
+import time
+from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.nodes.merge_jobs import (
+    DUPLICATE_THRESHOLD,
+    description_words,
+    duplicate_groups,
+    normalize_company,
+    shingles,
+    title_tokens,
+)
+
+ROLES = ["Backend Engineer", "Frontend Engineer", "Platform Engineer", "Software Engineer",
+         "Data Engineer", "ML Engineer", "Infrastructure Engineer", "Mobile Engineer"]
+LEVELS = ["Senior", "Staff", "Principal", ""]
+OFFICES = ["San Francisco, CA", "San Jose, CA", "New York, NY", "Seattle, WA", "Remote", "Austin, TX"]
+VOCABULARY = ("build scale reliable services payments api data pipeline team own design review mentor "
+              "latency storage compute customers product launch distributed python go rust kubernetes "
+              "observability security growth platform mobile web ml models training infra cloud").split()
+
+
+def make_postings(count: int, seed: int = 7):
+    """``(jobs, cluster_ids)``: plain Job dicts and the role each posting belongs to."""
+    rng = random.Random(seed)
+    jobs, clusters = [], []
+    role_id = 0
+    while len(jobs) < count:
+        company = f"Company {rng.randrange(max(1, count // 25))}"
+        level, role = rng.choice(LEVELS), rng.choice(ROLES)
+        title = f"{level} {role}".strip()
+        words = [rng.choice(VOCABULARY) for _ in range(rng.randint(120, 250))]
+        description = "<p>" + " ".join(words) + "</p>"
+        copies = rng.choice([1, 1, 1, 2, 2, 3, 4])
+        for copy in range(copies):
+            if len(jobs) >= count:
+                break
+            source = "greenhouse" if copy == 0 else rng.choice(["greenhouse", "lever", "remotive"])
+            text, job_title = description, title
+            if source == "remotive":
+                text = html.escape(description) + " Apply now."
+                job_title = title.replace("Senior", "Sr.") + " (Remote)"
+            jobs.append({
+                "source": source, "source_id": f"{role_id}-{copy}", "company": company,
+                "title": job_title, "description": text, "location": rng.choice(OFFICES),
+                "url": f"https://example.com/{source}/{role_id}-{copy}",
+            })
+            clusters.append(role_id)
+        role_id += 1
+    return jobs, clusters
+
+
+def naive_groups(jobs):
+    """Compare every pair: same company and title tokens, then exact Jaccard."""
+    keys = [(normalize_company(job["company"]), title_tokens(job["title"])) for job in jobs]
+    sets = [shingles(description_words(job["description"])) for job in jobs]
+    parent = list(range(len(jobs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in combinations(range(len(jobs)), 2):
+        if keys[i] != keys[j]:
+            continue
+        union = len(sets[i] | sets[j]) or 1
+        if len(sets[i] & sets[j]) / union >= DUPLICATE_THRESHOLD:
+            parent[find(i)] = find(j)
+
+    grouped = {}
+    for i in range(len(jobs)):
+        grouped.setdefault(find(i), []).append(i)
+    return list(grouped.values())
+
+
+def duplicate_pairs(groups):
+    return {pair for group in groups if len(group) > 1 for pair in combinations(sorted(group), 2)}
+
+
+def score(groups, clusters):
+    found = duplicate_pairs(groups)
+    truth_groups = {}
+    for i, cluster in enumerate(clusters):
+        truth_groups.setdefault(cluster, []).append(i)
+    truth = duplicate_pairs(truth_groups.values())
+    hits = len(found & truth)
+    precision = hits / len(found) if found else 1.0
+    recall = hits / len(truth) if truth else 1.0
+    return precision, recall
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--naive-max", type=int, default=4000)
+    args = parser.parse_args()
+
+    naive_rate = None  # Seconds per pair, measured at the largest naive size
+    print(f"{'postings':>9} {'lsh':>9} {'naive':>12} {'speedup':>8}  {'merged':>7}  precision  recall")
+    for size in (int(s) for s in args.sizes.split(",")):
+        jobs, clusters = make_postings(size)
+
+        start = time.perf_counter()
+        groups = duplicate_groups(jobs)
+        lsh = time.perf_counter() - start
+        precision, recall = score(groups, clusters)
+
+        pairs = size * (size - 1) / 2
+        if size <= args.naive_max:
+            start = time.perf_counter()
+            naive = naive_groups(jobs)
+            naive_time = time.perf_counter() - start
+            naive_rate = naive_time / pairs
+            naive_label = f"{naive_time:10.2f}s"
+            agree = duplicate_pairs(naive) == duplicate_pairs(groups)
+        else:
+            naive_time = naive_rate * pairs if naive_rate else float("nan")
+            naive_label = f"~{naive_time:9.0f}s"
+            agree = None
+
+        print(f"{size:9d} {lsh:8.2f}s {naive_label:>12} {naive_time / lsh:7.0f}x  "
+              f"{size - len(groups):7d}  {precision:9.3f}  {recall:6.3f}"
+              + ("" if agree is None else f"  (same pairs as naive: {agree})"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Micro-benchmark: scalar vs batched distance calculation.
+
+Compares the per-job ``calculate_job_distance`` loop with
+``calculate_distances_batch`` (NumPy when installed), as used by the
+pipeline, and the raw distance kernels.
+
+Usage:
+    python benchmarks/bench_distance.py [num_jobs]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.nodes import calculate_distance
+from backend.nodes.calculate_distance import (
+    BAY_AREA_CITIES,
+    calculate_distances_batch,
+    calculate_job_distance,
+    haversine_distance,
+    nearest_home_distances,
+)
+from backend.state import HOME_LAT, HOME_LNG
+
+HOMES = [(HOME_LAT, HOME_LNG), (37.7749, -122.4194), (37.8044, -122.2712)]
+
+
+def make_jobs(count: int) -> list:
+    random.seed(42)
+    cities = [city.title() for city in BAY_AREA_CITIES] + ["New York, NY", "Austin, TX", "London"]
+    work_types = ["onsite", "onsite", "hybrid", "remote"]
+    return [
+        {
+            "source": "greenhouse",
+            "source_id": str(i),
+            "location": f"{random.choice(cities)}, CA",
+            "work_type": random.choice(work_types),
+        }
+        for i in range(count)
+    ]
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    jobs = make_jobs(count)
+    print(f"{count} jobs, {len(HOMES)} home locations, numpy={'yes' if calculate_distance.np else 'no'}")
+
+    scalar = timed(lambda: [calculate_job_distance(job.copy(), HOMES) for job in jobs])
+    batched = timed(lambda: calculate_distances_batch([job.copy() for job in jobs], HOMES))
+    print(f"scalar per-job loop:  {scalar * 1000:8.1f} ms")
+    print(f"batched:              {batched * 1000:8.1f} ms  ({scalar / batched:.1f}x)")
+
+    # Results must match the scalar path exactly
+    expected = [calculate_job_distance(job.copy(), HOMES) for job in jobs[:2000]]
+    actual = calculate_distances_batch([job.copy() for job in jobs[:2000]], HOMES)
+    assert expected == actual, "batched results differ from scalar"
+
+    # Raw distance kernel over distinct random points
+    random.seed(7)
+    points = [(random.uniform(36.5, 38.5), random.uniform(-123.0, -121.0)) for _ in range(count)]
+    kernel_scalar = timed(lambda: [
+        min(haversine_distance(h_lat, h_lng, lat, lng) for h_lat, h_lng in HOMES) for lat, lng in points
+    ])
+    kernel_batched = timed(nearest_home_distances, points, HOMES)
+    print(f"kernel scalar:        {kernel_scalar * 1000:8.1f} ms")
+    print(f"kernel batched:       {kernel_batched * 1000:8.1f} ms  ({kernel_scalar / kernel_batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark: per-job memory of Job dicts vs compact JobRecords.
+
+Builds the same jobs twice: as the plain 19-key dicts the pipeline used to
+pass around (plus the per-node ``job.copy()`` of the distance stage), and as
+``JobRecord`` instances with interned fields and shared descriptions. Reports
+bytes per job measured with tracemalloc.
+
+Usage:
+    python benchmarks/bench_job_memory.py [num_jobs]
+"""
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.records import JobRecord
+from backend.sources.base import make_job
+
+COMPANIES = ["Stripe", "Figma", "Discord", "Netflix", "Coinbase", "Airbnb", "Databricks", "Notion"]
+LOCATIONS = ["San Francisco, CA", "San Jose, CA", "Remote", "Palo Alto, CA", "New York, NY"]
+WORK_TYPES = ["onsite", "hybrid", "remote"]
+
+
+def fresh(text: str) -> str:
+    """A new string object, as JSON decoding produces for every posting."""
+    return text.encode().decode()
+
+
+def job_fields(count: int, distinct_descriptions: int) -> list:
+    random.seed(42)
+    texts = [f"<p>Role {i}: " + "build reliable systems at scale. " * 60 + "</p>"
+             for i in range(distinct_descriptions)] or [""]
+    return [
+        {
+            "source": fresh(random.choice(["greenhouse", "lever"])),
+            "source_id": str(i),
+            "company": fresh(random.choice(COMPANIES)),
+            "title": fresh("Senior Software Engineer"),
+            "description": fresh(texts[i % len(texts)]),
+            "location": fresh(random.choice(LOCATIONS)),
+            "work_type": fresh(random.choice(WORK_TYPES)),
+            "url": f"https://boards.greenhouse.io/acme/jobs/{i}",
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_job(fields: dict) -> dict:
+    """The dict make_job used to build."""
+    job = {
+        "source": "", "source_id": "", "company": "", "title": "", "description": "",
+        "location": "", "work_type": "onsite", "salary_min": None, "salary_max": None,
+        "url": "", "posted_at": None, "skills": [], "summary": None, "level": None,
+        "discipline": None, "distance_miles": None, "is_commutable": False,
+        "latitude": None, "longitude": None,
+    }
+    job.update(fields)
+    return job
+
+
+def measure(build) -> int:
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    # Unique descriptions, postings repeated across offices, and record overhead alone
+    for distinct in (count, count // 5, 0):
+        print(f"{count} jobs, {distinct} distinct descriptions")
+
+        def dicts():
+            jobs = [legacy_job(fields) for fields in job_fields(count, distinct)]
+            return jobs, [job.copy() for job in jobs]  # all_jobs + processed copies
+
+        def records():
+            jobs = [make_job(f.pop("source"), f.pop("source_id"), f.pop("company"), f.pop("title"), **f)
+                    for f in job_fields(count, distinct)]
+            return jobs, jobs  # Stages share references
+
+        legacy = measure(dicts)
+        compact = measure(records)
+        print(f"  dicts + copies:  {legacy / count:8.0f} B/job  ({legacy / 1e6:6.1f} MB)")
+        print(f"  JobRecord:       {compact / count:8.0f} B/job  ({compact / 1e6:6.1f} MB)")
+        print(f"  reduction:       {legacy / compact:8.1f}x")
+
+    record = JobRecord()
+    print(f"empty record: {sys.getsizeof(record)} B, empty dict job: {sys.getsizeof(legacy_job({}))} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark: sequential vs fan-out fetchers with mocked sources.
+
+Each source is served by an httpx mock transport with a fixed per-request
+latency, so the sequential chain should take roughly the sum of the source
+latencies and the fan-out graph roughly the slowest one.
+
+Usage:
+    python benchmarks/bench_parallel_fetch.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from langgraph.graph import StateGraph, END
+
+from backend.graph import create_job_search_graph, create_initial_state, run_job_search
+from backend.http_client import create_client
+from backend.state import JobSearchState
+from backend.nodes import (
+    fetch_remotive_node,
+    fetch_greenhouse_node,
+    fetch_lever_node,
+    merge_jobs_node,
+    calculate_distance_node,
+)
+
+# Simulated per-request latency for each upstream host (seconds)
+HOST_LATENCY = {
+    "remotive.com": 0.30,
+    "boards-api.greenhouse.io": 0.02,
+    "api.lever.co": 0.02,
+}
+
+async def mock_handler(request: httpx.Request) -> httpx.Response:
+    """Return a small canned payload after the host's simulated latency."""
+    await asyncio.sleep(HOST_LATENCY.get(request.url.host, 0.0))
+
+    if request.url.host == "remotive.com":
+        return httpx.Response(200, json={"jobs": [
+            {"id": 1, "title": "Senior Software Engineer", "company_name": "Acme"},
+        ]})
+    if request.url.host == "boards-api.greenhouse.io":
+        return httpx.Response(200, json={"jobs": [
+            {"id": 2, "title": "Staff Engineer", "location": {"name": "San Jose, CA"}},
+        ]})
+    return httpx.Response(200, json=[
+        {"id": "3", "text": "Senior Backend Engineer", "categories": {"location": "Remote"}},
+    ])
+
+
+def create_sequential_graph():
+    """The original strictly sequential wiring, kept here for comparison."""
+    graph = StateGraph(JobSearchState)
+    graph.add_node("fetch_remotive", fetch_remotive_node)
+    graph.add_node("fetch_greenhouse", fetch_greenhouse_node)
+    graph.add_node("fetch_lever", fetch_lever_node)
+    graph.add_node("merge_jobs", merge_jobs_node)
+    graph.add_node("calculate_distance", calculate_distance_node)
+    graph.set_entry_point("fetch_remotive")
+    graph.add_edge("fetch_remotive", "fetch_greenhouse")
+    graph.add_edge("fetch_greenhouse", "fetch_lever")
+    graph.add_edge("fetch_lever", "merge_jobs")
+    graph.add_edge("merge_jobs", "calculate_distance")
+    graph.add_edge("calculate_distance", END)
+    return graph.compile()
+
+
+async def time_graph(graph, client: httpx.AsyncClient) -> float:
+    start = time.perf_counter()
+    result = await graph.ainvoke(create_initial_state(), config={"configurable": {"http_client": client}})
+    elapsed = time.perf_counter() - start
+    assert result["total_jobs_found"] > 0
+    return elapsed
+
+
+async def main():
+    async with create_client(transport=httpx.MockTransport(mock_handler)) as client:
+        sequential = await time_graph(create_sequential_graph(), client)
+        parallel = await time_graph(create_job_search_graph(), client)
+        # Sanity check the public entry point under the same mock transport
+        await run_job_search(http_client=client)
+
+    from backend.concurrency import PER_HOST_CONCURRENCY
+    from backend.sources import load_boards
+
+    # Boards within a source run in waves of PER_HOST_CONCURRENCY
+    def waves(boards: int) -> int:
+        return -(-boards // PER_HOST_CONCURRENCY)
+
+    remotive = HOST_LATENCY["remotive.com"]
+    greenhouse = HOST_LATENCY["boards-api.greenhouse.io"] * waves(len(load_boards()["greenhouse"]))
+    lever = HOST_LATENCY["api.lever.co"] * waves(len(load_boards()["lever"]))
+
+    print(f"source latency: remotive={remotive:.2f}s greenhouse={greenhouse:.2f}s lever={lever:.2f}s")
+    print(f"sum of sources:     {remotive + greenhouse + lever:.2f}s")
+    print(f"slowest source:     {max(remotive, greenhouse, lever):.2f}s")
+    print(f"sequential graph:   {sequential:.2f}s")
+    print(f"fan-out graph:      {parallel:.2f}s")
+    print(f"speedup:            {sequential / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,360 @@
+"""Benchmark: the whole pipeline, offline, at several board and job counts.
+
+Every scenario runs ``run_job_search`` end to end (fan-out fetch, streaming
+parse, merge, distance) against an httpx mock transport, so results don't
+depend on the network and regressions show up run over run:
+
+- payloads are synthetic (``--description-bytes`` sets their size) or replayed
+  from recorded API responses (``--fixtures DIR`` with ``greenhouse.json``,
+  ``lever.json`` and/or ``remotive.json``; IDs are rewritten per board);
+- each request sleeps ``--latency-ms`` (+/- ``--jitter``) before answering;
+- each scenario runs in its own subprocess with a throwaway cache directory
+  and the HTTP cache disabled, so peak RSS and cold runs aren't shared.
+
+Reports wall-time percentiles over ``--runs`` (after ``--warmup``), peak RSS,
+the per-node breakdown from the ``timings`` channel and board fetch
+percentiles, and writes everything to ``--output`` as JSON. With
+``--baseline`` a previous results file is compared and the exit status is 1
+when any scenario's p50 regressed by more than ``--max-regression``.
+
+Usage:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --boards 30,300 --jobs 1000,10000 --runs 3
+    python benchmarks/bench_pipeline.py --baseline benchmarks/results/main.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(ROOT, "benchmarks", "results", "pipeline.json")
+
+# Share of boards per source in synthetic configs (remotive gets at least one)
+SOURCE_SHARE = {"greenhouse": 0.5, "lever": 0.45, "remotive": 0.05}
+
+TITLES = [
+    "Senior Software Engineer", "Staff Backend Engineer", "Software Engineer II",
+    "Principal Platform Engineer", "Senior Frontend Engineer", "Engineering Manager",
+    "Product Designer", "Account Executive", "Recruiter", "Data Analyst",
+    "Customer Success Manager", "Senior Product Manager",
+]
+LOCATIONS = [
+    "San Francisco, CA", "Remote", "San Jose, CA", "Oakland, CA / Remote",
+    "Palo Alto, CA", "Hybrid - Mountain View, CA", "New York, NY", "Austin, TX",
+    "Seattle, WA", "London, UK",
+]
+VOCABULARY = ("build scale reliable services payments api data pipeline team own design review mentor "
+              "latency storage compute customers product launch distributed python go rust kubernetes "
+              "observability security growth platform mobile web ml models training infra cloud").split()
+
+
+# --- Scenario worker (runs in a subprocess) ----------------------------------
+
+def synthetic_item(source: str, slug: str, index: int, description_bytes: int, rng: random.Random) -> dict:
+    """One posting shaped like ``source``'s API response."""
+    job_id = f"{slug}-{index}"
+    title = rng.choice(TITLES)
+    location = rng.choice(LOCATIONS)
+    # Distinct text per posting, so near-duplicate detection keeps them apart
+    words = rng.choices(VOCABULARY, k=max(1, description_bytes // 7))
+    description = f"<h2>{title}</h2><p>" + " ".join(words) + " &amp; more.</p>"
+    if source == "greenhouse":
+        return {
+            "id": job_id, "title": title, "location": {"name": location},
+            "absolute_url": f"https://boards.greenhouse.io/{slug}/jobs/{index}",
+            "updated_at": "2026-01-15T10:00:00-08:00", "content": description,
+        }
+    if source == "lever":
+        return {
+            "id": job_id, "text": title,
+            "categories": {"location": location, "team": "Engineering"},
+            "hostedUrl": f"https://jobs.lever.co/{slug}/{index}", "descriptionPlain": description,
+        }
+    return {
+        "id": job_id, "title": title, "company_name": f"Company {index % 50}",
+        "candidate_required_location": "USA", "url": f"https://remotive.com/jobs/{job_id}",
+        "publication_date": "2026-01-15T10:00:00", "description": description,
+        "tags": ["python", "aws"],
+    }
+
+
+def replayed_items(recorded: object, source: str, slug: str) -> List[dict]:
+    """Recorded postings with board-unique IDs, so boards don't dedup away."""
+    items = recorded if isinstance(recorded, list) else recorded.get("jobs", [])
+    return [dict(item, id=f"{slug}-{item.get('id', i)}") for i, item in enumerate(items)]
+
+
+def build_fixtures(scenario: dict) -> Tuple[Dict[str, list], Dict[Tuple[str, str], bytes], int]:
+    """Board config, the encoded payload of every board and the postings served."""
+    num_boards, num_jobs = scenario["boards"], scenario["jobs"]
+    rng = random.Random(scenario["seed"])
+
+    counts = {"remotive": max(1, round(num_boards * SOURCE_SHARE["remotive"]))}
+    counts["lever"] = round(num_boards * SOURCE_SHARE["lever"])
+    counts["greenhouse"] = num_boards - counts["remotive"] - counts["lever"]
+
+    recorded = {}
+    for source in counts:
+        path = os.path.join(scenario["fixtures"], f"{source}.json") if scenario["fixtures"] else None
+        if path and os.path.exists(path):
+            with open(path) as f:
+                recorded[source] = json.load(f)
+
+    per_board = max(1, math.ceil(num_jobs / num_boards))
+    boards: Dict[str, list] = {}
+    payloads: Dict[Tuple[str, str], bytes] = {}
+    served = 0
+    for source, count in counts.items():
+        boards[source] = []
+        for b in range(count):
+            slug = f"{source[:2]}{b:05d}"
+            boards[source].append({"slug": slug, "company": f"Company {slug}"})
+            if source in recorded:
+                items = replayed_items(recorded[source], source, slug)
+            else:
+                items = [synthetic_item(source, slug, i, scenario["description_bytes"], rng)
+                         for i in range(per_board)]
+            served += len(items)
+            body = items if source == "lever" else {"jobs": items}
+            payloads[source, slug] = json.dumps(body).encode()
+    return boards, payloads, served
+
+
+def mock_transport(payloads: Dict[Tuple[str, str], bytes], latency: float, jitter: float, seed: int):
+    import httpx
+
+    rng = random.Random(seed)
+    sources = {
+        "boards-api.greenhouse.io": "greenhouse",
+        "api.lever.co": "lever",
+        "remotive.com": "remotive",
+    }
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(max(0.0, latency * (1 + rng.uniform(-jitter, jitter))))
+        source = sources.get(request.url.host)
+        if source == "remotive":
+            slug = request.url.params.get("category", "")
+        elif source == "greenhouse":
+            slug = request.url.path.split("/")[3]  # /v1/boards/{slug}/jobs
+        else:
+            slug = request.url.path.rstrip("/").rsplit("/", 1)[-1]
+        body = payloads.get((source, slug))
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    return httpx.MockTransport(handler)
+
+
+def current_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024  # bytes vs KiB
+
+
+def percentiles(values: List[float]) -> dict:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)], 1)
+
+    return {"p50": pick(0.5), "p90": pick(0.9), "p99": pick(0.99), "max": round(ordered[-1], 1),
+            "mean": round(statistics.fmean(ordered), 1)}
+
+
+def run_worker(scenario: dict) -> dict:
+    """Run one scenario; environment must be set before importing the backend."""
+    workdir = tempfile.mkdtemp(prefix="bay-area-radar-bench-")
+    boards, payloads, served = build_fixtures(scenario)
+    boards_path = os.path.join(workdir, "boards.json")
+    with open(boards_path, "w") as f:
+        json.dump(boards, f)
+    os.environ.update({
+        "BAY_AREA_RADAR_BOARDS": boards_path,
+        "BAY_AREA_RADAR_CACHE_DIR": os.path.join(workdir, "cache"),
+        "BAY_AREA_RADAR_HTTP_CACHE": "0",
+    })
+    os.environ.pop("BAY_AREA_RADAR_TRACE_FILE", None)
+    sys.path.insert(0, ROOT)
+
+    from backend.graph import run_job_search
+    from backend.http_client import create_client
+
+    fixture_rss = current_rss_mb()
+    transport = mock_transport(payloads, scenario["latency_ms"] / 1000, scenario["jitter"], scenario["seed"])
+
+    async def run_all() -> List[dict]:
+        runs = []
+        async with create_client(transport=transport) as client:
+            for i in range(scenario["warmup"] + scenario["runs"]):
+                start = time.perf_counter()
+                result = await run_job_search(http_client=client)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                if i >= scenario["warmup"]:
+                    runs.append({"elapsed_ms": elapsed_ms, "result": result})
+        return runs
+
+    runs = asyncio.run(run_all())
+
+    stages: Dict[str, List[float]] = {}
+    board_ms: List[float] = []
+    for run in runs:
+        for timing in run["result"]["timings"]:
+            if timing.get("board") is None:
+                stages.setdefault(timing["node"], []).append(timing["duration_ms"])
+            else:
+                board_ms.append(timing["duration_ms"])
+
+    last = runs[-1]["result"]
+    return {
+        "latency_ms": percentiles([run["elapsed_ms"] for run in runs]),
+        "stages_ms": {node: percentiles(values) for node, values in stages.items()},
+        "board_fetch_ms": percentiles(board_ms),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "fixture_rss_mb": round(fixture_rss, 1) if fixture_rss is not None else None,
+        "payload_mb": round(sum(len(body) for body in payloads.values()) / 1e6, 1),
+        "jobs_served": served,
+        "jobs_found": last["total_jobs_found"],
+        "jobs_filtered": last["total_jobs_filtered"],
+        "errors": len(last["errors"]),
+    }
+
+
+# --- Driver ------------------------------------------------------------------
+
+def scenario_name(scenario: dict) -> str:
+    return f"boards={scenario['boards']},jobs={scenario['jobs']}"
+
+
+def run_scenario(scenario: dict) -> dict:
+    """Run ``scenario`` in a fresh interpreter and return its measurements."""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker"],
+        input=json.dumps(scenario), capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        return {"failed": completed.stderr.strip().splitlines()[-1:] or ["worker exited"]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline_path: str, max_regression: float) -> bool:
+    """Print p50 deltas against a previous results file; False on regression."""
+    with open(baseline_path) as f:
+        previous = json.load(f)
+    baseline = {s["name"]: s for s in previous["scenarios"]}
+    ok = True
+    print(f"\nvs {baseline_path} (commit {previous.get('commit') or 'unknown'}):")
+    for scenario in results["scenarios"]:
+        before = baseline.get(scenario["name"], {}).get("latency_ms", {}).get("p50")
+        after = scenario.get("latency_ms", {}).get("p50")
+        if not before or not after:
+            continue
+        change = after / before - 1
+        regressed = change > max_regression
+        ok = ok and not regressed
+        print(f"  {scenario['name']:<24} p50 {before:8.1f} -> {after:8.1f} ms  "
+              f"{change:+6.1%}{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def parse_counts(value: str) -> List[int]:
+    return [int(part.replace("_", "").replace("k", "000")) for part in value.split(",") if part]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--boards", type=parse_counts, default=[30, 300, 3000])
+    parser.add_argument("--jobs", type=parse_counts, default=[1000, 10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter", type=float, default=0.5, help="relative latency jitter")
+    parser.add_argument("--description-bytes", type=int, default=1000)
+    parser.add_argument("--fixtures", help="directory of recorded API responses")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", help="previous results file to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(json.load(sys.stdin))))
+        return 0
+
+    config = {
+        "runs": args.runs, "warmup": args.warmup, "latency_ms": args.latency_ms,
+        "jitter": args.jitter, "description_bytes": args.description_bytes,
+        "fixtures": args.fixtures, "seed": args.seed,
+    }
+    results = {
+        "benchmark": "pipeline",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "scenarios": [],
+    }
+
+    print(f"{'scenario':<24} {'p50':>8} {'p90':>8} {'p99':>8}  {'peak RSS':>9}  {'found':>7}  stages (p50 ms)")
+    for num_boards in args.boards:
+        for num_jobs in args.jobs:
+            scenario = dict(config, boards=num_boards, jobs=num_jobs)
+            measured = run_scenario(scenario)
+            results["scenarios"].append({"name": scenario_name(scenario), "boards": num_boards,
+                                         "jobs": num_jobs, **measured})
+            if "failed" in measured:
+                print(f"{scenario_name(scenario):<24} FAILED: {measured['failed'][0]}")
+                continue
+            latency = measured["latency_ms"]
+            stages = " ".join(f"{node}={values['p50']:.0f}" for node, values in measured["stages_ms"].items())
+            print(f"{scenario_name(scenario):<24} {latency['p50']:8.1f} {latency['p90']:8.1f} "
+                  f"{latency['p99']:8.1f}  {measured['peak_rss_mb']:7.1f}MB  {measured['jobs_found']:7d}  "
+                  f"{stages}" + (f"  errors={measured['errors']}" if measured["errors"] else ""))
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nresults written to {args.output}")
+
+    if args.baseline:
+        return 0 if compare(results, args.baseline, args.max_regression) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Benchmark: full ``response.json()`` parse vs streaming filter-first parse.
+
+Builds a Greenhouse-style ``content=true`` payload where most titles fail the
+filter, then compares time (best of three) and peak Python memory
+(tracemalloc) of decoding everything against ``SourceAdapter.parse_stream``.
+The second payload has raw HTML descriptions, so every quote, newline and
+non-ASCII character is a JSON escape.
+
+Usage:
+    python benchmarks/bench_stream_parse.py [num_jobs]
+"""
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.sources import get_adapter
+
+BOARD = {"slug": "bench", "company": "Bench"}
+TITLES = [
+    "Senior Software Engineer", "Account Executive", "Product Designer", "Recruiter",
+    "Staff Backend Engineer", "Customer Success Manager", "Data Scientist", "Legal Counsel",
+    "Marketing Manager", "Financial Analyst", "Office Manager", "Sales Development Rep",
+]
+
+
+def make_payload(count: int, escaped: bool = False) -> bytes:
+    random.seed(42)
+    if escaped:
+        paragraph = '<p class="intro">\n' + "We\u2019re building the \"future\" of work.\n" * 40 + "</p>\n"
+    else:
+        paragraph = "&lt;p&gt;" + "We are building the future of work. " * 40 + "&lt;/p&gt;"
+    return json.dumps({"jobs": [
+        {
+            "id": i,
+            "title": random.choice(TITLES),
+            "location": {"name": random.choice(["San Jose, CA", "Remote", "New York, NY"])},
+            "absolute_url": f"https://boards.greenhouse.io/bench/jobs/{i}",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "content": paragraph * random.randint(2, 8),
+            "departments": [{"id": 1, "name": "Engineering"}],
+        }
+        for i in range(count)
+    ]}).encode()
+
+
+async def chunked(body: bytes, size: int = 64 * 1024):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def measure(fn, runs: int = 3):
+    """Best wall time of plain runs, then peak memory of a traced run."""
+    elapsed = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    adapter = get_adapter("greenhouse")
+    for escaped in (False, True):
+        body = make_payload(count, escaped)
+        print(f"{count} jobs, payload {len(body) / 1e6:.1f} MB{' (escape-heavy)' if escaped else ''}")
+
+        full, full_time, full_peak = measure(lambda: adapter.parse(json.loads(body), BOARD))
+        streamed, stream_time, stream_peak = measure(
+            lambda: asyncio.run(adapter.parse_stream(chunked(body), BOARD))
+        )
+        assert full == streamed, "streaming parse must produce the same jobs"
+
+        print(f"  kept {len(full)} jobs")
+        print(f"  full json parse:   {full_time * 1000:8.1f} ms  peak {full_peak / 1e6:7.1f} MB")
+        print(f"  streaming parse:   {stream_time * 1000:8.1f} ms  peak {stream_peak / 1e6:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark: legacy keyword scans vs the compiled title classifier.
+
+The default corpus combines seniority prefixes, role names and team suffixes
+seen on Greenhouse/Lever boards into tens of thousands of titles (with the
+heavy repetition real boards have). Pass a file with one title per line to
+use a real export instead.
+
+Usage:
+    python benchmarks/bench_titles.py [titles.txt] [num_titles]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.titles import _classify_lower, classify_title, classify_titles
+
+LEVELS = ["", "", "Senior ", "Sr. ", "Sr ", "Staff ", "Principal ", "Lead ", "Junior ", "Associate "]
+ROLES = [
+    "Software Engineer", "Backend Engineer", "Frontend Engineer", "Front-End Engineer",
+    "Full Stack Engineer", "Full-Stack Developer", "Software Developer", "iOS Engineer",
+    "Android Engineer", "Mobile Engineer", "Platform Engineer", "Infrastructure Engineer",
+    "Site Reliability Engineer", "DevOps Engineer", "Data Engineer", "Machine Learning Engineer",
+    "ML Engineer", "Security Engineer", "Software Architect", "Solutions Architect",
+    "Engineering Manager", "Product Manager", "Product Designer", "Data Scientist",
+    "Account Executive", "Recruiter", "Technical Program Manager", "UX Researcher",
+    "Customer Success Manager", "Sales Engineer", "Support Engineer", "QA Engineer",
+    "Financial Analyst", "Marketing Manager", "Legal Counsel", "Office Manager",
+]
+SUFFIXES = [
+    "", "", "", ", Payments", ", Growth", " - Core Infrastructure", ", API Platform",
+    " (Remote)", ", Web", " II", " III", ", Developer Experience", " - Search", ", Identity",
+]
+
+
+def legacy_classify(title: str) -> bool:
+    """The per-adapter filter this replaces: two any() scans per title."""
+    engineering_keywords = ["engineer", "developer", "software", "frontend", "backend",
+                            "fullstack", "full-stack", "swe", "platform"]
+    senior_keywords = ["senior", "sr.", "sr ", "staff", "principal", "lead", "architect"]
+    title_lower = title.lower()
+    return (any(kw in title_lower for kw in engineering_keywords)
+            and any(level in title_lower for level in senior_keywords))
+
+
+def make_corpus(count: int) -> list:
+    random.seed(42)
+    return [
+        f"{random.choice(LEVELS)}{random.choice(ROLES)}{random.choice(SUFFIXES)}"
+        for _ in range(count)
+    ]
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    args = sys.argv[1:]
+    if args and os.path.exists(args[0]):
+        with open(args.pop(0)) as f:
+            titles = [line.strip() for line in f if line.strip()]
+    else:
+        titles = make_corpus(int(args[0]) if args else 50_000)
+
+    print(f"{len(titles)} titles, {len(set(titles))} distinct")
+
+    legacy = timed(lambda: [legacy_classify(title) for title in titles])
+    _classify_lower.cache_clear()
+    cold = timed(lambda: [classify_title(title) for title in titles])
+    _classify_lower.cache_clear()
+    batch = timed(lambda: classify_titles(titles))
+    warm = timed(lambda: classify_titles(titles))
+
+    print(f"legacy any() scans:       {legacy * 1000:8.1f} ms")
+    print(f"classify_title (memo):    {cold * 1000:8.1f} ms  ({legacy / cold:.1f}x)")
+    print(f"classify_titles (batch):  {batch * 1000:8.1f} ms  ({legacy / batch:.1f}x)")
+    print(f"classify_titles (warm):   {warm * 1000:8.1f} ms  ({legacy / warm:.1f}x)")
+
+    # Where the two filters disagree (word boundaries, Remotive drift, ...)
+    labels = classify_titles(titles)
+    differ = sorted({t for t, l in zip(titles, labels) if l.is_target != legacy_classify(t)})
+    print(f"filter differences:       {len(differ)} distinct titles")
+    for title in differ[:10]:
+        print(f"  {title!r}: legacy={legacy_classify(title)} new={classify_title(title).is_target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,23 +24,11 @@ import asyncio
 import json
 import sys
 sys.path.insert(0, '.')
-from backend.graph import run_job_search
+from api.jobs import compute_response
+from backend.records import to_jsonable
 
-async def main():
-    result = await run_job_search()
-    response = {
-        'success': True,
-        'jobs': result.get('filtered_jobs', []),
-        'total_found': result.get('total_jobs_found', 0),
-        'total_filtered': result.get('total_jobs_filtered', 0),
-        'progress': result.get('progress_messages', []),
-        'errors': result.get('errors', []),
-        'fetch_started_at': result.get('fetch_started_at'),
-        'fetch_completed_at': result.get('fetch_completed_at'),
-    }
-    print(json.dumps(response, default=str))
-
-asyncio.run(main())
+response = asyncio.run(compute_response(incremental=False))
+print(json.dumps(response, default=to_jsonable))
 "`,
         { timeout: 60000 } // 60 second timeout
       );
@@ -136,6 +136,7 @@ const Dashboard: React.FC = () => {
     setIsLoading(true);
     setProgressSteps([]);
     setErrors([]);
+    setJobs([]);
 
     const eventSource = new EventSource('/api/jobs/stream');
     eventSourceRef.current = eventSource;
@@ -156,6 +157,16 @@ const Dashboard: React.FC = () => {
       });
     });
 
+    // Commutable jobs arrive per source as soon as each fetcher finishes
+    eventSource.addEventListener('jobs', (event) => {
+      const data = JSON.parse(event.data);
+      setJobs((prev) => {
+        const seen = new Set(prev.map((job) => `${job.source}-${job.source_id}`));
+        const batch = (data.jobs || []).filter((job: Job) => !seen.has(`${job.source}-${job.source_id}`));
+        return batch.length ? [...prev, ...batch] : prev;
+      });
+    });
+
     eventSource.addEventListener('complete', (event) => {
       const data = JSON.parse(event.data);
       // Dedupe jobs
@@ -227,7 +238,7 @@ const Dashboard: React.FC = () => {
         const searchable = [
           job.title,
           job.company,
-          job.description,
+          job.snippet ?? job.description ?? '',
           ...job.skills,
         ].join(' ').toLowerCase();
 
@@ -7,7 +7,8 @@ export interface Job {
   source_id: string;
   company: string;
   title: string;
-  description: string;
+  description?: string;         // Full text: only with /api/search?include=description
+  snippet?: string;             // Start of the description, for list views
   location: string;
   work_type: 'remote' | 'hybrid' | 'onsite';
   salary_min: number | null;
@@ -16,10 +17,37 @@ export interface Job {
   posted_at: string | null;
   skills: string[];
   summary: string | null;
+  level?: string | null;
+  discipline?: string | null;
   distance_miles: number | null;
   is_commutable: boolean;
   latitude: number | null;
   longitude: number | null;
+  urls?: string[] | null;       // Every posting URL when duplicates were merged
+  locations?: string[] | null;  // Every office when duplicates were merged
+  match_score?: number | null;  // 0-100 match against the search keywords
+}
+
+export interface TimingRecord {
+  node: string;
+  source?: string;
+  board?: string;
+  duration_ms: number;
+  count?: number | null;
+  jobs_in?: number | null;
+  jobs_out?: number | null;
+  status?: number | null;
+  bytes?: number | null;
+  retries?: number | null;
+  parse_ms?: number | null;
+  error?: string | null;
+  stale?: boolean | null;  // Failed board served from its last cached jobs
+}
+
+export interface PipelineTimings {
+  nodes: TimingRecord[];
+  boards: TimingRecord[];  // Slowest first
+  bytes: number;
 }
 
 export interface JobsResponse {
@@ -29,10 +57,31 @@ export interface JobsResponse {
   total_filtered: number;
   progress: string[];
   errors: string[];
+  partial_sources?: string[];  // Sources with boards cut off by the time budget
+  diff?: JobDiff | null;
+  next_cursor?: string | null;  // With ?limit=: pass as ?cursor= for the next page
+  timings?: PipelineTimings;
   fetch_started_at: string;
   fetch_completed_at: string;
 }
 
+/** One page of /api/search results. */
+export interface SearchResponse {
+  success: boolean;
+  jobs: Job[];
+  total: number;
+  offset: number;
+  next_offset: number | null;
+  error?: string;
+}
+
+/** Job keys (`source:source_id`) that changed since the previous run. */
+export interface JobDiff {
+  new: string[];
+  changed: string[];
+  removed: string[];
+}
+
 export interface FilterState {
   workType: ('remote' | 'hybrid' | 'onsite')[];
   maxDistance: number;
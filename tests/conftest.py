@@ -0,0 +1,7 @@
+"""Shared test setup: caches go to a throwaway directory."""
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("BAY_AREA_RADAR_CACHE_DIR", tempfile.mkdtemp(prefix="bay-area-radar-tests-"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,134 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from api import jobs as jobs_api
+from backend.api_response import (
+    decode_cursor,
+    encode_body,
+    encode_cursor,
+    negotiate_encoding,
+    parse_fields,
+    parse_limit,
+    send_encoded,
+)
+from backend.nodes.calculate_distance import listing_order
+
+
+class FakeHandler:
+    """Records what ``send_encoded`` writes."""
+
+    def __init__(self, if_none_match=None):
+        self.headers = {"If-None-Match": if_none_match} if if_none_match else {}
+        self.status = None
+        self.sent = {}
+        self.wfile = io.BytesIO()
+
+    def send_response(self, status):
+        self.status = status
+
+    def send_header(self, name, value):
+        self.sent[name] = value
+
+    def end_headers(self):
+        pass
+
+
+@pytest.mark.parametrize("accept, available, coding", [
+    ("gzip, deflate, br", ["br", "gzip"], "br"),
+    ("gzip;q=1.0, br;q=0.5", ["br", "gzip"], "gzip"),
+    ("br", ["gzip"], None),
+    ("*", ["br", "gzip"], "br"),
+    ("gzip;q=0, identity", ["gzip"], None),
+    (None, ["br", "gzip"], None),
+])
+def test_negotiation(accept, available, coding):
+    assert negotiate_encoding(accept, available) == coding
+
+
+def test_small_bodies_are_not_compressed_and_large_ones_round_trip():
+    assert encode_body({"ok": True}, "gzip").encoding is None
+    value = {"jobs": [{"title": f"Engineer {i}"} for i in range(200)]}
+    encoded = encode_body(value, "gzip")
+    assert encoded.encoding == "gzip" and json.loads(gzip.decompress(encoded.body)) == value
+    # Same value, same bytes and ETag; the coding is part of the ETag
+    assert encode_body(value, "gzip") == encoded
+    assert encode_body(value, None).etag != encoded.etag
+
+
+def test_matching_etag_gets_304_without_body():
+    encoded = encode_body({"jobs": []})
+    handler = FakeHandler(if_none_match=f'"other", W/{encoded.etag}')
+    send_encoded(handler, encoded)
+    assert handler.status == 304 and handler.wfile.getvalue() == b""
+
+    handler = FakeHandler(if_none_match='"other"')
+    send_encoded(handler, encoded)
+    assert handler.status == 200 and handler.wfile.getvalue() == encoded.body
+    assert handler.sent["ETag"] == encoded.etag and handler.sent["Content-Length"] == str(len(encoded.body))
+
+
+def test_errors_never_get_304():
+    encoded = encode_body({"success": False})
+    handler = FakeHandler(if_none_match="*")
+    send_encoded(handler, encoded, 500)
+    assert handler.status == 500
+
+
+def test_cursor_round_trip():
+    position = [0, 3.5, "greenhouse:123"]
+    assert decode_cursor(encode_cursor(position)) == position
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor!")
+
+
+@pytest.mark.parametrize("value, limit", [(None, None), ("", None), ("1", 1), ("50", 50), ("9999", 500)])
+def test_parse_limit(value, limit):
+    assert parse_limit(value, 500) == limit
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "ten", "2.5"])
+def test_parse_limit_rejects_non_positive_or_non_integer(value):
+    with pytest.raises(ValueError):
+        parse_limit(value, 500)
+
+
+def test_parse_fields():
+    assert parse_fields(["title,company", "title"]) == ["title", "company"]
+    assert parse_fields([]) is None
+    with pytest.raises(ValueError):
+        parse_fields(["title,password"])
+
+
+def make_snapshot(count: int) -> dict:
+    jobs = [{"source": "lever", "source_id": str(i), "title": f"Job {i}",
+             "distance_miles": float(i % 4) if i % 5 else None} for i in range(count)]
+    return {"success": True, "fetch_completed_at": "2026-10-17T00:00:00", "jobs": sorted(jobs, key=listing_order)}
+
+
+def test_cursor_pages_cover_every_job_once():
+    snapshot = make_snapshot(23)
+    seen, cursor = [], None
+    while True:
+        query = {"limit": ["5"], "fields": ["source_id"], **({"cursor": [cursor]} if cursor else {})}
+        page = json.loads(jobs_api.encoded_response(snapshot, query, None).body)
+        seen += [job["source_id"] for job in page["jobs"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [job["source_id"] for job in snapshot["jobs"]]
+
+
+def test_cursor_survives_a_refreshed_snapshot():
+    snapshot = make_snapshot(10)
+    page, cursor = jobs_api.page_jobs(snapshot["jobs"], None, 4)
+    refreshed = [job for job in snapshot["jobs"] if job is not page[1]]  # A job on the first page is gone
+    rest, _ = jobs_api.page_jobs(refreshed, cursor, 100)
+    assert rest == snapshot["jobs"][4:]
+
+
+def test_jobs_limit_zero_is_rejected():
+    with pytest.raises(ValueError):
+        jobs_api.encoded_response(make_snapshot(3), {"limit": ["0"]}, None)
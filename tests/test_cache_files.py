@@ -0,0 +1,55 @@
+import json
+import os
+
+import pytest
+
+from backend.cache_files import JsonCache, write_atomic, write_json_atomic
+
+
+def test_writes_replace_the_file_and_create_its_directory(tmp_path):
+    path = str(tmp_path / "cache" / "entries.json")
+    write_json_atomic(path, {"a": 1})
+    write_json_atomic(path, {"a": 2})
+    with open(path) as f:
+        assert json.load(f) == {"a": 2}
+    assert os.listdir(tmp_path / "cache") == ["entries.json"]
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    path = str(tmp_path / "entries.json")
+    write_atomic(path, b"old")
+    with pytest.raises(TypeError):
+        write_json_atomic(path, {"a": object()})
+    with pytest.raises(TypeError):
+        write_atomic(path, "not bytes")
+    with open(path, "rb") as f:
+        assert f.read() == b"old"
+    assert os.listdir(tmp_path) == ["entries.json"]
+
+
+def test_json_cache_ignores_entries_of_another_fingerprint(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = JsonCache(path, lambda: "v1")
+    cache.put("a", [1])
+    cache.flush()
+    assert JsonCache(path, lambda: "v1").get("a") == [1]
+    assert JsonCache(path, lambda: "v2").get("a") is None
+
+
+def test_json_cache_decodes_and_prunes_to_used_entries(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = JsonCache(path, lambda: "v1")
+    for key in "abc":
+        cache.put(key, [1, 2])
+    cache.flush()
+
+    class Pairs(JsonCache):
+        def decode(self, value):
+            return tuple(value)
+
+    cache = Pairs(path, lambda: "v1", max_entries=2)
+    assert cache.get("a") == (1, 2)
+    cache.put("d", (3, 4))
+    cache.flush()
+    with open(path) as f:
+        assert json.load(f) == {"version": "v1", "entries": {"a": [1, 2], "d": [3, 4]}}
@@ -0,0 +1,30 @@
+from backend.nodes.calculate_distance import calculate_distances_batch, calculate_job_distance, listing_order
+from backend.state import MAX_COMMUTE_MILES
+
+JOBS = [
+    {"source": "lever", "source_id": "1", "location": "San Jose, CA", "work_type": "onsite"},
+    {"source": "lever", "source_id": "2", "location": "Austin, TX", "work_type": "hybrid"},
+    {"source": "lever", "source_id": "3", "location": "Anywhere", "work_type": "remote"},
+    {"source": "lever", "source_id": "4", "location": "Atlantis", "work_type": "onsite"},
+    {"source": "lever", "source_id": "5", "location": "SF / Austin, TX", "work_type": "onsite"},
+]
+
+
+def test_batch_matches_per_job_calculation():
+    expected = [calculate_job_distance(dict(job)) for job in JOBS]
+    assert calculate_distances_batch([dict(job) for job in JOBS]) == expected
+
+
+def test_commutable_flags():
+    jobs = {job["source_id"]: job for job in calculate_distances_batch([dict(job) for job in JOBS])}
+    assert jobs["1"]["is_commutable"] and jobs["1"]["distance_miles"] <= MAX_COMMUTE_MILES
+    assert not jobs["2"]["is_commutable"]
+    assert jobs["3"]["is_commutable"] and jobs["3"]["distance_miles"] == 0
+    assert jobs["4"]["distance_miles"] is None and not jobs["4"]["is_commutable"]
+    assert jobs["5"]["latitude"] > 37  # Nearest office of a multi-office posting
+
+
+def test_listing_order_puts_unknown_distances_last():
+    jobs = calculate_distances_batch([dict(job) for job in JOBS])
+    ordered = [job["source_id"] for job in sorted(jobs, key=listing_order)]
+    assert ordered[0] == "3" and ordered[-1] == "4"
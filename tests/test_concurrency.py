@@ -0,0 +1,83 @@
+import asyncio
+
+import httpx
+
+from backend.concurrency import DEADLINE_ERROR, FetchExecutor
+
+
+def fetch_after(seconds, value):
+    async def fetch():
+        await asyncio.sleep(seconds)
+        return value
+    return fetch
+
+
+def test_board_timeout_excludes_time_queued_for_a_slot():
+    executor = FetchExecutor(max_concurrency=1, per_host_concurrency=1, board_timeout=0.1)
+    calls = [(str(i), "host", fetch_after(0.04, i)) for i in range(6)]  # 0.24s queued in total
+
+    results = asyncio.run(executor.map(calls))
+
+    assert [result["error"] for result in results] == [None] * 6
+    assert [result["value"] for result in results] == list(range(6))
+
+
+def test_slow_board_times_out_on_its_own():
+    executor = FetchExecutor(board_timeout=0.05)
+    calls = [("slow", "host", fetch_after(1, "slow")), ("fast", "host", fetch_after(0, "fast"))]
+
+    slow, fast = asyncio.run(executor.map(calls))
+
+    assert slow["value"] is None and "timed out" in slow["error"]
+    assert fast["value"] == "fast"
+
+
+def test_pipeline_deadline_cancels_queued_boards():
+    async def run():
+        executor = FetchExecutor(max_concurrency=1, per_host_concurrency=1, board_timeout=1)
+        calls = [(str(i), "host", fetch_after(0.05, i)) for i in range(4)]
+        return await executor.map(calls, deadline=asyncio.get_running_loop().time() + 0.08)
+
+    results = asyncio.run(run())
+
+    assert results[0]["error"] is None
+    assert [result["error"] for result in results[2:]] == [DEADLINE_ERROR] * 2
+
+
+def test_global_and_per_host_caps_hold():
+    running = {"total": 0, "a": 0, "b": 0}
+    peaks = dict(running)
+
+    def fetch(host):
+        async def run():
+            running["total"] += 1
+            running[host] += 1
+            peaks.update({key: max(peaks[key], running[key]) for key in running})
+            await asyncio.sleep(0.01)
+            running["total"] -= 1
+            running[host] -= 1
+            return host
+        return run
+
+    executor = FetchExecutor(max_concurrency=3, per_host_concurrency=2, board_timeout=1)
+    calls = [(f"{host}{i}", host, fetch(host)) for i in range(5) for host in ("a", "b")]
+    results = asyncio.run(executor.map(calls))
+
+    assert [result["value"] for result in results] == ["a", "b"] * 5
+    assert peaks == {"total": 3, "a": 2, "b": 2}
+
+
+def test_failing_board_only_fails_itself():
+    async def unavailable():
+        request = httpx.Request("GET", "https://boards.example/down")
+        raise httpx.HTTPStatusError("503", request=request, response=httpx.Response(503, request=request))
+
+    async def broken():
+        raise ValueError("bad payload")
+
+    calls = [("down", "host", unavailable), ("broken", "host", broken), ("ok", "host", fetch_after(0, "ok"))]
+    down, bad, ok = asyncio.run(FetchExecutor().map(calls))
+
+    assert (down["value"], down["error"]) == (None, "HTTP 503")
+    assert bad["error"] == "ValueError: bad payload"
+    assert (ok["value"], ok["error"]) == ("ok", None)
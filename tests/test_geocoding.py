@@ -0,0 +1,98 @@
+import pytest
+
+from backend.geocoding import get_states, get_zip_table, match_locations
+from backend.nodes.calculate_distance import calculate_job_distance
+
+SAN_JOSE = (37.3382, -121.8863)
+
+
+@pytest.mark.parametrize("location, state", [
+    ("Fremont, OH", "oh"),
+    ("Sunnyvale, TX", "tx"),
+    ("Santa Clara, UT", "ut"),
+    ("Campbell, OH", "oh"),
+    ("Stanford, KY", "ky"),
+    ("Union City, NJ", "nj"),
+    ("Concord, NH", "nh"),
+    ("Berkeley Heights, NJ", "nj"),
+    ("Fremont, OH (Hybrid)", "oh"),
+])
+def test_other_state_qualifier_resolves_to_that_state(location, state):
+    assert match_locations(location) == [get_states()[state]]
+
+
+@pytest.mark.parametrize("location", ["San Jose, Costa Rica", "Dublin, Ireland", "Toronto, Ontario, Canada"])
+def test_foreign_qualifier_resolves_to_nothing(location):
+    assert match_locations(location) == []
+
+
+@pytest.mark.parametrize("location", ["San Jose", "San Jose, CA", "San Jose, California", "San Jose, CA, USA"])
+def test_california_or_missing_qualifier_keeps_bay_area_match(location):
+    assert match_locations(location) == [SAN_JOSE]
+
+
+def test_zip_after_state_qualifier():
+    (lat, lng), = match_locations("Palo Alto, CA 94301")
+    assert lat == pytest.approx(37.44, abs=0.01) and lng == pytest.approx(-122.14, abs=0.01)
+
+
+def test_state_name_as_place_before_its_abbreviation():
+    assert match_locations("San Francisco, CA, New York, NY")[1] == get_states()["ny"]
+
+
+def test_multi_office_string():
+    assert len(match_locations("SF / Austin, TX / Remote")) == 2
+
+
+def test_dc_centroid_is_washington():
+    lat, lng = get_states()["dc"]
+    assert lat == pytest.approx(38.90, abs=0.1) and lng == pytest.approx(-77.04, abs=0.1)
+
+
+@pytest.mark.parametrize("location", ["San Jose, Costa Rica", "Fremont, OH", "Dublin, Ireland"])
+def test_lookalike_cities_are_not_commutable(location):
+    job = calculate_job_distance({"location": location, "work_type": "onsite"})
+    assert not job["is_commutable"]
+
+
+# Coarse outline of California (generous offshore); the inland edges follow
+# the Nevada and Arizona borders
+CALIFORNIA = [
+    (42.0, -124.8), (42.0, -120.0), (39.0, -120.0), (35.0, -114.63), (34.3, -114.1),
+    (32.72, -114.5), (32.53, -117.12), (32.3, -117.4), (33.9, -121.0), (40.0, -125.0),
+]
+
+
+def in_california(lat: float, lng: float) -> bool:
+    inside = False
+    for (lat1, lng1), (lat2, lng2) in zip(CALIFORNIA, CALIFORNIA[1:] + CALIFORNIA[:1]):
+        if (lat1 > lat) != (lat2 > lat) and lng < lng1 + (lat - lat1) * (lng2 - lng1) / (lat2 - lat1):
+            inside = not inside
+    return inside
+
+
+def test_every_zip_and_city_centroid_is_in_california():
+    table = get_zip_table()
+    outside = [zip_code for zip_code, lat, lng in zip(table.zips, table.lats, table.lngs) if not in_california(lat, lng)]
+    assert outside == []
+    assert [city for city, coords in table.cities.items() if not in_california(*coords)] == []
+
+
+@pytest.mark.parametrize("location, expected", [
+    ("Los Angeles, CA", (34.05, -118.25)),
+    ("Stockton, CA", (37.96, -121.29)),
+    ("Bell Gardens, CA", (33.97, -118.15)),
+])
+def test_city_centroids_are_not_skewed_by_placeholder_zips(location, expected):
+    (lat, lng), = match_locations(location)
+    assert lat == pytest.approx(expected[0], abs=0.25) and lng == pytest.approx(expected[1], abs=0.25)
+
+
+def test_zip_without_a_centroid_is_unknown():
+    assert match_locations("90085") == []
+
+
+@pytest.mark.parametrize("state, expected", [("dc", (38.90, -77.03)), ("nj", (40.3, -74.5)), ("ca", (36.5, -119.5))])
+def test_state_centroids_are_not_pulled_toward_zero(state, expected):
+    lat, lng = get_states()[state]
+    assert lat == pytest.approx(expected[0], abs=0.4) and lng == pytest.approx(expected[1], abs=0.4)
@@ -0,0 +1,39 @@
+import html
+
+import pytest
+
+from backend.html_text import html_to_text, snippet, truncate
+
+
+@pytest.mark.parametrize("markup", [
+    "<p>Build APIs.<br>Ship often.</p><ul><li>Python</li><li>Go</li></ul>",
+    "<P>Build APIs.<BR/>Ship often.</P><UL><LI class='x'>Python</LI><Li>Go</lI></UL>",
+])
+def test_blocks_and_list_items_become_lines_in_any_case(markup):
+    assert html_to_text(markup) == "Build APIs.\nShip often.\n• Python\n• Go"
+
+
+def test_escaped_markup_is_decoded_first():
+    markup = html.escape("<p>Salary &amp; equity</p><script>track()</script><p>Remote</p>")
+    assert html_to_text(markup) == "Salary & equity\nRemote"
+
+
+def test_plain_text_passes_through():
+    assert html_to_text("  Fish & chips  \n\n  daily ") == "Fish & chips\ndaily"
+    assert html_to_text("") == "" and html_to_text(None) == ""
+
+
+@pytest.mark.parametrize("text", [
+    "Less than 5 years? Apply if 2 < 5 and pay > 100k",
+    "Salary <$200k, team size <10 > 4",
+])
+def test_angle_brackets_outside_tags_are_text(text):
+    assert html_to_text(text) == text
+    assert html_to_text(f"<p>{text}</p>") == text
+    assert html_to_text(html.escape(f"<p>{text}</p>")) == text
+
+
+def test_truncation_and_snippet():
+    assert truncate("alpha beta gamma delta", 20) == "alpha beta gamma…"
+    assert truncate("supercalifragilistic", 10) == "supercali…"
+    assert snippet("Line one\nline two", 100) == "Line one line two"
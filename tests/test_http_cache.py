@@ -0,0 +1,123 @@
+import asyncio
+import json
+import os
+
+import httpx
+import pytest
+
+from backend import http_cache
+from backend.http_cache import HttpCache, fetch_cached, fetch_cached_stream
+from backend.sources.greenhouse import GreenhouseSource
+
+URL = "https://boards.example/v1/jobs"
+
+
+class Board:
+    """Mock API answering 304 to a matching ``If-None-Match``."""
+
+    def __init__(self, payload, etag='"v1"'):
+        self.payload = payload
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(200, json=self.payload, headers={"ETag": self.etag})
+
+
+def fetch(board, cache, version="1", stream=False):
+    parsed = []
+
+    def parse(response):
+        parsed.append(response.status_code)
+        return [job["title"].upper() for job in response.json()["jobs"]]
+
+    async def parse_stream(chunks):
+        parsed.append(200)
+        return [job["title"].upper() for job in json.loads(b"".join([chunk async for chunk in chunks]))["jobs"]]
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(board)) as client:
+            if stream:
+                return await fetch_cached_stream(client, URL, parse_stream, cache=cache, version=version)
+            return await fetch_cached(client, URL, parse, cache=cache, version=version)
+
+    value, status = asyncio.run(run())
+    return value, status, parsed
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpCache(str(tmp_path / "http"))
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_304_reuses_the_parsed_value(cache, stream):
+    board = Board({"jobs": [{"title": "staff engineer"}]})
+    assert fetch(board, cache, stream=stream) == (["STAFF ENGINEER"], 200, [200])
+    assert fetch(board, cache, stream=stream) == (["STAFF ENGINEER"], 304, [])
+    assert board.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_new_parser_version_reparses_the_stored_body(cache):
+    board = Board({"jobs": [{"title": "staff engineer"}]})
+    fetch(board, cache, version="1")
+    # Still a 304 (the stored body is reused), but parsed again
+    assert fetch(board, cache, version="2") == (["STAFF ENGINEER"], 304, [200])
+    assert cache.get(URL)["version"] == "2"
+    assert fetch(board, cache, version="2") == (["STAFF ENGINEER"], 304, [])
+
+
+def test_new_parser_version_refetches_streamed_payloads(cache):
+    board = Board({"jobs": [{"title": "staff engineer"}]})
+    fetch(board, cache, version="1", stream=True)
+    assert fetch(board, cache, version="2", stream=True) == (["STAFF ENGINEER"], 200, [200])
+    assert "If-None-Match" not in board.requests[1].headers
+
+
+def test_adapter_does_not_reuse_jobs_from_an_older_parser(monkeypatch, cache):
+    monkeypatch.setattr(http_cache, "_cache", cache)
+    payload = {"jobs": [{"id": 1, "title": "Senior Backend Engineer", "content": "&lt;p&gt;New html&lt;/p&gt;",
+                         "location": {"name": "San Francisco, CA"}, "absolute_url": "https://x/1"}]}
+    board = Board(payload)
+    source = GreenhouseSource()
+    url = str(httpx.URL(source.url({"slug": "acme"}), params=source.params({"slug": "acme"})))
+    # Jobs an older parser stored, still current as far as the board's ETag goes
+    stale = {"source": "greenhouse", "source_id": "1", "title": "Senior Backend Engineer",
+             "description": "&lt;p&gt;old html&lt;/p&gt;", "level": None}
+    cache.put(url, httpx.Response(200, headers={"ETag": board.etag}), [stale], store_body=False, version="old")
+    assert source.cached_jobs({"slug": "acme"}) is None
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(board)) as client:
+            return await source.fetch(client, {"slug": "acme", "company": "Acme"})
+
+    jobs = asyncio.run(run())
+    assert [(job["description"], job["level"]) for job in jobs] == [("New html", "senior")]
+    assert source.cached_jobs({"slug": "acme"})[0]["level"] == "senior"
+
+
+def test_entries_expire_after_the_ttl(cache, monkeypatch):
+    cache.put(URL, httpx.Response(200, content=b"{}"), ["job"])
+    assert cache.get(URL)["value"] == ["job"]
+    now = http_cache.time.time()
+    monkeypatch.setattr(http_cache.time, "time", lambda: now + cache.ttl + 1)
+    assert cache.get(URL) is None
+    assert os.listdir(cache.directory) == []
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    body = httpx.Response(200, content=os.urandom(4000))
+    cache.put("a", body, None)
+    cache.put("b", body, None)
+    now = http_cache.time.time()
+    for url, age in (("a", 20), ("b", 10)):
+        os.utime(cache._paths(url)[0], (now - age, now - age))
+    cache.get("a")  # Now more recently used than b
+    cache.max_bytes = cache.total_bytes() + 2000
+    cache.put("c", body, None)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.total_bytes() <= cache.max_bytes
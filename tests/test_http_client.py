@@ -0,0 +1,63 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend import http_client
+from backend.http_client import close_client, get_client, get_http_client
+from backend.runtime import run_sync
+
+
+@pytest.fixture(autouse=True)
+def fresh_client(monkeypatch):
+    monkeypatch.setattr(http_client, "_client", None)
+    monkeypatch.setattr(http_client, "_client_loop", None)
+
+
+async def settle():
+    """Let scheduled close calls finish."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_client_is_shared_within_a_loop_and_injectable():
+    async def run():
+        shared = get_client()
+        mock = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(204)))
+        resolved = (get_client(), get_http_client(), get_http_client({"configurable": {"http_client": mock}}))
+        await mock.aclose()
+        await close_client()
+        return shared, mock, resolved
+
+    shared, mock, resolved = asyncio.run(run())
+    assert resolved == (shared, shared, mock)
+    assert shared.is_closed
+
+
+async def current_client():
+    return get_client()
+
+
+def test_client_of_a_finished_loop_is_closed_when_replaced():
+    first = asyncio.run(current_client())
+
+    async def run():
+        second = get_client()
+        await settle()
+        return second
+
+    second = asyncio.run(run())
+    assert second is not first
+    assert first.is_closed and not second.is_closed
+
+
+def test_client_of_a_running_loop_is_closed_on_that_loop():
+    first = run_sync(current_client())  # Owned by the long-lived handler loop
+
+    async def run():
+        second = get_client()
+        await asyncio.sleep(0.05)  # The close runs on the other loop's thread
+        return second
+
+    second = asyncio.run(run())
+    assert second is not first and first.is_closed
@@ -0,0 +1,64 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from backend import instrumentation
+from backend.http_cache import HttpCache, fetch_cached, fetch_cached_stream
+from backend.instrumentation import board_metrics, flush_spans, new_metrics, span
+
+BODY = json.dumps({"jobs": [{"title": "Staff Engineer"}] * 200}).encode()
+
+
+class Chunks(httpx.AsyncByteStream):
+    """Body read off the "network" in small chunks, as a real transport would."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    async def __aiter__(self):
+        for i in range(0, len(self.data), 64):
+            yield self.data[i:i + 64]
+
+
+def gzipped(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, stream=Chunks(gzip.compress(BODY)), headers={"Content-Encoding": "gzip"})
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_bytes_are_counted_on_the_wire(tmp_path, stream):
+    async def parse_stream(chunks):
+        return len(b"".join([chunk async for chunk in chunks]))
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(gzipped)) as client:
+            cache = HttpCache(str(tmp_path))
+            if stream:
+                return await fetch_cached_stream(client, "https://boards.example/jobs", parse_stream, cache=cache)
+            return await fetch_cached(client, "https://boards.example/jobs", lambda r: len(r.content), cache=cache)
+
+    with board_metrics(new_metrics()) as metrics:
+        size, status = asyncio.run(run())
+    assert (size, status) == (len(BODY), 200)
+    assert metrics["status"] == 200
+    assert metrics["bytes"] == len(gzip.compress(BODY)) < len(BODY)
+
+
+def test_spans_nest_and_flush_as_json_lines(tmp_path, monkeypatch):
+    path = tmp_path / "trace.jsonl"
+    monkeypatch.setattr(instrumentation, "TRACE_FILE", str(path))
+    with span("run_job_search", incremental=True) as root:
+        with span("fetch_board", source="lever", board="initech", skipped=None) as child:
+            child["attributes"]["status"] = 200
+        with pytest.raises(ValueError), span("merge_jobs"):
+            raise ValueError("bad")
+
+    assert flush_spans() == 3
+    child, failed, root = [json.loads(line) for line in path.read_text().splitlines()]
+    assert child["parent_span_id"] == failed["parent_span_id"] == root["span_id"]
+    assert child["trace_id"] == root["trace_id"] and root["parent_span_id"] is None
+    assert child["attributes"] == {"source": "lever", "board": "initech", "status": 200}
+    assert failed["status"] == {"code": "ERROR", "message": "ValueError: bad"}
+    assert root["end_time_unix_nano"] >= child["end_time_unix_nano"] >= child["start_time_unix_nano"]
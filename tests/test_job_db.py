@@ -0,0 +1,64 @@
+import pytest
+
+from api import search as search_api
+from backend.job_db import MAX_PAGE_SIZE, JobDatabase
+
+
+def make_job(i: int, **fields) -> dict:
+    job = {
+        "source": "greenhouse", "source_id": str(i), "company": f"Company {i % 3}",
+        "title": f"Engineer {i}", "description": "Build data pipelines." if i % 2 else "Design interfaces.",
+        "location": "San Francisco, CA", "work_type": "remote" if i % 2 else "onsite",
+        "posted_at": f"2026-01-{i + 1:02d}", "distance_miles": float(i), "is_commutable": i < 5,
+        "skills": ["Python"],
+    }
+    job.update(fields)
+    return job
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = JobDatabase(str(tmp_path / "jobs.db"))
+    db.save([make_job(i) for i in range(10)], sources=["greenhouse"], seen_at="run-1")
+    return db
+
+
+def test_filters_and_sorts(db):
+    jobs, total = db.query(work_types=["remote"], sort="distance")
+    assert total == 5
+    assert [job["source_id"] for job in jobs] == ["1", "3", "5", "7", "9"]
+    assert jobs[0]["skills"] == ["Python"] and jobs[0]["is_commutable"] is True
+
+    jobs, total = db.query(commutable=False, max_distance=7)
+    assert total == 3 and [job["source_id"] for job in jobs] == ["7", "6", "5"]  # Newest first
+
+
+def test_text_search_matches_word_prefixes(db):
+    jobs, total = db.query(text="pipe")
+    assert total == 5 and all("pipelines" in job["description"] for job in jobs)
+
+
+def test_paging_is_clamped(db):
+    jobs, total = db.query(limit=0, offset=-5, sort="distance")
+    assert total == 10 and [job["source_id"] for job in jobs] == ["0"]
+    jobs, _ = db.query(limit=MAX_PAGE_SIZE + 1)
+    assert len(jobs) == 10
+
+
+def test_unseen_jobs_of_a_fetched_source_are_deleted(db):
+    db.save([make_job(0)], sources=["greenhouse"], seen_at="run-2")
+    assert db.count() == 1
+
+
+def test_search_next_offset_follows_the_clamped_page(db, monkeypatch):
+    monkeypatch.setattr(search_api, "get_job_db", lambda: db)
+    response = search_api.search({"offset": ["-3"], "limit": ["4"]})
+    assert response["offset"] == 0 and response["next_offset"] == 4
+    response = search_api.search({"offset": ["8"], "limit": ["4"]})
+    assert len(response["jobs"]) == 2 and response["next_offset"] is None
+
+
+def test_search_rejects_a_zero_limit(db, monkeypatch):
+    monkeypatch.setattr(search_api, "get_job_db", lambda: db)
+    with pytest.raises(ValueError):
+        search_api.search({"limit": ["0"]})
@@ -0,0 +1,66 @@
+import pytest
+
+from backend.job_db import JobDatabase
+from backend.job_store import JobStore
+
+
+def make_job(source_id: str, board: str = "acme", **fields) -> dict:
+    job = {
+        "source": "greenhouse", "source_id": source_id, "board": board, "company": board.title(),
+        "title": f"Engineer {source_id}", "description": "Build data pipelines.", "location": "San Francisco, CA",
+    }
+    job.update(fields)
+    return job
+
+
+def run(store, jobs, failed_boards=()):
+    """One incremental run: diff, then save what was processed."""
+    sources = {job["source"] for job in jobs}
+    delta, unchanged, diff = store.diff(jobs, sources, failed_boards)
+    store.save(delta + unchanged, sources, failed_boards)
+    return diff
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.json"))
+    run(store, [make_job("1"), make_job("2"), make_job("3", board="globex")])
+    return store
+
+
+def test_new_changed_and_removed(store):
+    diff = run(store, [make_job("1"), make_job("2", title="Staff Engineer"), make_job("4")])
+    assert diff == {"new": ["greenhouse:4"], "changed": ["greenhouse:2"], "removed": ["greenhouse:3"]}
+    assert sorted(store.load()) == ["greenhouse:1", "greenhouse:2", "greenhouse:4"]
+
+
+def test_jobs_of_a_failed_board_are_kept(store):
+    # globex answered 503 (or was cut off by the deadline) while acme dropped job 2
+    diff = run(store, [make_job("1")], failed_boards=["greenhouse:globex"])
+    assert diff["removed"] == ["greenhouse:2"]
+    assert sorted(store.load()) == ["greenhouse:1", "greenhouse:3"]
+
+    # Back on the next run: still the same listing, not a new one
+    diff = run(store, [make_job("1"), make_job("3", board="globex")])
+    assert diff == {"new": [], "changed": [], "removed": []}
+
+
+def test_jobs_of_a_source_that_returned_nothing_are_kept(store):
+    diff = run(store, [make_job("1", source="lever")])
+    assert diff["removed"] == []
+    assert len(store.load()) == 4
+
+
+def test_unchanged_jobs_pick_up_their_board(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.json"))
+    run(store, [make_job("1", board="", company="Acme")])  # Stored before boards were tracked
+    _, unchanged, _ = store.diff([make_job("1")], {"greenhouse"})
+    assert unchanged[0]["board"] == "acme"
+
+
+def test_database_keeps_jobs_of_failed_boards(tmp_path):
+    db = JobDatabase(str(tmp_path / "jobs.db"))
+    db.save([make_job("1"), make_job("2"), make_job("3", board="globex")], sources=["greenhouse"], seen_at="run-1")
+    db.save([make_job("1")], sources=["greenhouse"], seen_at="run-2", failed_boards=["greenhouse:globex"])
+    jobs, total = db.query(sort="company")
+    assert total == 2 and [job["source_id"] for job in jobs] == ["1", "3"]
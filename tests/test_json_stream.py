@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from backend.json_stream import MIN_RETRY_CHARS, ItemStream, iter_items
+
+
+ITEMS = [
+    {"title": "Staff \"Platform\" Engineer", "content": "<p>Line\nbreak \\ café ’  </p>", "id": 1},
+    {"title": "Designer", "content": "", "id": -2.5e3, "remote": True, "team": None},
+    {"title": "ML Engineer", "tags": ["python", {"nested": [1, 2]}], "id": 12345678901234567890},
+]
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+def test_items_survive_every_chunk_boundary(size):
+    body = json.dumps({"meta": {"jobs": []}, "jobs": ITEMS, "total": 3}, ensure_ascii=False).encode()
+    assert list(iter_items(chunked(body, size), "jobs")) == ITEMS
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_top_level_array(size):
+    body = ("﻿" + json.dumps(ITEMS, indent=2)).encode()
+    assert list(iter_items(chunked(body, size), None)) == ITEMS
+
+
+def test_number_at_chunk_end_waits_for_the_rest():
+    assert list(iter_items([b"[12", b"34, 5", b"6]"])) == [1234, 56]
+
+
+def test_items_are_returned_once_complete():
+    stream = ItemStream("jobs")
+    assert stream.feed(b'{"jobs": [{"id": 1}, {"id"') == [{"id": 1}]
+    # The partial item is retried once MIN_RETRY_CHARS more text has arrived
+    assert stream.feed(b': 2}, ') == []
+    assert stream.feed(b'{"pad": "' + b"x" * MIN_RETRY_CHARS + b'"}') == [{"id": 2}, {"pad": "x" * MIN_RETRY_CHARS}]
+    assert stream.feed(b']}') == []
+    assert stream.close() == []
+
+
+def test_missing_key_yields_nothing():
+    assert list(iter_items([b'{"other": [1, 2], "count": 2}'], "jobs")) == []
+
+
+@pytest.mark.parametrize("body", [b'{"jobs": [{"id": 1}, {"id"', b'{"jobs": [1, 2', b'[1, 2'])
+def test_truncated_or_malformed_body_raises(body):
+    with pytest.raises(ValueError):
+        list(iter_items([body], "jobs" if body.startswith(b"{") else None))
+
+
+def test_wrong_root_type_raises():
+    with pytest.raises(ValueError):
+        list(iter_items([b'[{"id": 1}]'], "jobs"))
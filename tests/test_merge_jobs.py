@@ -0,0 +1,75 @@
+import asyncio
+
+from backend.nodes import merge_jobs
+from backend.nodes.merge_jobs import (
+    deduplicate_jobs,
+    merge_jobs_node,
+    merge_near_duplicates,
+    normalize_company,
+    title_tokens,
+)
+
+DESCRIPTION = (
+    "You will design and operate the payment ledger services that move billions of dollars "
+    "every year, working closely with product, finance and risk teams on correctness, latency "
+    "and reliability. We use Go, PostgreSQL and Kafka and deploy to Kubernetes on AWS. "
+) * 3
+
+
+def make_job(source: str, source_id: str, **fields) -> dict:
+    job = {
+        "source": source, "source_id": source_id, "company": "Acme", "title": "Senior Backend Engineer",
+        "description": DESCRIPTION, "location": "San Francisco, CA", "work_type": "onsite",
+        "url": f"https://{source}.example/{source_id}", "skills": ["Go"],
+    }
+    job.update(fields)
+    return job
+
+
+def test_blocking_keys_normalize_company_and_title():
+    assert normalize_company("Acme, Inc.") == normalize_company("ACME") == "acme"
+    assert title_tokens("Sr. Back-end Engineer (NYC)") == title_tokens("Senior Engineer, Backend")
+    assert title_tokens("Senior Engineer II") != title_tokens("Senior Engineer III")
+
+
+def test_exact_repeats_are_dropped():
+    jobs = [make_job("lever", "1"), make_job("lever", "1", title="changed"), make_job("greenhouse", "1")]
+    assert [(job["source"], job["title"]) for job in deduplicate_jobs(jobs)] == [
+        ("lever", "Senior Backend Engineer"), ("greenhouse", "Senior Backend Engineer"),
+    ]
+
+
+def test_cross_source_and_per_office_duplicates_merge():
+    jobs = [
+        make_job("remotive", "r1", company="Acme Inc", work_type="remote", skills=["Kafka"]),
+        make_job("lever", "l1", title="Sr. Engineer, Back End (NYC)", location="New York, NY",
+                 description="<p>" + DESCRIPTION + "</p>"),
+        make_job("greenhouse", "g1", skills=["Go", "AWS"]),
+    ]
+    merged = merge_near_duplicates(jobs)
+    assert len(merged) == 1
+    job = merged[0]
+    assert job["source"] == "greenhouse"  # Company boards win over aggregators
+    assert job["work_type"] == "remote"
+    assert job["locations"] == ["San Francisco, CA", "New York, NY"]
+    assert set(job["urls"]) == {"https://remotive.example/r1", "https://lever.example/l1", "https://greenhouse.example/g1"}
+    assert job["skills"] == ["Go", "AWS", "Kafka"]
+
+
+def test_same_title_with_different_descriptions_stays_apart():
+    other = ("Lead our mobile checkout rewrite in Swift and Kotlin, partnering with design on "
+             "accessibility and performance across iOS and Android clients. ") * 3
+    jobs = [make_job("greenhouse", "1"), make_job("greenhouse", "2", description=other),
+            make_job("greenhouse", "3", company="Globex")]
+    assert len(merge_near_duplicates(jobs)) == 3
+
+
+def test_node_merges_sources_in_a_fixed_order(monkeypatch):
+    state = {"source_jobs": {
+        "lever": [make_job("lever", "l1")],
+        "greenhouse": [make_job("greenhouse", "g1"), make_job("greenhouse", "g1")],
+    }}
+    monkeypatch.setattr(merge_jobs, "merge_near_duplicates", lambda jobs: jobs)
+    update = asyncio.run(merge_jobs_node(state))
+    assert [(job["source"], job["source_id"]) for job in update["all_jobs"]] == [("greenhouse", "g1"), ("lever", "l1")]
+    assert update["total_jobs_found"] == 2
@@ -0,0 +1,133 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend import graph, http_cache, resilience
+from backend.concurrency import DEADLINE_ERROR
+from backend.graph import create_initial_state, create_job_search_graph
+from backend.http_cache import HttpCache
+from backend.job_db import JobDatabase
+from backend.nodes import calculate_distance, fetch_source
+from backend.resilience import MAX_ATTEMPTS, BoardHealthRegistry
+from backend.streaming import stream_pipeline_events
+
+BOARDS = {"greenhouse": [
+    {"slug": "acme", "company": "Acme"},
+    {"slug": "globex", "company": "Globex"},
+    {"slug": "slowco", "company": "Slowco"},
+]}
+
+
+class Boards:
+    """Mock Greenhouse API: acme answers, globex is down, slowco hangs."""
+
+    def __init__(self):
+        self.requests = {board["slug"]: 0 for board in BOARDS["greenhouse"]}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        slug = request.url.path.split("/")[3]
+        self.requests[slug] += 1
+        if slug == "globex":
+            return httpx.Response(503)
+        if slug == "slowco":
+            await asyncio.sleep(30)
+        return httpx.Response(200, json={"jobs": [{
+            "id": 1, "title": "Senior Backend Engineer", "content": "&lt;p&gt;Build APIs in Go.&lt;/p&gt;",
+            "location": {"name": "San Jose, CA"}, "absolute_url": "https://acme.example/1",
+        }]})
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """Isolated caches and health, three boards, no backoff sleeps and a 1s fetch window."""
+    monkeypatch.setattr(fetch_source, "load_boards", lambda: BOARDS)
+    registry = BoardHealthRegistry(str(tmp_path / "health.json"))
+    monkeypatch.setattr(fetch_source, "get_board_health", lambda: registry)
+    monkeypatch.setattr(http_cache, "_cache", HttpCache(str(tmp_path / "http")))
+    database = JobDatabase(str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(calculate_distance, "get_job_db", lambda: database)
+    monkeypatch.setattr(resilience, "backoff_delay", lambda attempt: 0.0)
+    monkeypatch.setattr(fetch_source, "FETCH_RESERVE_SECONDS", 0.0)
+    return Boards()
+
+
+def run_graph(boards: Boards, time_budget: float = 1.0) -> dict:
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(boards)) as client:
+            graph = create_job_search_graph(["greenhouse"])
+            config = {"configurable": {"http_client": client}}
+            return await graph.ainvoke(create_initial_state(time_budget=time_budget), config=config)
+    return asyncio.run(run())
+
+
+def test_fetch_node_reports_failed_and_cut_off_boards(pipeline):
+    result = run_graph(pipeline)
+
+    jobs = result["source_jobs"]["greenhouse"]
+    assert [(job["board"], job["title"], job["description"]) for job in jobs] == [
+        ("acme", "Senior Backend Engineer", "Build APIs in Go."),
+    ]
+    assert pipeline.requests == {"acme": 1, "globex": MAX_ATTEMPTS, "slowco": 1}
+
+    errors = {error["board"]: error["message"] for error in result["errors"]}
+    assert set(errors) == {"globex", "slowco"}
+    assert "503" in errors["globex"] and DEADLINE_ERROR in errors["slowco"]
+    assert result["partial_sources"] == ["greenhouse"]
+    assert sorted(result["failed_boards"]) == ["greenhouse:globex", "greenhouse:slowco"]
+
+    boards = {t["board"]: t for t in result["timings"] if t.get("board") is not None}
+    assert boards["acme"]["count"] == boards["acme"]["jobs_out"] == 1
+    assert boards["acme"]["status"] == 200 and "error" not in boards["acme"]
+    assert boards["globex"]["status"] == 503 and boards["globex"]["retries"] == MAX_ATTEMPTS - 1
+    assert boards["slowco"]["error"] == DEADLINE_ERROR
+    assert all(t["source"] == "greenhouse" and t["duration_ms"] >= 0 for t in boards.values())
+    assert boards["slowco"]["duration_ms"] >= 900
+
+    nodes = {t["node"] for t in result["timings"] if t.get("board") is None}
+    assert nodes == {"fetch_greenhouse", "merge_jobs", "score_jobs", "calculate_distance"}
+    assert result["total_jobs_found"] == 1
+
+
+LEVER_POSTING = {
+    "id": "l1", "text": "Staff Frontend Engineer", "descriptionPlain": "Own our React app.",
+    "categories": {"location": "Mountain View, CA", "team": "Web"}, "hostedUrl": "https://lever.example/l1",
+}
+
+
+def test_stream_sends_each_fetchers_jobs_before_the_final_result(pipeline, monkeypatch):
+    boards = {"greenhouse": BOARDS["greenhouse"][:1], "lever": [{"slug": "initech", "company": "Initech"}]}
+    monkeypatch.setattr(fetch_source, "load_boards", lambda: boards)
+    monkeypatch.setattr(graph, "load_boards", lambda: boards)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "api.lever.co":
+            await asyncio.sleep(0.2)  # Greenhouse's batch goes out first
+            return httpx.Response(200, json=[LEVER_POSTING])
+        return await pipeline(request)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return [event async for event in stream_pipeline_events(client, time_budget=5.0)]
+
+    events = asyncio.run(run())
+    fetch_events = [
+        (event.get("type", event["event"]), event["node"]) for event in events
+        if event.get("node", "").startswith("fetch_")
+    ]
+    for node in ("fetch_greenhouse", "fetch_lever"):
+        assert [kind for kind, name in fetch_events if name == node] == ["start", "jobs", "complete"]
+    assert fetch_events.index(("jobs", "fetch_greenhouse")) < fetch_events.index(("jobs", "fetch_lever"))
+
+    batches = {event["node"]: event["jobs"] for event in events if event["event"] == "jobs"}
+    assert [job["title"] for job in batches["fetch_lever"]] == ["Staff Frontend Engineer"]
+    assert "description" not in batches["fetch_greenhouse"][0]  # Snippets only
+
+    final = events[-1]
+    assert final["event"] == "complete" and final["success"] is True
+    assert all(event["event"] != "complete" for event in events[:-1])
+    assert sorted(job["title"] for job in final["jobs"]) == ["Senior Backend Engineer", "Staff Frontend Engineer"]
+    assert final["total_found"] == 2 and final["errors"] == [] and final["partial_sources"] == []
+
+    nodes = [event["node"] for event in events if event.get("type") == "complete"]
+    assert nodes[-3:] == ["merge_jobs", "score_jobs", "calculate_distance"]
@@ -0,0 +1,50 @@
+import asyncio
+
+from backend.pipeline_log import log_record, messages, timed_node, timing_record, timings_summary
+from backend.state import append_records
+
+
+def test_append_records_extends_in_place():
+    channel = append_records(None, [1])
+    for update in ([2, 3], [], None, [4]):
+        assert append_records(channel, update) is channel
+    assert channel == [1, 2, 3, 4]
+
+
+def test_parallel_branch_updates_all_land():
+    # Two fetch branches finishing in the same step, as LangGraph applies them
+    channel = append_records(None, [log_record("fetch_lever", "Fetched 3 jobs", source="lever", count=3)])
+    append_records(channel, [log_record("fetch_greenhouse", "board 'acme': 5 jobs", source="greenhouse", board="acme")])
+    append_records(channel, [log_record("fetch_remotive", "Fetched 0 jobs", source="remotive", count=0)])
+    assert [record["node"] for record in channel] == ["fetch_lever", "fetch_greenhouse", "fetch_remotive"]
+    assert messages(channel, include_boards=False) == ["Fetched 3 jobs", "Fetched 0 jobs"]
+
+
+def test_records_omit_unset_fields():
+    assert log_record("merge_jobs", "Merged 4 jobs", count=4) == {"node": "merge_jobs", "message": "Merged 4 jobs", "count": 4}
+    assert timing_record("fetch_lever", 12.345, source="lever") == {"node": "fetch_lever", "duration_ms": 12.3, "source": "lever"}
+
+
+def test_timed_node_appends_its_timing():
+    async def node(state):
+        return {"timings": [timing_record("fetch_lever", 5.0, board="initech")], "all_jobs": [1, 2]}
+
+    wrapped = timed_node("merge_jobs", node, lambda state, update: (len(state["jobs"]), len(update["all_jobs"])))
+    update = asyncio.run(wrapped({"jobs": [1, 2, 3]}))
+    board, own = update["timings"]
+    assert board["board"] == "initech"
+    assert own["node"] == "merge_jobs" and own["duration_ms"] >= 0
+    assert (own["jobs_in"], own["jobs_out"]) == (3, 2)
+
+
+def test_timings_summary_splits_nodes_and_boards():
+    records = [
+        timing_record("fetch_lever", 80.0),
+        {**timing_record("fetch_lever", 10.0, source="lever", board="a"), "bytes": 100},
+        {**timing_record("fetch_lever", 70.0, source="lever", board="b"), "bytes": 250},
+        timing_record("merge_jobs", 2.0),
+    ]
+    summary = timings_summary(records)
+    assert [record["node"] for record in summary["nodes"]] == ["fetch_lever", "merge_jobs"]
+    assert [record["board"] for record in summary["boards"]] == ["b", "a"]  # Slowest first
+    assert summary["bytes"] == 350
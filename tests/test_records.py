@@ -0,0 +1,44 @@
+import gc
+import tracemalloc
+
+from backend.records import STORED_KEYS, JobRecord, job_payload
+
+
+def test_dict_interface_round_trip():
+    job = JobRecord.from_job({"source": "lever", "source_id": "1", "title": "Staff Engineer",
+                              "description": "Build things.", "unknown": 1})
+    assert job["title"] == "Staff Engineer" and job.get("unknown") is None
+    assert set(job.to_dict()) == set(STORED_KEYS)
+    assert job_payload(job)["snippet"] == "Build things." and "description" not in job_payload(job)
+    job["description"] = None
+    assert job.description == ""
+
+
+def test_identical_descriptions_share_one_string():
+    text = "Design APIs. " * 100
+    first = JobRecord(description=text.encode().decode())
+    second = JobRecord.from_job({"description": text.encode().decode()})
+    assert first.description is second.description
+
+
+def test_descriptions_are_released_with_their_records():
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    records = [JobRecord(source_id=str(i), description=f"posting {i} " + "x" * 10_000) for i in range(200)]
+    assert tracemalloc.get_traced_memory()[0] - baseline > 2_000_000
+    del records
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    assert retained < 200_000
+
+
+def test_released_descriptions_leave_the_pool():
+    from backend.records import _descriptions
+    text = "Unique posting body. " * 50
+    job = JobRecord(description=text)
+    assert hash(text) in _descriptions and job.description == text and isinstance(job.description, str)
+    del job
+    gc.collect()
+    assert hash(text) not in _descriptions
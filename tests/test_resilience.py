@@ -0,0 +1,139 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend import resilience
+from backend.resilience import (
+    COOLDOWN_SECONDS,
+    FAILURE_THRESHOLD,
+    MAX_ATTEMPTS,
+    MIN_ATTEMPT_TIMEOUT,
+    BoardHealthRegistry,
+    call_with_retries,
+)
+
+KEY = "greenhouse:acme"
+
+
+class Clock:
+    """Fake ``time.time`` for circuit cooldowns."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(resilience.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return BoardHealthRegistry(str(tmp_path / "health.json"))
+
+
+def status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://boards.example/acme")
+    return httpx.HTTPStatusError(str(status), request=request, response=httpx.Response(status, request=request))
+
+
+def attempts(registry, monkeypatch, failures, budget=60.0, delay=0.0):
+    """Call through ``call_with_retries``, failing with ``failures`` in turn.
+
+    Returns the result (or raised error) and the number of calls.
+    """
+    calls = []
+    monkeypatch.setattr(resilience, "backoff_delay", lambda attempt: delay)
+
+    async def call():
+        calls.append(1)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return "jobs"
+
+    async def run():
+        deadline = asyncio.get_running_loop().time() + budget
+        return await call_with_retries(call, KEY, deadline, 10.0, registry)
+
+    try:
+        result = asyncio.run(run())
+    except Exception as e:
+        result = e
+    return result, len(calls)
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_throttling_and_server_errors_are_retried(registry, monkeypatch, status):
+    result, calls = attempts(registry, monkeypatch, [status_error(status)])
+    assert (result, calls) == ("jobs", 2)
+    assert len(registry.get(KEY)["latencies"]) == 1
+
+
+def test_client_errors_are_not_retried(registry, monkeypatch):
+    result, calls = attempts(registry, monkeypatch, [status_error(404)])
+    assert isinstance(result, httpx.HTTPStatusError) and calls == 1
+
+
+def test_attempts_are_capped(registry, monkeypatch):
+    result, calls = attempts(registry, monkeypatch, [status_error(503)] * MAX_ATTEMPTS)
+    assert isinstance(result, httpx.HTTPStatusError) and calls == MAX_ATTEMPTS
+
+
+def test_no_retry_once_the_deadline_budget_runs_out(registry, monkeypatch):
+    # The backoff would leave less than a minimum attempt before the deadline
+    budget = MIN_ATTEMPT_TIMEOUT + 1.0
+    result, calls = attempts(registry, monkeypatch, [status_error(503)], budget=budget, delay=1.5)
+    assert isinstance(result, httpx.HTTPStatusError) and calls == 1
+
+
+def test_timeout_adapts_to_latency_history(registry):
+    assert registry.timeout_for(KEY, 10.0) == 10.0
+    for seconds in (0.2, 0.3, 0.25):
+        registry.record_latency(KEY, seconds)
+    assert registry.timeout_for(KEY, 10.0) == MIN_ATTEMPT_TIMEOUT
+    for seconds in (2.0, 2.5, 3.0):
+        registry.record_latency(KEY, seconds)
+    assert registry.timeout_for(KEY, 10.0) == pytest.approx(9.0)
+
+
+def test_circuit_opens_after_consecutive_failures(registry, clock):
+    for _ in range(FAILURE_THRESHOLD - 1):
+        registry.record_failure(KEY, "503")
+    assert registry.open_for(KEY) == 0
+    registry.record_failure(KEY, "503")
+    assert registry.open_for(KEY) == COOLDOWN_SECONDS
+
+    clock.now += COOLDOWN_SECONDS / 2
+    assert registry.open_for(KEY) == COOLDOWN_SECONDS / 2
+
+
+def test_trial_request_after_the_cooldown(registry, clock):
+    for _ in range(FAILURE_THRESHOLD):
+        registry.record_failure(KEY, "503")
+    clock.now += COOLDOWN_SECONDS
+    assert registry.open_for(KEY) == 0  # One trial goes through
+
+    registry.record_failure(KEY, "503")  # Trial failed: open again
+    assert registry.open_for(KEY) == COOLDOWN_SECONDS
+
+    clock.now += COOLDOWN_SECONDS
+    registry.record_success(KEY, 12)  # Trial succeeded: closed
+    registry.record_failure(KEY, "503")
+    assert registry.open_for(KEY) == 0
+    assert registry.get(KEY)["failures"] == 1
+
+
+def test_health_survives_a_restart(registry, clock):
+    registry.record_latency(KEY, 0.5)
+    for _ in range(FAILURE_THRESHOLD):
+        registry.record_failure(KEY, "503")
+    registry.save()
+    reloaded = BoardHealthRegistry(registry.path)
+    assert reloaded.open_for(KEY) == COOLDOWN_SECONDS
+    assert reloaded.get(KEY)["latencies"] == [0.5]
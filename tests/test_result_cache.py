@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from backend import result_cache
+from backend.result_cache import MemoryBackend, ResultCache
+
+
+class Pipeline:
+    """Fake compute that counts runs and finishes when released."""
+
+    def __init__(self):
+        self.runs = []
+        self.release = None
+        self.error = None
+
+    async def __call__(self, incremental: bool = True):
+        self.runs.append(incremental)
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return {"run": len(self.runs), "incremental": incremental}
+
+
+@pytest.fixture
+def pipeline():
+    return Pipeline()
+
+
+def run(pipeline, scenario):
+    async def main():
+        pipeline.release = asyncio.Event()
+        return await scenario()
+    return asyncio.run(main())
+
+
+def test_concurrent_misses_collapse_to_one_run(pipeline):
+    cache = ResultCache(pipeline, MemoryBackend())
+
+    async def scenario():
+        gets = [asyncio.ensure_future(cache.get(incremental=True)) for _ in range(5)]
+        await asyncio.sleep(0)
+        pipeline.release.set()
+        return await asyncio.gather(*gets)
+
+    results = run(pipeline, scenario)
+    assert pipeline.runs == [True]
+    assert all(value == {"run": 1, "incremental": True} and info["status"] == "miss" for value, info in results)
+
+
+def test_forced_full_run_does_not_join_an_incremental_one(pipeline):
+    cache = ResultCache(pipeline, MemoryBackend())
+
+    async def scenario():
+        incremental = asyncio.ensure_future(cache.get(incremental=True))
+        await asyncio.sleep(0)
+        full = asyncio.ensure_future(cache.get(force_refresh=True, incremental=False))
+        await asyncio.sleep(0)
+        pipeline.release.set()
+        return await incremental, await full
+
+    (incremental, _), (full, _) = run(pipeline, scenario)
+    assert pipeline.runs == [True, False]
+    assert incremental["incremental"] is True and full["incremental"] is False
+
+
+def test_stale_reads_start_one_background_refresh(pipeline, monkeypatch):
+    backend = MemoryBackend()
+    backend.save({"created_at": 1000.0, "value": "old"})
+    cache = ResultCache(pipeline, backend, ttl=60)
+    monkeypatch.setattr(result_cache.time, "time", lambda: 1000.0 + 61)
+
+    async def scenario():
+        reads = [await cache.get(incremental=True) for _ in range(3)]
+        await cache.revalidate(incremental=True)
+        await asyncio.sleep(0)
+        assert pipeline.runs == [True]
+        pipeline.release.set()
+        await cache.refresh(incremental=True)  # Joins the background run
+        return reads
+
+    reads = run(pipeline, scenario)
+    assert [value for value, _ in reads] == ["old"] * 3
+    assert all(info["status"] == "stale" and info["refreshing"] for _, info in reads)
+    assert pipeline.runs == [True]
+    assert backend.load()["value"] == {"run": 1, "incremental": True}
+
+
+def test_failed_refresh_keeps_the_snapshot_and_sets_last_error(pipeline, monkeypatch):
+    backend = MemoryBackend()
+    backend.save({"created_at": 1000.0, "value": "old"})
+    cache = ResultCache(pipeline, backend, ttl=60)
+    monkeypatch.setattr(result_cache.time, "time", lambda: 1000.0 + 61)
+    pipeline.error = RuntimeError("board timed out")
+
+    async def scenario():
+        await cache.get(incremental=True)
+        pipeline.release.set()
+        await asyncio.sleep(0.01)
+        return await cache.get(incremental=True)
+
+    value, info = run(pipeline, scenario)
+    assert cache.last_error == "Refresh failed: board timed out"
+    assert value == "old" and info["last_error"] == cache.last_error
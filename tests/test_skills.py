@@ -0,0 +1,39 @@
+import pytest
+
+from backend.skills import extract_skills, match_score, merge_skills
+
+
+@pytest.mark.parametrize("text, skills", [
+    ("Python, Go and PostgreSQL on Kubernetes (k8s)", ["Python", "Go", "PostgreSQL", "Kubernetes"]),
+    ("C++ and C# with ASP.NET Core; some .NET", ["C++", "C#"]),
+    ("React Native and React.js, ReactJS", ["React Native", "React"]),
+    ("Swift and SwiftUI on iOS", ["Swift"]),
+    ("Build with React and swiftui", ["React", "Swift"]),
+    ("Python-based tooling, node.js services", ["Python", "Node.js"]),
+    ("Ruby on Rails or Rails APIs; Spark and PySpark jobs", ["Ruby", "Spark"]),
+    ("Rust and apache spark; services in Go to start", ["Rust", "Spark"]),
+])
+def test_named_skills_are_found_in_order(text, skills):
+    assert extract_skills(text) == skills
+
+
+@pytest.mark.parametrize("text", [
+    "We react quickly to incidents with swift decisions.",
+    "Own our Go-to-market motion; let's go.",
+    "Go to market with our sales team.",
+    "We spark creativity and put guard rails for models in place.",
+    "Rust-free coatings for rust-free hardware.",
+    "Experience with javascript.info is a plus? No: javascripts, pythonic, reactor, swiftly.",
+])
+def test_ordinary_words_are_not_skills(text):
+    assert extract_skills(text) == []
+
+
+def test_match_score_counts_title_fully_and_skills_half():
+    assert match_score("Senior React Engineer", ["React", "Go"], ["react", "golang"]) == 100.0 * 1.5 / 2
+    assert match_score("Backend Engineer", ["Go", "Swift"], ["go", "swift", "rust"]) == round(100 / 3, 1)
+    assert match_score("Anything", [], []) == 0.0
+
+
+def test_merge_skills_keeps_tags_first_without_duplicates():
+    assert merge_skills(["python", "AWS"], ["Python", "Kafka"]) == ["python", "AWS", "Kafka"]
@@ -0,0 +1,115 @@
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from api import jobs as jobs_api
+from backend import snapshot_store
+from backend.result_cache import ResultCache
+from backend.runtime import run_sync
+from backend.snapshot_store import KEEP_VERSIONS, MANIFEST_NAME, SnapshotStore
+
+
+def response(n: int) -> dict:
+    return {"success": True, "jobs": [{"title": f"Engineer {i}"} for i in range(n)]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path / "snapshots"))
+
+
+def test_saved_snapshot_round_trips(store):
+    store.save({"created_at": 1000.0, "value": response(2)})
+    assert store.load() == {"created_at": 1000.0, "value": response(2)}
+    manifest = store.manifest()
+    assert manifest["version"].startswith(f"{snapshot_store.SNAPSHOT_FORMAT}-")
+    assert manifest["sizes"]["identity"] == len(store.encoded(None)[1].body)
+
+
+def test_manifest_is_swapped_in_after_the_bodies(store, monkeypatch):
+    store.save({"created_at": 1000.0, "value": response(1)})
+    written = []
+
+    def write_atomic(path, data):
+        if path.endswith(MANIFEST_NAME):
+            raise OSError("disk full")
+        written.append(os.path.basename(path))
+        with open(path, "wb") as f:
+            f.write(data)
+
+    monkeypatch.setattr(snapshot_store, "write_atomic", write_atomic)
+    with pytest.raises(OSError):
+        store.save({"created_at": 2000.0, "value": response(2)})
+
+    # The new bodies exist, but readers still get the complete old version
+    assert written and all(os.path.exists(store._path(name)) for name in written)
+    assert SnapshotStore(store.directory).load() == {"created_at": 1000.0, "value": response(1)}
+
+
+@pytest.mark.parametrize("accept, encoding", [(None, None), ("gzip", "gzip"), ("gzip, br", "br")])
+def test_each_coding_has_its_own_etag(store, accept, encoding):
+    if encoding == "br" and snapshot_store.brotli is None:
+        pytest.skip("brotli not installed")
+    store.save({"created_at": 1000.0, "value": response(3)})
+    manifest, encoded = store.encoded(accept)
+    assert encoded.encoding == encoding
+    assert encoded.etag == manifest["etags"][encoding or "identity"]
+    assert len(set(manifest["etags"].values())) == len(manifest["etags"])
+    if encoding == "gzip":
+        assert json.loads(gzip.decompress(encoded.body)) == response(3)
+
+
+def test_old_versions_are_pruned(store):
+    versions = []
+    for n in range(KEEP_VERSIONS + 2):
+        store.save({"created_at": 1000.0 + n, "value": response(n)})
+        version = store.manifest()["version"]
+        versions.append(version)
+        # Distinct mtimes, oldest first, regardless of filesystem resolution
+        for name in os.listdir(store.directory):
+            if name.startswith(version):
+                os.utime(store._path(name), (1000 + n, 1000 + n))
+
+    remaining = {name.split(".json", 1)[0] for name in os.listdir(store.directory) if name != MANIFEST_NAME}
+    assert remaining == set(versions[-KEEP_VERSIONS:])
+
+
+@pytest.fixture
+def jobs_cache(store, monkeypatch):
+    async def compute(incremental=True):
+        return response(5)
+
+    cache = ResultCache(compute, store, ttl=60)
+    monkeypatch.setattr(jobs_api, "result_cache", cache)
+    return cache
+
+
+def test_static_response_serves_the_stored_snapshot(store, jobs_cache):
+    store.save({"created_at": time.time() - 5, "value": response(1)})
+    encoded, headers = jobs_api.static_response("gzip")
+    assert json.loads(gzip.decompress(encoded.body)) == response(1)
+    assert dict(headers)["X-Cache"] == "HIT"
+    assert dict(headers)["X-Snapshot-Version"] == store.manifest()["version"]
+
+
+def test_static_response_defers_to_a_newer_in_memory_snapshot(store, jobs_cache):
+    store.save({"created_at": time.time() - 5, "value": response(1)})
+    jobs_cache._snapshot = {"created_at": time.time(), "value": response(2)}  # Newer, but not stored
+    assert jobs_api.static_response("gzip") is None
+
+
+def test_static_response_revalidates_a_stale_snapshot(store, jobs_cache):
+    store.save({"created_at": time.time() - 120, "value": response(1)})
+    encoded, headers = jobs_api.static_response(None)
+    assert json.loads(encoded.body) == response(1)
+    assert dict(headers)["X-Cache"] == "STALE" and dict(headers)["X-Cache-Refreshing"] == "1"
+
+    run_sync(jobs_cache.refresh(incremental=True))  # Joins the background run
+    assert store.load()["value"] == response(5)
+
+
+def test_static_response_without_a_snapshot(jobs_cache):
+    assert jobs_api.static_response(None) is None
@@ -0,0 +1,39 @@
+import pytest
+
+from backend.titles import TitleLabels, classify_title, classify_titles
+
+
+@pytest.mark.parametrize("title, labels", [
+    ("Senior Software Engineer", TitleLabels(True, "senior", None)),
+    ("Sr. Backend Engineer (NYC)", TitleLabels(True, "senior", "backend")),
+    ("Staff Engineer, Machine Learning", TitleLabels(True, "staff", "ml")),
+    ("Principal / Staff Platform Engineer", TitleLabels(True, "principal", "platform")),
+    ("Tech Lead, Frontend", TitleLabels(True, "lead", "frontend")),
+    ("Senior Full-Stack", TitleLabels(True, "senior", "fullstack")),
+    ("Senior Data Analyst", TitleLabels(False, "senior", "data")),
+    ("Software Engineer II", TitleLabels(True, None, None)),
+    ("Engineering Manager, Infrastructure", TitleLabels(True, None, "infrastructure")),
+])
+def test_classify_title(title, labels):
+    assert classify_title(title) == labels
+
+
+@pytest.mark.parametrize("title", [
+    "Senior Account Executive",      # Not engineering
+    "Software Engineer",             # No seniority
+    "Staffing Coordinator",          # "staff" must be a whole word
+    "Misleading Sales Lead",         # Level but not engineering
+    "Lead Generation Specialist",
+])
+def test_non_targets(title):
+    assert not classify_title(title).is_target
+
+
+def test_targets_are_senior_engineering_roles():
+    assert classify_title("Staff Site Reliability Engineer").is_target
+    assert classify_title("SENIOR ANDROID ENGINEER") == classify_title("senior android engineer")
+
+
+def test_classify_titles_matches_classify_title():
+    titles = ["Senior Engineer", "Designer", "Senior Engineer", "Staff SWE"]
+    assert classify_titles(titles) == [classify_title(title) for title in titles]